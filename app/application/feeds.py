@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from app.domain.models.feed import FeedDocument
+from app.domain.models.feed import FeedKind
+from app.domain.repositories.post import PostRepository
+
+
+class FeedStore(Protocol):
+    """
+    Pre-rendered feeds of the published posts.
+
+    ``posts`` is only read when the stored documents are out of date.
+    """
+
+    def document(self, kind: FeedKind, posts: PostRepository) -> FeedDocument: ...
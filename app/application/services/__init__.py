@@ -1,6 +1,23 @@
+from collections.abc import AsyncIterator
 from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+T = TypeVar("T")
 
 
 class Service:
     def execute(self, *args: Any, **kwargs: Any) -> Any:
         raise NotImplementedError
+
+
+class AsyncService:
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+
+class AsyncStreamService(Generic[T]):
+    """A use case whose result is iterated, a chunk of items at a time."""
+
+    def execute(self, *args: Any, **kwargs: Any) -> AsyncIterator[list[T]]:
+        raise NotImplementedError
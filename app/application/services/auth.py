@@ -2,22 +2,132 @@ from __future__ import annotations
 
 from datetime import timedelta
 
+from app.application.services import AsyncService
 from app.application.services import Service
+from app.application.uow import UnitOfWork
+from app.domain.models.user import TokenPair
+from app.domain.models.user import UserIdentity
+from app.domain.models.user import UserModel
 from app.domain.repositories.user import UserRepository
 from app.infrastructure.auth import JWTService
+from app.infrastructure.auth.passwords import PasswordHasher
 
 
-class LoginUser(Service):
+class GetUserByUsername(Service):
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
 
-    def execute(self, username: str, password: str) -> str | None:
-        user = self.user_repository.get_by_username(username)
-        if not user or not user.verify_password(password):
+    def execute(self, username: str) -> UserModel | None:
+        return self.user_repository.get_by_username(username)
+
+
+class RehashPassword(Service):
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(self, username: str, hashed_password: str) -> None:
+        with self.uow:
+            user = self.uow.users.get_by_username(username)
+            if user is None:
+                return
+            user.rehash_password(hashed_password)
+            self.uow.users.save(user)
+            self.uow.commit()
+
+
+class LoginUser(AsyncService):
+    """
+    The password is checked on the hasher's workers, not on the event loop
+    nor on the request's thread. ``get_user`` must have ended its
+    transaction when it returns, so that no database connection is held
+    while the hash is computed. A hash the hasher reports as outdated is
+    replaced, in a transaction of its own, by one of the current cost once
+    the password has matched.
+    """
+
+    def __init__(
+        self,
+        get_user: AsyncService,
+        rehash_password: AsyncService,
+        passwords: PasswordHasher,
+    ):
+        self.get_user = get_user
+        self.rehash_password = rehash_password
+        self.passwords = passwords
+
+    async def execute(self, username: str, password: str) -> TokenPair | None:
+        user: UserModel | None = await self.get_user.execute(username)
+        verified, new_hash = await self.passwords.verify_and_update_async(
+            password, user.hashed_password if user else None
+        )
+        if not user or not verified:
             return None
+        if new_hash is not None:
+            await self.rehash_password.execute(user.username, new_hash)
+
+        return issue_tokens(user.identity())
+
+
+class RefreshTokens(Service):
+    """
+    Exchange a refresh token for a new access token and a new refresh token.
+
+    The refresh token is revoked in the same transaction, so each one is
+    exchanged once: presenting it again, be it a replay or a client racing
+    itself, is refused.
+    """
 
-        token = JWTService.create_access_token(
-            data={"sub": user.username},
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(self, refresh_token: str) -> TokenPair | None:
+        payload = JWTService.verify_token(refresh_token, expected_type="refresh")
+        if not payload:
+            return None
+        claimed = UserIdentity.from_claims(payload)
+        if claimed is None:
+            return None
+
+        with self.uow:
+            user = self.uow.users.get_identity(claimed.id)
+            if user is None or user.token_version != claimed.token_version:
+                return None
+            if not self.uow.revoked_tokens.revoke(
+                JWTService.token_id(refresh_token, payload),
+                JWTService.expires_at(payload),
+            ):
+                return None
+            self.uow.commit()
+        return issue_tokens(user)
+
+
+class RevokeTokens(Service):
+    """Revoke an access token and, if given, a refresh token (logout)."""
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(self, access_token: str, refresh_token: str | None = None) -> None:
+        tokens = [(access_token, "access"), (refresh_token, "refresh")]
+        with self.uow:
+            for token, token_type in tokens:
+                if token is None:
+                    continue
+                payload = JWTService.verify_token(token, expected_type=token_type)
+                if payload:
+                    self.uow.revoked_tokens.revoke(
+                        JWTService.token_id(token, payload),
+                        JWTService.expires_at(payload),
+                    )
+            self.uow.commit()
+
+
+def issue_tokens(identity: UserIdentity) -> TokenPair:
+    claims = identity.claims()
+    return TokenPair(
+        access_token=JWTService.create_access_token(
+            data=claims,
             expires_delta=timedelta(minutes=30),
-        )
-        return token
+        ),
+        refresh_token=JWTService.create_refresh_token(data=claims),
+    )
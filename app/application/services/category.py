@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+
 from app.application.services import Service
+from app.application.uow import UnitOfWork
 from app.domain.models.category import CategoryModel
+from app.domain.models.page import DEFAULT_PAGE_LIMIT
+from app.domain.models.page import Page
+from app.domain.repositories.category import ALL_CATEGORY_FIELDS
+from app.domain.repositories.category import CategoryField
 from app.domain.repositories.category import CategoryRepository
 
 
 class CreateCategory(Service):
-    def __init__(self, repo: CategoryRepository):
-        self.repo = repo
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
     def execute(
         self, name: str, slug: str, description: str | None = None
     ) -> CategoryModel:
         category = CategoryModel(id=None, name=name, slug=slug, description=description)
-        return self.repo.save(category)
+        with self.uow:
+            created = self.uow.categories.save(category)
+            self.uow.commit()
+        return created
 
 
 class GetCategoryBySlug(Service):
@@ -28,16 +38,25 @@ class ListCategories(Service):
     def __init__(self, repo: CategoryRepository):
         self.repo = repo
 
-    def execute(self) -> list[CategoryModel]:
-        return self.repo.get_all()
+    def execute(
+        self,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        fields: Collection[CategoryField] = ALL_CATEGORY_FIELDS,
+    ) -> Page[CategoryModel]:
+        return self.repo.get_page(limit, cursor, fields)
 
 
 class GetCategoryById(Service):
     def __init__(self, repo: CategoryRepository):
         self.repo = repo
 
-    def execute(self, category_id: int) -> CategoryModel | None:
-        return self.repo.get_by_id(category_id)
+    def execute(
+        self,
+        category_id: int,
+        fields: Collection[CategoryField] = ALL_CATEGORY_FIELDS,
+    ) -> CategoryModel | None:
+        return self.repo.get_by_id(category_id, fields)
 
 
 class UpdateCategory(Service):
@@ -49,8 +68,10 @@ class UpdateCategory(Service):
 
 
 class DeleteCategory(Service):
-    def __init__(self, repo: CategoryRepository):
-        self.repo = repo
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
     def execute(self, category_id: int) -> None:
-        self.repo.delete(category_id)
+        with self.uow:
+            self.uow.categories.delete(category_id)
+            self.uow.commit()
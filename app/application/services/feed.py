@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from app.application.feeds import FeedStore
+from app.application.services import Service
+from app.domain.models.feed import FeedDocument
+from app.domain.models.feed import FeedKind
+from app.domain.repositories.post import PostRepository
+
+
+class GetFeed(Service):
+    def __init__(self, repo: PostRepository, feeds: FeedStore):
+        self.repo = repo
+        self.feeds = feeds
+
+    def execute(self, kind: FeedKind) -> FeedDocument:
+        return self.feeds.document(kind, self.repo)
@@ -1,58 +1,353 @@
 from __future__ import annotations
 
+import json
+from collections.abc import Collection
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
 from app.application.services import Service
+from app.application.uow import UnitOfWork
+from app.domain.models.category import CategoryModel
+from app.domain.models.page import DEFAULT_PAGE_LIMIT
+from app.domain.models.page import Page
+from app.domain.models.post import ImportReport
+from app.domain.models.post import PostContent
+from app.domain.models.post import PostFilter
 from app.domain.models.post import PostModel
+from app.domain.models.post import PostSearchHit
+from app.domain.models.post import PostSummary
+from app.domain.models.post import RenderedContent
+from app.domain.models.post import RowError
+from app.domain.models.tag import TagModel
+from app.domain.models.version import Version
+from app.domain.repositories.post import ALL_POST_FIELDS
+from app.domain.repositories.post import ALL_POST_RELATIONS
+from app.domain.repositories.post import PostField
+from app.domain.repositories.post import PostRelation
 from app.domain.repositories.post import PostRepository
+from app.infrastructure.content.markdown import render
+from app.infrastructure.content.markdown import RENDER_VERSION
+
+DEFAULT_IMPORT_BATCH_SIZE = 1000
+DEFAULT_EXPORT_BATCH_SIZE = 500
+POST_STATUSES = ("draft", "published")
 
 
 class CreatePost(Service):
-    def __init__(self, repo: PostRepository):
-        self.repo = repo
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
-    def execute(self, title: str, content: str) -> PostModel:
+    def execute(
+        self,
+        title: str,
+        content: str,
+        tags: Sequence[str] = (),
+        category: str | None = None,
+        rendered: RenderedContent | None = None,
+    ) -> PostModel:
+        """
+        Tags and the category are referenced by slug. Unknown tags are created;
+        an unknown category is rejected. ``rendered`` is ``content`` already
+        rendered by the caller; otherwise it is rendered here.
+        """
         post = PostModel(
             id=None,
             title=title,
             content=content,
+            category=(
+                CategoryModel(id=None, name=category, slug=category)
+                if category
+                else None
+            ),
+            tags=[TagModel(id=None, name=t, slug=t) for t in dict.fromkeys(tags)],
+            rendered=rendered or render(content),
         )
-        return self.repo.save(post)
+        with self.uow:
+            created = self.uow.posts.save(post)
+            self.uow.commit()
+        return created
 
 
 class GetPostBySlug(Service):
     def __init__(self, repo: PostRepository):
         self.repo = repo
 
-    def execute(self, slug: str) -> PostModel | None:
-        return self.repo.get_by_slug(slug)
+    def execute(
+        self,
+        slug: str,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> PostModel | None:
+        return self.repo.get_by_slug(slug, include, fields)
 
 
 class ListPosts(Service):
     def __init__(self, repo: PostRepository):
         self.repo = repo
 
-    def execute(self) -> list[PostModel]:
-        return self.repo.get_all()
+    def execute(
+        self,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        filters: PostFilter | None = None,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> Page[PostModel]:
+        return self.repo.get_page(limit, cursor, include, filters, fields)
+
+
+class ListPostSummaries(Service):
+    def __init__(self, repo: PostRepository):
+        self.repo = repo
+
+    def execute(
+        self,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        filters: PostFilter | None = None,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+    ) -> Page[PostSummary]:
+        return self.repo.get_summary_page(limit, cursor, include, filters)
+
+
+class SearchPosts(Service):
+    def __init__(self, repo: PostRepository):
+        self.repo = repo
+
+    def execute(
+        self,
+        query: str,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> Page[PostSearchHit]:
+        return self.repo.search(query, limit, cursor)
 
 
 class GetPostById(Service):
     def __init__(self, repo: PostRepository):
         self.repo = repo
 
-    def execute(self, post_id: int) -> PostModel | None:
-        return self.repo.get_by_id(post_id)
+    def execute(
+        self,
+        post_id: int,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> PostModel | None:
+        return self.repo.get_by_id(post_id, include, fields)
+
+
+class GetPostVersion(Service):
+    """The post's ``Version``, to answer conditional requests without loading it."""
+
+    def __init__(self, repo: PostRepository):
+        self.repo = repo
+
+    def execute(self, post_id: int) -> Version | None:
+        return self.repo.get_version(post_id)
+
+
+class GetPostVersionBySlug(Service):
+    def __init__(self, repo: PostRepository):
+        self.repo = repo
+
+    def execute(self, slug: str) -> Version | None:
+        return self.repo.get_version_by_slug(slug)
+
+
+class ListPostVersions(Service):
+    """Versions of the posts of a ``ListPosts`` page, in the same order."""
+
+    def __init__(self, repo: PostRepository):
+        self.repo = repo
+
+    def execute(
+        self,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        filters: PostFilter | None = None,
+    ) -> Page[Version]:
+        return self.repo.get_page_versions(limit, cursor, filters)
 
 
 class UpdatePost(Service):
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(
+        self,
+        post_id: int,
+        title: str,
+        content: str,
+        tags: Sequence[str] = (),
+        category: str | None = None,
+        rendered: RenderedContent | None = None,
+    ) -> PostModel | None:
+        """
+        Replace the post's title, content, tags and category; the slug follows
+        the title. Returns ``None`` when the post does not exist. See
+        ``CreatePost`` for ``rendered``.
+        """
+        with self.uow:
+            post = self.uow.posts.get_by_id(post_id)
+            if post is None:
+                return None
+            post.edit(title, content)
+            post.rendered = (
+                rendered or post.rendered_by(RENDER_VERSION) or render(content)
+            )
+            post.category = (
+                CategoryModel(id=None, name=category, slug=category)
+                if category
+                else None
+            )
+            post.tags = [TagModel(id=None, name=t, slug=t) for t in dict.fromkeys(tags)]
+            updated = self.uow.posts.save(post)
+            self.uow.commit()
+        return updated
+
+
+class ListStaleRenderings(Service):
     def __init__(self, repo: PostRepository):
         self.repo = repo
 
-    def execute(self, post_id: int) -> PostModel | None:
-        return self.repo.get_by_id(post_id)
+    def execute(self, limit: int, after_id: int = 0) -> list[PostContent]:
+        return self.repo.get_stale_renderings(RENDER_VERSION, limit, after_id)
+
+
+class SaveRenderings(Service):
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(self, renderings: Sequence[tuple[PostContent, RenderedContent]]) -> int:
+        with self.uow:
+            stored = self.uow.posts.save_renderings(renderings)
+            self.uow.commit()
+        return stored
 
 
 class DeletePost(Service):
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(self, post_id: int) -> None:
+        with self.uow:
+            self.uow.posts.delete(post_id)
+            self.uow.commit()
+
+
+class ExportPosts(Service):
+    """
+    Every post with its category and tags, in id order.
+
+    The result is a lazy iterator reading ``batch_size`` posts per round trip;
+    it must be consumed while the repository's session is open.
+    """
+
     def __init__(self, repo: PostRepository):
         self.repo = repo
 
-    def execute(self, post_id: int) -> None:
-        self.repo.delete(post_id)
+    def execute(
+        self, batch_size: int = DEFAULT_EXPORT_BATCH_SIZE
+    ) -> Iterator[PostModel]:
+        return self.repo.iter_all(batch_size)
+
+
+class ImportPosts(Service):
+    """
+    Import posts from NDJSON, one JSON object per line.
+
+    Lines are consumed lazily and written ``batch_size`` posts at a time, so
+    memory stays flat however long the input is. Each batch is committed on
+    its own. Rows that fail to parse or conflict with existing data are
+    reported by line number and skipped. Posts are stored unrendered, to be
+    rendered in the background (see ``ListStaleRenderings``).
+    """
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(
+        self,
+        lines: Iterable[str | bytes],
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+        first_line: int = 1,
+    ) -> ImportReport:
+        report = ImportReport()
+        batch: list[tuple[int, PostModel]] = []
+
+        for number, line in enumerate(lines, start=first_line):
+            if not line.strip():
+                continue
+            try:
+                batch.append((number, self._parse(line)))
+            except (TypeError, ValueError) as exc:
+                report.errors.append(RowError(line=number, message=str(exc)))
+                continue
+
+            if len(batch) >= batch_size:
+                self._write(batch, report)
+                batch = []
+
+        if batch:
+            self._write(batch, report)
+        return report
+
+    def _write(self, batch: list[tuple[int, PostModel]], report: ImportReport) -> None:
+        with self.uow:
+            errors = self.uow.posts.insert_many([post for _, post in batch])
+            self.uow.commit()
+        for (number, _), error in zip(batch, errors):
+            if error is None:
+                report.inserted += 1
+            else:
+                report.errors.append(RowError(line=number, message=error))
+
+    @staticmethod
+    def _parse(line: str | bytes) -> PostModel:
+        row: Any = json.loads(line)
+        if not isinstance(row, dict):
+            raise ValueError("Each line must be a JSON object")
+
+        title = row.get("title")
+        content = row.get("content")
+        status = row.get("status", "draft")
+        if not isinstance(title, str) or not title.strip():
+            raise ValueError("'title' must be a non-empty string")
+        if not isinstance(content, str):
+            raise ValueError("'content' must be a string")
+        if status not in POST_STATUSES:
+            raise ValueError(f"'status' must be one of {', '.join(POST_STATUSES)}")
+
+        category = row.get("category")
+        slug = row.get("slug")
+        tags = row.get("tags") or []
+        for name, value in (("category", category), ("slug", slug)):
+            if value is not None and not isinstance(value, str):
+                raise ValueError(f"'{name}' must be a string")
+        if not isinstance(tags, list) or not all(
+            isinstance(t, str) and t.strip() for t in tags
+        ):
+            raise ValueError("'tags' must be a list of non-empty strings")
+
+        published_at = row.get("published_at")
+        post = PostModel(
+            id=None,
+            title=title,
+            content=content,
+            category=(
+                CategoryModel(id=None, name=category, slug=category)
+                if category
+                else None
+            ),
+            tags=[TagModel(id=None, name=t, slug=t) for t in tags],
+            status=status,
+            published_at=(
+                datetime.fromisoformat(published_at) if published_at else None
+            ),
+        )
+        if slug:
+            post.slug = slug
+        return post
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+
 from app.application.services import Service
+from app.application.uow import UnitOfWork
+from app.domain.models.page import DEFAULT_PAGE_LIMIT
+from app.domain.models.page import Page
 from app.domain.models.tag import TagModel
+from app.domain.repositories.tag import ALL_TAG_FIELDS
+from app.domain.repositories.tag import TagField
 from app.domain.repositories.tag import TagRepository
 
 
 class CreateTag(Service):
-    def __init__(self, repo: TagRepository):
-        self.repo = repo
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
     def execute(self, name: str, slug: str) -> TagModel:
         tag = TagModel(id=None, name=name, slug=slug)
-        return self.repo.save(tag)
+        with self.uow:
+            created = self.uow.tags.save(tag)
+            self.uow.commit()
+        return created
 
 
 class GetTagBySlug(Service):
@@ -26,16 +36,25 @@ class ListTags(Service):
     def __init__(self, repo: TagRepository):
         self.repo = repo
 
-    def execute(self) -> list[TagModel]:
-        return self.repo.get_all()
+    def execute(
+        self,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: str | None = None,
+        fields: Collection[TagField] = ALL_TAG_FIELDS,
+    ) -> Page[TagModel]:
+        return self.repo.get_page(limit, cursor, fields)
 
 
 class GetTagById(Service):
     def __init__(self, repo: TagRepository):
         self.repo = repo
 
-    def execute(self, tag_id: int) -> TagModel | None:
-        return self.repo.get_by_id(tag_id)
+    def execute(
+        self,
+        tag_id: int,
+        fields: Collection[TagField] = ALL_TAG_FIELDS,
+    ) -> TagModel | None:
+        return self.repo.get_by_id(tag_id, fields)
 
 
 class UpdateTag(Service):
@@ -47,8 +66,10 @@ class UpdateTag(Service):
 
 
 class DeleteTag(Service):
-    def __init__(self, repo: TagRepository):
-        self.repo = repo
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
 
     def execute(self, tag_id: int) -> None:
-        self.repo.delete(tag_id)
+        with self.uow:
+            self.uow.tags.delete(tag_id)
+            self.uow.commit()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from types import TracebackType
+from typing import Protocol
+
+from app.domain.repositories.category import CategoryRepository
+from app.domain.repositories.post import PostRepository
+from app.domain.repositories.tag import TagRepository
+from app.domain.repositories.token import RevokedTokenRepository
+from app.domain.repositories.user import UserRepository
+
+
+class UnitOfWork(Protocol):
+    """
+    Transaction boundary of a use case.
+
+    Repositories obtained from the unit of work only flush their changes;
+    nothing is persisted until ``commit`` is called, once, at the end of the
+    use case. Leaving the ``with`` block on an exception rolls back.
+    """
+
+    posts: PostRepository
+    tags: TagRepository
+    categories: CategoryRepository
+    users: UserRepository
+    revoked_tokens: RevokedTokenRepository
+
+    def __enter__(self) -> UnitOfWork: ...
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None: ...
+
+    def commit(self) -> None: ...
+
+    def rollback(self) -> None: ...
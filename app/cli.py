@@ -0,0 +1,122 @@
+"""
+Command line entry points.
+
+Usage::
+
+    python -m app.cli import-posts posts.ndjson --batch-size 2000
+    cat posts.ndjson | python -m app.cli import-posts -
+    python -m app.cli export-posts backup.ndjson
+    python -m app.cli export-posts - | gzip > backup.ndjson.gz
+    python -m app.cli calibrate-passwords --target-ms 250
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Sequence
+
+from app.application.services.post import DEFAULT_EXPORT_BATCH_SIZE
+from app.application.services.post import DEFAULT_IMPORT_BATCH_SIZE
+from app.application.services.post import ExportPosts
+from app.application.services.post import ImportPosts
+from app.infrastructure.auth.passwords import calibrate
+from app.infrastructure.database import SessionLocal
+from app.infrastructure.mappers.post import PostMapper
+from app.infrastructure.repositories.sqlalchemy.post import SqlAlchemyPostRepository
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
+
+
+def import_posts(args: argparse.Namespace) -> int:
+    source = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8")
+    with source, SessionLocal() as db:
+        report = ImportPosts(SqlAlchemyUnitOfWork(db)).execute(
+            source,
+            batch_size=args.batch_size,
+        )
+
+    for error in report.errors:
+        print(f"line {error.line}: {error.message}", file=sys.stderr)
+    print(json.dumps({"inserted": report.inserted, "errors": len(report.errors)}))
+    return 1 if report.errors else 0
+
+
+def export_posts(args: argparse.Namespace) -> int:
+    target = sys.stdout if args.path == "-" else open(args.path, "w", encoding="utf-8")
+    exported = 0
+    with target, SessionLocal() as db:
+        posts = ExportPosts(SqlAlchemyPostRepository(db)).execute(args.batch_size)
+        for post in posts:
+            target.write(PostMapper.to_export_record(post).model_dump_json() + "\n")
+            exported += 1
+
+    print(json.dumps({"exported": exported}), file=sys.stderr)
+    return 0
+
+
+def calibrate_passwords(args: argparse.Namespace) -> int:
+    target = args.target_ms / 1000
+    timings = calibrate(target)
+    for rounds, seconds in timings:
+        print(f"rounds={rounds:2d}  {seconds * 1000:8.1f} ms", file=sys.stderr)
+
+    # The highest cost within the target; never below the lowest timed.
+    within = [rounds for rounds, seconds in timings if seconds <= target]
+    chosen = within[-1] if within else timings[0][0]
+    print(f"PASSWORD_BCRYPT_ROUNDS={chosen}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser(
+        "import-posts",
+        help="Bulk import posts from an NDJSON file",
+    )
+    importer.add_argument("path", help="NDJSON file, or - to read from stdin")
+    importer.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_IMPORT_BATCH_SIZE,
+        help="Posts written per INSERT batch",
+    )
+    importer.set_defaults(handler=import_posts)
+
+    exporter = commands.add_parser(
+        "export-posts",
+        help="Export every post as NDJSON",
+    )
+    exporter.add_argument("path", help="NDJSON file, or - to write to stdout")
+    exporter.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_EXPORT_BATCH_SIZE,
+        help="Posts fetched per database round trip",
+    )
+    exporter.set_defaults(handler=export_posts)
+
+    calibrator = commands.add_parser(
+        "calibrate-passwords",
+        help="Pick the bcrypt cost for a target hashing time on this machine",
+    )
+    calibrator.add_argument(
+        "--target-ms",
+        type=float,
+        default=250.0,
+        help="Longest a single password hash may take, in milliseconds",
+    )
+    calibrator.set_defaults(handler=calibrate_passwords)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return int(args.handler(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
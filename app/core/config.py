@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy.engine import make_url
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
 
 
 class Settings(BaseSettings):
@@ -21,15 +27,105 @@ class Settings(BaseSettings):
     DATABASE_HOST: str = "localhost"
     DATABASE_PORT: int = 5432
     DATABASE_NAME: str = "blogdb"
+    DATABASE_ASYNC_DRIVER: str | None = None
+    # Read replicas, as full DSNs; GET requests read from them when set.
+    DATABASE_REPLICA_URLS: list[str] = []
+    DATABASE_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    DATABASE_REPLICA_CHECK_INTERVAL_SECONDS: float = 10.0
+    DATABASE_REPLICA_RETRY_SECONDS: float = 30.0
 
     SECRET_KEY: str = "mi_super_secreto"
     JWT_SECRET_KEY: str = "otro_secreto"
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30 * 24 * 60
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Tokens whose signature was checked recently are not checked again;
+    # 0 checks every token every time.
+    JWT_VERIFY_CACHE_MAX_ENTRIES: int = 10_000
+
+    # Revoked tokens are checked against an in-memory Bloom filter of the
+    # revoked_tokens table, synced every TOKEN_REVOCATION_SYNC_SECONDS (the
+    # delay before another process's revocation applies here) and rebuilt,
+    # dropping expired entries, every TOKEN_REVOCATION_REBUILD_SECONDS.
+    TOKEN_REVOCATION_FILTER_CAPACITY: int = 100_000
+    TOKEN_REVOCATION_FILTER_ERROR_RATE: float = 0.001
+    TOKEN_REVOCATION_SYNC_SECONDS: float = 5.0
+    TOKEN_REVOCATION_REBUILD_SECONDS: float = 3600.0
+
+    # Login attempts are rate limited with token buckets per client address
+    # and per username: so many attempts per minute, up to a burst. Past
+    # LOGIN_MAX_IN_FLIGHT logins in progress a process turns attempts away.
+    # Either way the attempt is refused (429 / 503, with Retry-After) before
+    # the database or the password hasher is used.
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_ATTEMPTS_PER_MINUTE_PER_CLIENT: float = 10.0
+    LOGIN_BURST_PER_CLIENT: int = 20
+    LOGIN_ATTEMPTS_PER_MINUTE_PER_USERNAME: float = 5.0
+    LOGIN_BURST_PER_USERNAME: int = 10
+    LOGIN_MAX_IN_FLIGHT: int = 32
+    # Keep the buckets on the cache backend's server (a Redis or SQLite
+    # CACHE_URL) so that every worker counts the same attempts; otherwise
+    # each process keeps its own, up to RATE_LIMIT_MAX_BUCKETS.
+    RATE_LIMIT_SHARED: bool = False
+    RATE_LIMIT_MAX_BUCKETS: int = 100_000
+
+    # bcrypt cost: each hash takes 2**rounds iterations. Pick it for this
+    # hardware with `python -m app.cli calibrate-passwords`; hashes of a
+    # lower cost are replaced at the user's next login.
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    # Threads hashing and checking passwords, i.e. how many cores logins
+    # may take at once; further logins wait for one.
+    PASSWORD_HASH_WORKERS: int = 2
 
     CORS_ORIGINS: list[str] = ["http://localhost:3000"]
 
+    # Cache backend: "memory://" keeps one cache per process; a Redis URL
+    # ("redis://host:6379/0", needs the "redis" extra) or a SQLite file
+    # ("sqlite:///var/cache/blog.sqlite3", one host only) is shared by every
+    # worker using it.
+    CACHE_URL: str = "memory://"
+    CACHE_KEY_PREFIX: str = "blog"
+    # Bound of the in-memory backend.
+    CACHE_MAX_ENTRIES: int = 10_000
+    # How long a shared backend may take to answer before it is skipped.
+    CACHE_TIMEOUT_SECONDS: float = 0.25
+
+    # How long an authenticated user's identity is trusted without reading
+    # the users table; bounds how late a revocation made by another process
+    # applies when the cache is not shared.
+    USER_CACHE_TTL_SECONDS: float = 60.0
+
+    # Cache of posts looked up by id or slug.
+    POST_CACHE_ENABLED: bool = True
+    POST_CACHE_TTL_SECONDS: float = 30.0
+
+    # Rendered GET responses under these paths (below API_PREFIX), retired
+    # by any write to posts, tags or categories.
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_PATHS: list[str] = ["/post", "/tag", "/category"]
+    RESPONSE_CACHE_TTL_SECONDS: float = 10.0
+    RESPONSE_CACHE_MAX_BODY_BYTES: int = 1024 * 1024
+
+    # Post content rendered from Markdown at write time. Longer contents
+    # render in a pool of worker processes (0 renders everything in the
+    # server process). Posts whose rendering is missing or outdated are
+    # rendered again in the background, at startup and after imports.
+    MARKDOWN_INLINE_MAX_CHARS: int = 20_000
+    MARKDOWN_RENDER_WORKERS: int = 2
+    MARKDOWN_REBUILD_ON_STARTUP: bool = True
+    MARKDOWN_REBUILD_BATCH_SIZE: int = 200
+
+    # Public site the feeds and sitemap link to.
+    SITE_URL: str = "http://localhost:3000"
+    SITE_TITLE: str = "Blog"
+    SITE_DESCRIPTION: str = ""
+    SITE_AUTHOR: str = "ihribernik"
+    SITE_POST_PATH: str = "/posts/{slug}"
+    FEED_SIZE: int = 50
+    # How often feeds re-read the published posts to pick up writes made by
+    # other processes; writes made by this process apply on the next request.
+    FEED_REFRESH_SECONDS: float = 60.0
+
     @property
     def is_sqlite(self) -> bool:
         """Check if using SQLite database"""
@@ -38,4 +134,34 @@ class Settings(BaseSettings):
     @property
     def connection_string(self) -> str:
         """Return the connection string for SQLAlchemy"""
-        return f"{self.DATABASE_DRIVER}://{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
+        return self._build_url(self.DATABASE_DRIVER)
+
+    @property
+    def async_connection_string(self) -> str:
+        """Return the connection string for SQLAlchemy's asyncio extension"""
+        driver = self.DATABASE_ASYNC_DRIVER or ASYNC_DRIVERS.get(
+            self.DATABASE_DRIVER.split("+")[0],
+            self.DATABASE_DRIVER,
+        )
+        return self._build_url(driver)
+
+    @property
+    def async_replica_connection_strings(self) -> list[str]:
+        """Return the replica DSNs with the async engine's drivers"""
+        urls = []
+        for dsn in self.DATABASE_REPLICA_URLS:
+            url = make_url(dsn)
+            driver = self.DATABASE_ASYNC_DRIVER or ASYNC_DRIVERS.get(
+                url.get_backend_name(),
+                url.drivername,
+            )
+            urls.append(url.set(drivername=driver).render_as_string(False))
+        return urls
+
+    def _build_url(self, driver: str) -> str:
+        if driver.startswith("sqlite"):
+            return f"{driver}:///{self.DATABASE_NAME}"
+        return (
+            f"{driver}://{self.DATABASE_USER}:{self.DATABASE_PASSWORD}"
+            f"@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
+        )
@@ -4,6 +4,7 @@ Provides a comprehensive hierarchy of exceptions for domain-specific errors.
 """
 from __future__ import annotations
 
+import math
 from datetime import datetime
 from datetime import timezone
 from typing import Any
@@ -30,7 +31,7 @@ class DomainValidationError(PostException):
 class PostNotFoundError(PostException):
     """Raised when a requested post is not found."""
 
-    def __init__(self, post_id: str):
+    def __init__(self, post_id: int | str):
         message = f"Post with id {post_id} not found"
         super().__init__(message, {'post_id': post_id})
 
@@ -42,6 +43,14 @@ class InvalidPostError(DomainValidationError):
         super().__init__('Post validation failed', errors)
 
 
+class InvalidCursorError(DomainValidationError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str):
+        super().__init__('Invalid pagination cursor', [f"Malformed cursor: {cursor}"])
+        self.cursor = cursor
+
+
 class UnauthorizedError(PostException):
     """Raised when user is not authorized to perform an action."""
 
@@ -120,9 +129,13 @@ class AuthorizationError(PostException):
 class RateLimitError(PostException):
     """Raised when rate limit is exceeded."""
 
-    def __init__(self, limit: int, window: int):
-        super().__init__(
-            f"Rate limit of {limit} requests per {window} seconds exceeded",
-        )
-        self.limit = limit
-        self.window = window
+    def __init__(self, message: str, retry_after: float):
+        self.retry_after = max(1, math.ceil(retry_after))
+        self.headers = {'Retry-After': str(self.retry_after)}
+        super().__init__(message, {'retry_after': self.retry_after})
+
+
+class OverloadedError(RateLimitError):
+    """Raised when a request is turned away to shed load."""
+
+    pass
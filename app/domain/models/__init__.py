@@ -0,0 +1,5 @@
+def stored_id(entity_id: int | None) -> int:
+    """The id of an entity read from or saved to the database."""
+    if entity_id is None:
+        raise ValueError("The entity has not been saved yet")
+    return entity_id
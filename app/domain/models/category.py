@@ -1,6 +1,10 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
+from app.domain.models import stored_id
+from app.domain.models.version import Version
+
 
 @dataclass
 class CategoryModel:
@@ -8,3 +12,8 @@ class CategoryModel:
     name: str
     slug: str
     description: Optional[str] = None
+    post_count: Optional[int] = None
+    updated_at: Optional[datetime] = None
+
+    def version(self) -> Version:
+        return Version.of(stored_id(self.id), [self.updated_at], [self.post_count])
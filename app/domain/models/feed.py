@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+
+class FeedKind(str, Enum):
+    RSS = "rss"
+    ATOM = "atom"
+    SITEMAP = "sitemap"
+
+
+@dataclass(frozen=True)
+class FeedDocument:
+    """A rendered feed with the validators of conditional requests."""
+
+    body: bytes
+    etag: str
+    last_modified: datetime | None = None
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Generic
+from typing import TypeVar
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 100
+
+
+@dataclass
+class Page(Generic[T]):
+    """A slice of a keyset-paginated listing.
+
+    Cursors are opaque tokens; pass ``next_cursor`` or ``prev_cursor`` back to
+    the repository to fetch the adjacent page.
+    """
+
+    items: list[T]
+    limit: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+    def map(self, fn: Callable[[T], U]) -> Page[U]:
+        return Page(
+            items=[fn(item) for item in self.items],
+            limit=self.limit,
+            next_cursor=self.next_cursor,
+            prev_cursor=self.prev_cursor,
+        )
@@ -2,13 +2,30 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from collections.abc import Iterable
 from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
 from datetime import timezone
 
+from app.domain.models import stored_id
 from app.domain.models.category import CategoryModel
 from app.domain.models.tag import TagModel
+from app.domain.models.version import Version
+
+
+@dataclass(frozen=True)
+class RenderedContent:
+    """
+    A post's Markdown rendered to HTML, with the figures shown next to it.
+    ``version`` is the renderer version that produced it.
+    """
+
+    html: str
+    excerpt: str
+    word_count: int
+    reading_time: int  # minutes
+    version: int
 
 
 @dataclass
@@ -23,6 +40,7 @@ class PostModel:
     published_at: datetime | None = None
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    rendered: RenderedContent | None = None
 
     def __post_init__(self) -> None:
         self.slug = self.slugify(self.title)
@@ -32,6 +50,20 @@ class PostModel:
         self.published_at = datetime.now(timezone.utc)
         self.updated_at = datetime.now(timezone.utc)
 
+    def edit(self, title: str, content: str) -> None:
+        self.title = title
+        self.slug = self.slugify(title)
+        if content != self.content:
+            self.rendered = None
+        self.content = content
+        self.updated_at = datetime.now(timezone.utc)
+
+    def rendered_by(self, version: int) -> RenderedContent | None:
+        """The stored rendering, unless an older renderer produced it."""
+        if self.rendered is None or self.rendered.version != version:
+            return None
+        return self.rendered
+
     def add_tag(self, tag: TagModel) -> None:
         if tag not in self.tags:
             self.tags.append(tag)
@@ -41,8 +73,123 @@ class PostModel:
         self.category = category
         self.updated_at = datetime.now(timezone.utc)
 
+    def version(self) -> Version:
+        return post_version(
+            stored_id(self.id),
+            self.updated_at,
+            (
+                (stored_id(self.category.id), self.category.updated_at)
+                if self.category
+                else None
+            ),
+            [(stored_id(t.id), t.updated_at) for t in self.tags],
+        )
+
     def slugify(self, value: str) -> str:
         value = unicodedata.normalize("NFKD", value)
         value = value.encode("ascii", "ignore").decode("ascii")
         value = re.sub(r"[^\w\s-]", "", value).strip().lower()
         return re.sub(r"[-\s]+", "-", value)
+
+
+@dataclass
+class PostSummary:
+    """Read model for listings: a post without its ``content``."""
+
+    id: int
+    title: str
+    slug: str
+    category: CategoryModel | None = None
+    tags: list[TagModel] = field(default_factory=list)
+    status: str = "draft"
+    published_at: datetime | None = None
+    updated_at: datetime | None = None
+
+    def version(self) -> Version:
+        return post_version(
+            self.id,
+            self.updated_at,
+            (
+                (stored_id(self.category.id), self.category.updated_at)
+                if self.category
+                else None
+            ),
+            [(stored_id(t.id), t.updated_at) for t in self.tags],
+        )
+
+
+def post_version(
+    post_id: int,
+    updated_at: datetime | None,
+    category: tuple[int, datetime | None] | None,
+    tags: Iterable[tuple[int, datetime | None]],
+) -> Version:
+    """
+    A post is rendered with its category and tags, so it changes with them:
+    renaming a tag changes every post carrying it. ``category`` and ``tags``
+    are ``(id, updated_at)`` pairs.
+    """
+    tags = sorted(tags)
+    return Version.of(
+        post_id,
+        [updated_at, category[1] if category else None] + [t[1] for t in tags],
+        [category[0] if category else None] + [t[0] for t in tags],
+    )
+
+
+@dataclass(frozen=True)
+class PostFilter:
+    """Listing filters; ``category`` and ``tag`` are slugs. ``None`` matches all."""
+
+    status: str | None = None
+    category: str | None = None
+    tag: str | None = None
+
+
+@dataclass(frozen=True)
+class PostStamp:
+    """Identity and modification time of a published post, for feeds and sitemaps."""
+
+    id: int
+    slug: str
+    published_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class PostContent:
+    """A post's Markdown as of ``updated_at``, to be rendered again."""
+
+    id: int
+    content: str
+    updated_at: datetime
+
+
+@dataclass
+class PostSearchHit:
+    """A post matching a full-text search, with its relevance and a snippet."""
+
+    id: int
+    title: str
+    slug: str
+    snippet: str
+    rank: float
+    published_at: datetime | None = None
+
+
+@dataclass
+class RowError:
+    """A row rejected by a bulk operation, identified by its input line."""
+
+    line: int
+    message: str
+
+
+@dataclass
+class ImportReport:
+    inserted: int = 0
+    errors: list[RowError] = field(default_factory=list)
+
+    def merge(self, other: ImportReport) -> None:
+        self.inserted += other.inserted
+        self.errors.extend(other.errors)
@@ -1,9 +1,18 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 
+from app.domain.models import stored_id
+from app.domain.models.version import Version
+
 
 @dataclass
 class TagModel:
     id: Optional[int]
     name: str
     slug: str
+    post_count: Optional[int] = None
+    updated_at: Optional[datetime] = None
+
+    def version(self) -> Version:
+        return Version.of(stored_id(self.id), [self.updated_at], [self.post_count])
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from typing import Any
 
+from app.domain.models import stored_id
 from app.infrastructure.auth import PasswordService
 
 
@@ -10,7 +13,57 @@ class UserModel:
     id: int | None
     username: str
     hashed_password: str
+    token_version: int = 0
 
     def verify_password(self, plain_password: str) -> bool:
 
         return PasswordService.verify(plain_password, self.hashed_password)
+
+    def set_password(self, plain_password: str) -> None:
+        self.hashed_password = PasswordService.hash_password(plain_password)
+
+    def rehash_password(self, hashed_password: str) -> None:
+        """Store the same password hashed anew, e.g. at a higher cost."""
+        self.hashed_password = hashed_password
+
+    def revoke_tokens(self) -> None:
+        """Invalidate every token issued to the user so far."""
+        self.token_version += 1
+
+    def identity(self) -> UserIdentity:
+        return UserIdentity(stored_id(self.id), self.username, self.token_version)
+
+
+@dataclass(frozen=True)
+class UserIdentity:
+    """
+    Who a token was issued to: what authenticating a request needs, and no
+    credentials, so it can be cached anywhere.
+    """
+
+    id: int
+    username: str
+    token_version: int
+
+    def claims(self) -> dict[str, Any]:
+        return {"sub": self.username, "uid": self.id, "ver": self.token_version}
+
+    @classmethod
+    def from_claims(cls, claims: Mapping[str, Any]) -> UserIdentity | None:
+        """``None`` for tokens issued before they carried the user id and version."""
+        username = claims.get("sub")
+        user_id = claims.get("uid")
+        token_version = claims.get("ver")
+        if (
+            not isinstance(username, str)
+            or not isinstance(user_id, int)
+            or not isinstance(token_version, int)
+        ):
+            return None
+        return cls(user_id, username, token_version)
+
+
+@dataclass(frozen=True)
+class TokenPair:
+    access_token: str
+    refresh_token: str
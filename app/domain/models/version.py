@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+
+
+@dataclass(frozen=True)
+class Version:
+    """
+    What a representation of a resource is derived from, cheap to read
+    without loading the resource itself.
+
+    ``updated_at`` is the newest modification time among the rows the
+    resource is rendered from. ``parts`` identifies those rows and values
+    derived from other tables (such as counts), so that unlinking a related
+    row is noticed even though no modification time moved.
+    """
+
+    id: int
+    updated_at: datetime | None
+    parts: tuple[int | None, ...] = ()
+
+    @classmethod
+    def of(
+        cls,
+        resource_id: int,
+        stamps: Iterable[datetime | None],
+        parts: Iterable[int | None] = (),
+    ) -> Version:
+        # Rows read back from the database carry naive UTC timestamps.
+        known = [
+            s if s.tzinfo else s.replace(tzinfo=timezone.utc)
+            for s in stamps
+            if s is not None
+        ]
+        return cls(resource_id, max(known, default=None), tuple(parts))
@@ -6,6 +6,8 @@ from typing import Optional
 from typing import Protocol
 from typing import TypeVar
 
+from app.domain.models.page import Page
+
 E = TypeVar('E', contravariant=True)
 R = TypeVar('R')
 ID = TypeVar('ID', contravariant=True)
@@ -19,5 +21,6 @@ class BaseRepository(Protocol, Generic[E, R, ID]):
     def get_by_id(self, entity_id: ID) -> R | None: ...
     def get_by_slug(self, slug: str) -> R | None: ...
     def get_all(self) -> list[R]: ...
+    def get_page(self, limit: int, cursor: str | None = None) -> Page[R]: ...
     def save(self, entity: E) -> R: ...
     def delete(self, entity_id: ID) -> None: ...
@@ -1,8 +1,46 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+from enum import Enum
+from typing import Protocol
+
 from app.domain.models.category import CategoryModel
+from app.domain.models.page import Page
 from app.domain.repositories import BaseRepository
 
 
-class CategoryRepository(BaseRepository[CategoryModel, CategoryModel, int]):
-    pass
+class CategoryField(str, Enum):
+    """
+    Attributes of the category that reads may leave out; its id and modification
+    time are always read.
+    """
+
+    NAME = "name"
+    SLUG = "slug"
+    DESCRIPTION = "description"
+    POST_COUNT = "post_count"
+
+
+ALL_CATEGORY_FIELDS: frozenset[CategoryField] = frozenset(CategoryField)
+
+
+class CategoryRepository(BaseRepository[CategoryModel, CategoryModel, int], Protocol):
+    """
+    Category repository interface.
+
+    Read methods taking ``fields`` read only those; columns left out come
+    back empty, and posts are only counted when ``post_count`` is asked for.
+    """
+
+    def get_by_id(
+        self,
+        entity_id: int,
+        fields: Collection[CategoryField] = ALL_CATEGORY_FIELDS,
+    ) -> CategoryModel | None: ...
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        fields: Collection[CategoryField] = ALL_CATEGORY_FIELDS,
+    ) -> Page[CategoryModel]: ...
@@ -1,8 +1,167 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+from collections.abc import Iterator
+from collections.abc import Sequence
+from enum import Enum
+from typing import Protocol
+
+from app.domain.models.page import Page
+from app.domain.models.post import PostContent
+from app.domain.models.post import PostFilter
 from app.domain.models.post import PostModel
+from app.domain.models.post import PostSearchHit
+from app.domain.models.post import PostStamp
+from app.domain.models.post import PostSummary
+from app.domain.models.post import RenderedContent
+from app.domain.models.version import Version
 from app.domain.repositories import BaseRepository
 
 
-class PostRepository(BaseRepository[PostModel, PostModel, int]):
-    pass
+class PostRelation(str, Enum):
+    """Parts of the post aggregate that live in other tables."""
+
+    CATEGORY = "category"
+    TAGS = "tags"
+
+
+ALL_POST_RELATIONS: frozenset[PostRelation] = frozenset(PostRelation)
+
+
+class PostField(str, Enum):
+    """
+    Columns of the post that reads may leave out. Its id, status and
+    timestamps are always read.
+    """
+
+    TITLE = "title"
+    SLUG = "slug"
+    CONTENT = "content"
+    RENDERED = "rendered"
+
+
+ALL_POST_FIELDS: frozenset[PostField] = frozenset(PostField)
+
+
+class PostRepository(BaseRepository[PostModel, PostModel, int], Protocol):
+    """
+    Post repository interface.
+
+    Read methods take the relations to hydrate; relations left out are not
+    loaded at all and come back empty (``category=None``, ``tags=[]``). Those
+    taking ``fields`` read only those columns; the others come back empty
+    too (``""``, ``rendered=None``).
+    """
+
+    def get_by_id(
+        self,
+        entity_id: int,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> PostModel | None: ...
+
+    def get_by_slug(
+        self,
+        slug: str,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> PostModel | None: ...
+
+    def get_by_ids(
+        self,
+        ids: Collection[int],
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> list[PostModel]: ...
+
+    def get_published_stamps(
+        self,
+        ids: Collection[int] | None = None,
+    ) -> list[PostStamp]:
+        """Published posts, newest first; only those in ``ids`` when given."""
+        ...
+
+    def get_version(self, post_id: int) -> Version | None:
+        """The post's ``Version``, read without its content or relations."""
+        ...
+
+    def get_version_by_slug(self, slug: str) -> Version | None: ...
+
+    def get_page_versions(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        filters: PostFilter | None = None,
+    ) -> Page[Version]:
+        """The ``Version`` of every post ``get_page`` would return."""
+        ...
+
+    def get_all(
+        self,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+    ) -> list[PostModel]: ...
+
+    def iter_all(
+        self,
+        batch_size: int,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+    ) -> Iterator[PostModel]:
+        """Every post in id order, fetched lazily ``batch_size`` at a time."""
+        ...
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        filters: PostFilter | None = None,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> Page[PostModel]: ...
+
+    def get_summary_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        filters: PostFilter | None = None,
+    ) -> Page[PostSummary]: ...
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+    ) -> Page[PostSearchHit]:
+        """Posts matching ``query``, most relevant first."""
+        ...
+
+    def insert_many(self, posts: Sequence[PostModel]) -> list[str | None]:
+        """
+        Insert new posts in bulk.
+
+        Returns one entry per post: ``None`` when it was inserted, otherwise
+        the reason it was rejected. A rejected row never aborts the others.
+        """
+        ...
+
+    def get_stale_renderings(
+        self,
+        version: int,
+        limit: int,
+        after_id: int = 0,
+    ) -> list[PostContent]:
+        """
+        Up to ``limit`` posts, in id order after ``after_id``, not rendered
+        by renderer ``version``.
+        """
+        ...
+
+    def save_renderings(
+        self,
+        renderings: Sequence[tuple[PostContent, RenderedContent]],
+    ) -> int:
+        """
+        Store each rendering unless its post changed since ``PostContent``
+        was read; returns how many were stored.
+        """
+        ...
@@ -1,8 +1,45 @@
 from __future__ import annotations
 
+from collections.abc import Collection
+from enum import Enum
+from typing import Protocol
+
 from app.domain.models.tag import TagModel
+from app.domain.models.page import Page
 from app.domain.repositories import BaseRepository
 
 
-class TagRepository(BaseRepository[TagModel, TagModel, int]):
-    pass
+class TagField(str, Enum):
+    """
+    Attributes of the tag that reads may leave out; its id and modification
+    time are always read.
+    """
+
+    NAME = "name"
+    SLUG = "slug"
+    POST_COUNT = "post_count"
+
+
+ALL_TAG_FIELDS: frozenset[TagField] = frozenset(TagField)
+
+
+class TagRepository(BaseRepository[TagModel, TagModel, int], Protocol):
+    """
+    Tag repository interface.
+
+    Read methods taking ``fields`` read only those; columns left out come
+    back empty, and posts are only counted when ``post_count`` is asked for.
+    """
+
+    def get_by_id(
+        self,
+        entity_id: int,
+        fields: Collection[TagField] = ALL_TAG_FIELDS,
+    ) -> TagModel | None: ...
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        fields: Collection[TagField] = ALL_TAG_FIELDS,
+    ) -> Page[TagModel]: ...
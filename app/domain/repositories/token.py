@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class RevokedTokenRepository(ABC):
+    @abstractmethod
+    def revoke(self, token_id: str, expires_at: datetime) -> bool:
+        """Revoca un token hasta su expiración; False si ya estaba revocado"""
+        pass
+
+    @abstractmethod
+    def is_revoked(self, token_id: str) -> bool:
+        """Indica si un token fue revocado"""
+        pass
+
+    @abstractmethod
+    def list_revoked(self, since: datetime | None = None) -> list[str]:
+        """Ids de los tokens revocados desde since que aún no expiraron"""
+        pass
+
+    @abstractmethod
+    def purge_expired(self) -> int:
+        """Borra las revocaciones de tokens ya expirados"""
+        pass
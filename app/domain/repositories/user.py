@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-from app.domain.models.user import UserModel
+from app.domain.models.user import UserIdentity, UserModel
 
 
 class UserRepository(ABC):
@@ -11,6 +11,11 @@ class UserRepository(ABC):
         """Busca un usuario por username"""
         pass
 
+    @abstractmethod
+    def get_identity(self, user_id: int) -> UserIdentity | None:
+        """Busca la identidad de un usuario por id, sin sus credenciales"""
+        pass
+
     @abstractmethod
     def save(self, user: UserModel) -> UserModel:
         """Guarda o actualiza un usuario"""
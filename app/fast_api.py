@@ -3,8 +3,15 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import Settings
+from app.infrastructure.auth.passwords import password_hasher
+from app.infrastructure.auth.revocation import revocation_sync
+from app.infrastructure.cache.responses import response_cache
+from app.infrastructure.content.markdown import markdown_renderer
+from app.infrastructure.content.rebuild import rendering_rebuild
 from app.presentation.api.middlewares.error import add_error_handlers
 from app.presentation.api.middlewares.health import db_health_check_middleware
+from app.presentation.api.middlewares.response_cache import ResponseCacheMiddleware
+from app.presentation.api.responses import ORJSONResponse
 from app.presentation.api.routes import register_routes
 
 load_dotenv()
@@ -19,8 +26,18 @@ def create_app() -> FastAPI:
         openapi_url="/openapi.json",
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
     )
 
+    # Innermost: responses are cached before CORS adds per-origin headers.
+    if settings.RESPONSE_CACHE_ENABLED:
+        fastapi_app.add_middleware(
+            ResponseCacheMiddleware,
+            cache=response_cache,
+            paths=[settings.API_PREFIX + p for p in settings.RESPONSE_CACHE_PATHS],
+            max_body_bytes=settings.RESPONSE_CACHE_MAX_BODY_BYTES,
+        )
+
     fastapi_app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
@@ -33,6 +50,13 @@ def create_app() -> FastAPI:
 
     register_routes(fastapi_app, prefix=settings.API_PREFIX)
 
+    if settings.MARKDOWN_REBUILD_ON_STARTUP:
+        fastapi_app.add_event_handler("startup", rendering_rebuild.schedule)
+    fastapi_app.add_event_handler("shutdown", markdown_renderer.close)
+    fastapi_app.add_event_handler("shutdown", password_hasher.close)
+    fastapi_app.add_event_handler("startup", revocation_sync.start)
+    fastapi_app.add_event_handler("shutdown", revocation_sync.stop)
+
     add_error_handlers(fastapi_app)
 
     return fastapi_app
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import hashlib
+import secrets
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
@@ -12,6 +12,8 @@ from jose import jwt
 from jose import JWTError
 
 from app.core.config import Settings
+from app.infrastructure.auth.passwords import password_hasher
+from app.infrastructure.auth.verified import VerifiedTokens
 
 settings = Settings()
 
@@ -20,31 +22,35 @@ ALGORITHM = settings.JWT_ALGORITHM
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
 REFRESH_TOKEN_EXPIRE_DAYS = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
 
+verified_tokens = VerifiedTokens(settings.JWT_VERIFY_CACHE_MAX_ENTRIES)
+
 
 class JWTService:
     @staticmethod
     def create_access_token(
         data: dict,
         expires_delta: timedelta | None = None,
-    ) -> str | None:
+    ) -> str:
         to_encode = data.copy()
         expire = datetime.now(timezone.utc) + (
             expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         )
-        to_encode.update({"exp": expire, "type": "access"})
-        return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        to_encode.update({"exp": expire, "type": "access", "jti": new_token_id()})
+        token: str = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        return token
 
     @staticmethod
     def create_refresh_token(
         data: dict,
         expires_delta: timedelta | None = None,
-    ) -> str | None:
+    ) -> str:
         to_encode = data.copy()
         expire = datetime.now(timezone.utc) + (
             expires_delta or timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
         )
-        to_encode.update({"exp": expire, "type": "refresh"})
-        return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        to_encode.update({"exp": expire, "type": "refresh", "jti": new_token_id()})
+        token: str = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        return token
 
     @staticmethod
     def verify_token(
@@ -53,38 +59,55 @@ class JWTService:
     ) -> dict[str, Any] | None:
         """
         expected_type puede ser "access" o "refresh"
+
+        Los tokens ya verificados se recuerdan hasta su expiración (ver
+        VerifiedTokens), así que la firma se comprueba una sola vez por token.
         """
-        try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            if payload.get("type") != expected_type:
+        digest = VerifiedTokens.digest(token)
+        payload = verified_tokens.get(digest)
+        if payload is None:
+            try:
+                payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            except ExpiredSignatureError:
                 return None
-            return payload
-        except ExpiredSignatureError:
-            return None
-        except JWTError:
+            except JWTError:
+                return None
+            verified_tokens.put(digest, payload)
+        if payload.get("type") != expected_type:
             return None
+        return dict(payload)
 
     @staticmethod
-    def refresh_access_token(refresh_token: str) -> str | None:
+    def token_id(token: str, payload: dict[str, Any]) -> str:
         """
-        Recibe un refresh token válido y genera un nuevo access token.
+        El claim jti, con el que se revoca el token; los tokens emitidos
+        antes de llevarlo se identifican por su digest.
         """
-        payload = JWTService.verify_token(refresh_token, expected_type="refresh")
-        if not payload:
-            return None
+        token_id = payload.get("jti")
+        if isinstance(token_id, str):
+            return token_id
+        return VerifiedTokens.digest(token).hex()
 
-        sub = payload.get("sub")
-        if not sub:
-            return None
+    @staticmethod
+    def expires_at(payload: dict[str, Any]) -> datetime:
+        return datetime.fromtimestamp(payload["exp"], timezone.utc)
 
-        return JWTService.create_access_token({"sub": sub})
+
+def new_token_id() -> str:
+    return secrets.token_hex(16)
 
 
 class PasswordService:
+    """
+    Hashing síncrono, en el hilo que llama; los requests usan
+    password_hasher, que hashea en sus propios workers.
+    """
+
     @staticmethod
     def verify(plain_password: str, hashed_password: str) -> bool:
-        return hashed_password == hashlib.sha256(plain_password.encode()).hexdigest()
+        verified, _ = password_hasher.verify_and_update(plain_password, hashed_password)
+        return verified
 
     @staticmethod
     def hash_password(plain_password: str) -> str:
-        return hashlib.sha256(plain_password.encode()).hexdigest()
+        return password_hasher.hash(plain_password)
@@ -0,0 +1,124 @@
+"""
+Password hashing: bcrypt through passlib, off the event loop.
+
+A bcrypt hash costs ``2 ** rounds`` iterations by design, tens to hundreds
+of milliseconds of CPU. ``PasswordHasher`` runs them on a fixed number of
+threads (bcrypt releases the GIL), so concurrent logins queue for a hash
+instead of taking every core and stalling the requests around them.
+
+Hashes of a lower cost than the configured one, and the unsalted SHA-256
+digests stored before bcrypt, still verify and are reported as needing an
+update, so they are replaced on the user's next login.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import TypeVar
+
+from passlib.context import CryptContext
+
+from app.core.config import Settings
+
+# bcrypt's own bounds for the cost.
+MIN_ROUNDS = 4
+MAX_ROUNDS = 31
+
+T = TypeVar("T")
+
+
+def password_context(rounds: int) -> CryptContext:
+    return CryptContext(
+        schemes=["bcrypt", "hex_sha256"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+    )
+
+
+class PasswordHasher:
+    def __init__(self, context: CryptContext, workers: int):
+        self.context = context
+        self.workers = workers
+        self._executor: ThreadPoolExecutor | None = None
+
+    def hash(self, password: str) -> str:
+        hashed: str = self.context.hash(password)
+        return hashed
+
+    def verify_and_update(self, password: str, hashed: str) -> tuple[bool, str | None]:
+        """
+        Whether ``password`` matches ``hashed``, and the hash to store in its
+        place when ``hashed`` is outdated (``None`` otherwise).
+        """
+        try:
+            result: tuple[bool, str | None] = self.context.verify_and_update(
+                password, hashed
+            )
+        except ValueError:
+            # Not a hash of any known scheme.
+            return False, None
+        return result
+
+    def reject(self, password: str) -> tuple[bool, str | None]:
+        """Spend a verification on ``password``; always fails."""
+        self.context.verify(password, self._dummy)
+        return False, None
+
+    @cached_property
+    def _dummy(self) -> str:
+        # Verified against when a user does not exist, so that an unknown
+        # username takes as long to reject as a wrong password.
+        return self.hash("not a password")
+
+    async def verify_and_update_async(
+        self, password: str, hashed: str | None
+    ) -> tuple[bool, str | None]:
+        """``verify_and_update`` on a worker; ``hashed=None`` is a miss."""
+        if hashed is None:
+            return await self._run(self.reject, password)
+        return await self._run(self.verify_and_update, password, hashed)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, fn: Callable[..., T], *args: object) -> T:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+
+def calibrate(target_seconds: float, samples: int = 3) -> list[tuple[int, float]]:
+    """
+    Time one bcrypt hash per cost, from the lowest up to the first cost
+    slower than ``target_seconds``; the best of ``samples`` for each.
+    """
+    timings = []
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        context = password_context(rounds)
+        best = float("inf")
+        for _ in range(samples):
+            began = time.perf_counter()
+            context.hash("calibration")
+            best = min(best, time.perf_counter() - began)
+        timings.append((rounds, best))
+        if best > target_seconds:
+            break
+    return timings
+
+
+settings = Settings()
+
+password_hasher = PasswordHasher(
+    password_context(settings.PASSWORD_BCRYPT_ROUNDS),
+    workers=settings.PASSWORD_HASH_WORKERS,
+)
@@ -0,0 +1,99 @@
+"""
+Keep the process's revocation filter in step with the revoked tokens table.
+
+Every ``sync_interval`` seconds the revocations committed since the last
+pass are added to the filter, so a token revoked by another process is
+refused here within about that long. Every ``rebuild_interval`` seconds,
+and whenever the filter is full, expired revocations are purged and the
+filter is rebuilt from the table; the first pass, at startup, is a rebuild.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from datetime import timedelta
+
+from app.core.config import Settings
+from app.infrastructure.database import SessionLocal
+from app.infrastructure.database import utc_now
+from app.infrastructure.repositories.cached.token import revocation_filter
+from app.infrastructure.repositories.cached.token import RevocationFilter
+from app.infrastructure.repositories.sqlalchemy.token import (
+    SqlAlchemyRevokedTokenRepository,
+)
+
+# Each pass reads again this far before the previous one began: rows are
+# stamped before their transaction commits, by clocks of other hosts.
+SYNC_OVERLAP = timedelta(seconds=60)
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationSync:
+    def __init__(
+        self,
+        revocations: RevocationFilter,
+        sync_interval: float,
+        rebuild_interval: float,
+    ):
+        self.revocations = revocations
+        self.sync_interval = sync_interval
+        self.rebuild_interval = rebuild_interval
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        rebuilt_at = 0.0
+        since: datetime | None = None
+        while True:
+            began = utc_now()
+            try:
+                if (
+                    since is None
+                    or time.monotonic() - rebuilt_at >= self.rebuild_interval
+                    or self.revocations.full()
+                ):
+                    await asyncio.to_thread(self._rebuild)
+                    rebuilt_at = time.monotonic()
+                else:
+                    await asyncio.to_thread(self._sync, since)
+                since = began - SYNC_OVERLAP
+            except Exception:
+                logger.exception("Syncing revoked tokens failed")
+            await asyncio.sleep(self.sync_interval)
+
+    def _rebuild(self) -> None:
+        with SessionLocal() as db:
+            revoked = SqlAlchemyRevokedTokenRepository(db)
+            purged = revoked.purge_expired()
+            db.commit()
+            loaded = self.revocations.rebuild(revoked)
+        logger.info("Loaded %d revoked tokens, purged %d expired", loaded, purged)
+
+    def _sync(self, since: datetime) -> None:
+        with SessionLocal() as db:
+            self.revocations.sync(SqlAlchemyRevokedTokenRepository(db), since)
+
+
+settings = Settings()
+
+revocation_sync = RevocationSync(
+    revocation_filter,
+    sync_interval=settings.TOKEN_REVOCATION_SYNC_SECONDS,
+    rebuild_interval=settings.TOKEN_REVOCATION_REBUILD_SECONDS,
+)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from app.infrastructure.cache.lru import CacheStats
+from app.infrastructure.cache.lru import LRUCache
+
+
+class VerifiedTokens:
+    """
+    Payloads of tokens whose signature already checked out, by token digest.
+
+    A client sends the same access token with every request; remembering the
+    payload skips decoding and the signature check for all but the first.
+    Entries expire with the token's ``exp`` and tokens without one are never
+    kept. Only digests are stored, never the tokens themselves.
+
+    ``forget_users`` drops every token of the given users, by bumping a
+    per-user generation that entries stored before it no longer match.
+    """
+
+    def __init__(self, max_entries: int):
+        self.entries: LRUCache[bytes, tuple[int, dict[str, Any]]] = LRUCache(
+            max_entries, ttl=0
+        )
+        self._generations: dict[Any, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, digest: bytes) -> dict[str, Any] | None:
+        entry = self.entries.get(digest)
+        if entry is None:
+            return None
+        generation, payload = entry
+        if generation != self._generations.get(payload.get("uid"), 0):
+            self.entries.delete(digest)
+            return None
+        return payload
+
+    def put(self, digest: bytes, payload: dict[str, Any]) -> None:
+        expires_at = payload.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            return
+        ttl = expires_at - time.time()
+        if ttl <= 0:
+            return
+        generation = self._generations.get(payload.get("uid"), 0)
+        self.entries.set(digest, (generation, payload), ttl=ttl)
+
+    def forget_users(self, user_ids: Iterable[Any]) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def stats(self) -> CacheStats:
+        return self.entries.stats()
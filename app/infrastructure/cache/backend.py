@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from contextlib import contextmanager
+from typing import Any
+
+
+class CacheUnavailableError(Exception):
+    """The cache backend could not be reached; callers treat it as a miss."""
+
+
+class CacheBackend:
+    """
+    Byte values under string keys, each expiring ``ttl`` seconds after it
+    was written.
+
+    Every operation works on a batch of keys so that a remote backend
+    answers it in one round trip. Keys are used as given: namespacing and
+    serialization belong to ``CacheNamespace``.
+
+    Operations block on the backend's I/O. Coroutines await the ``_async``
+    variants instead, which run the blocking call on a worker thread unless
+    the backend has a native async client.
+    """
+
+    name: str
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        """The stored values of ``keys``; missing and expired keys are left out."""
+        raise NotImplementedError
+
+    def set_many(self, items: Mapping[str, bytes], ttl: float) -> None:
+        raise NotImplementedError
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        raise NotImplementedError
+
+    async def get_many_async(self, keys: Sequence[str]) -> dict[str, bytes]:
+        return await asyncio.to_thread(self.get_many, keys)
+
+    async def set_many_async(self, items: Mapping[str, bytes], ttl: float) -> None:
+        await asyncio.to_thread(self.set_many, items, ttl)
+
+    async def delete_many_async(self, keys: Sequence[str]) -> None:
+        await asyncio.to_thread(self.delete_many, keys)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters worth reporting by the health check, if the backend keeps any."""
+        return {}
+
+    def close(self) -> None:
+        pass
+
+
+@contextmanager
+def unavailable_on(*errors: type[BaseException]) -> Iterator[None]:
+    """Re-raise the backend's own ``errors`` as ``CacheUnavailableError``."""
+    try:
+        yield
+    except errors as exc:
+        raise CacheUnavailableError(str(exc)) from exc
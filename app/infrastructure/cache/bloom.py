@@ -0,0 +1,85 @@
+"""
+Bloom filter over strings: a set that may answer "maybe" for keys it was
+never given, but never "no" for one it was.
+
+Sized for ``capacity`` keys at a false positive rate of ``error_rate``; past
+``capacity`` the rate grows, so owners rebuild it larger. Membership costs
+one hash of the key and, for a key that is absent, usually one or two bit
+reads: the first unset bit answers.
+
+Keys are hashed with Python's own string hash, which is salted per process:
+a filter is only meaningful in the process that built it.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+_MASK32 = 0xFFFF_FFFF
+_MASK64 = 0xFFFF_FFFF_FFFF_FFFF
+
+
+@dataclass(frozen=True)
+class BloomStats:
+    size: int
+    capacity: int
+    bits: int
+    hashes: int
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(1, capacity)
+        self.capacity = capacity
+        self.bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.size = 0
+        self._array = bytearray((self.bits + 7) // 8)
+
+    @classmethod
+    def of(cls, keys: Iterable[str], capacity: int, error_rate: float) -> BloomFilter:
+        keys = list(keys)
+        bloom = cls(max(capacity, len(keys)), error_rate)
+        for key in keys:
+            bloom.add(key)
+        return bloom
+
+    def add(self, key: str) -> None:
+        """Not safe to call from several threads at once; readers may run."""
+        for bit in self._positions(key):
+            self._array[bit >> 3] |= 1 << (bit & 7)
+        self.size += 1
+
+    def __contains__(self, key: str) -> bool:
+        # _positions inlined, the first probe out of the loop: this is the
+        # hot path, and most keys asked about are absent, answered by the
+        # first or second bit.
+        value = hash(key) & _MASK64
+        position, array, bits = value & _MASK32, self._array, self.bits
+        bit = position % bits
+        if not array[bit >> 3] >> (bit & 7) & 1:
+            return False
+        step = (value >> 32) | 1
+        for _ in range(1, self.hashes):
+            position += step
+            bit = position % bits
+            if not array[bit >> 3] >> (bit & 7) & 1:
+                return False
+        return True
+
+    def full(self) -> bool:
+        return self.size >= self.capacity
+
+    def stats(self) -> BloomStats:
+        return BloomStats(self.size, self.capacity, self.bits, self.hashes)
+
+    def _positions(self, key: str) -> list[int]:
+        # The halves of one 64-bit SipHash serve as two hashes; the k bit
+        # positions are first + i * step (Kirsch and Mitzenmacher).
+        value = hash(key) & _MASK64
+        first, step = value & _MASK32, (value >> 32) | 1
+        return [(first + i * step) % self.bits for i in range(self.hashes)]
@@ -0,0 +1,167 @@
+"""
+Compact serialization of cached values.
+
+Dataclasses are written as JSON arrays of their field values in declaration
+order, without field names, and rebuilt without running ``__init__``. Each
+codec has a ``version`` derived from the shape of the type it encodes, so
+renaming, adding or retyping a field changes the cache keys instead of
+misreading entries written by an older release. Large payloads are
+compressed.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import types
+import typing
+import zlib
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Bump when the encoding itself changes.
+FORMAT = 1
+# Payloads at least this long are compressed.
+COMPRESS_MIN_BYTES = 1024
+
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+class Codec(Generic[T]):
+    version: str
+
+    def encode(self, value: T) -> bytes:
+        data = json.dumps(
+            self.dump(value),
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode()
+        if len(data) >= COMPRESS_MIN_BYTES:
+            return _ZLIB + zlib.compress(data, 1)
+        return _RAW + data
+
+    def decode(self, data: bytes) -> T:
+        """Raises ``ValueError`` for data this codec did not write."""
+        flag, payload = data[:1], data[1:]
+        try:
+            if flag == _ZLIB:
+                payload = zlib.decompress(payload)
+            return self.load(json.loads(payload))
+        except (zlib.error, TypeError, IndexError) as exc:
+            raise ValueError(f"Undecodable cache entry: {exc}") from exc
+
+    def dump(self, value: T) -> Any:
+        raise NotImplementedError
+
+    def load(self, data: Any) -> T:
+        raise NotImplementedError
+
+
+class JsonCodec(Codec[Any]):
+    """Values JSON already represents: numbers, strings, lists and dicts."""
+
+    version = f"j{FORMAT}"
+
+    def dump(self, value: Any) -> Any:
+        return value
+
+    def load(self, data: Any) -> Any:
+        return data
+
+
+class DataclassCodec(Codec[T]):
+    """Instances of the dataclass ``cls``, including nested dataclasses."""
+
+    def __init__(self, cls: type[T]):
+        self.cls = cls
+        self._dump = _dumper(cls)
+        self._load = _loader(cls)
+        shape = f"{FORMAT}:{_shape(cls)}"
+        self.version = hashlib.blake2b(shape.encode(), digest_size=4).hexdigest()
+
+    def dump(self, value: T) -> Any:
+        return self._dump(value)
+
+    def load(self, data: Any) -> T:
+        value: T = self._load(data)
+        return value
+
+
+def _hints(cls: type) -> list[tuple[str, Any]]:
+    hints = typing.get_type_hints(cls)
+    return [(f.name, hints[f.name]) for f in dataclasses.fields(cls)]
+
+
+def _optional(hint: Any) -> Any:
+    """``X`` for ``X | None`` and ``Optional[X]``; ``None`` otherwise."""
+    if typing.get_origin(hint) in (typing.Union, types.UnionType):
+        args = [a for a in typing.get_args(hint) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return None
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _dumper(hint: Any) -> Callable[[Any], Any]:
+    inner = _optional(hint)
+    if inner is not None:
+        dump = _dumper(inner)
+        return lambda v: None if v is None else dump(v)
+    if typing.get_origin(hint) in (list, tuple):
+        item, *_ = typing.get_args(hint) or (Any,)
+        dump = _dumper(item)
+        return lambda v: [dump(i) for i in v]
+    if hint is datetime:
+        return lambda v: v.isoformat()
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        fields = [(name, _dumper(h)) for name, h in _hints(hint)]
+        return lambda v: [dump(getattr(v, name)) for name, dump in fields]
+    return _identity
+
+
+def _loader(hint: Any) -> Callable[[Any], Any]:
+    inner = _optional(hint)
+    if inner is not None:
+        load = _loader(inner)
+        return lambda v: None if v is None else load(v)
+    origin = typing.get_origin(hint)
+    if origin in (list, tuple):
+        item, *_ = typing.get_args(hint) or (Any,)
+        load = _loader(item)
+        return lambda v: origin(load(i) for i in v)
+    if hint is datetime:
+        return datetime.fromisoformat
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        fields = [(name, _loader(h)) for name, h in _hints(hint)]
+
+        def load_dataclass(values: list[Any]) -> Any:
+            # Skip __init__: the values were valid when the object was cached,
+            # and fields like ``PostModel.slug`` are not init arguments.
+            obj = object.__new__(hint)
+            for (name, load), value in zip(fields, values):
+                obj.__dict__[name] = load(value)
+            return obj
+
+        return load_dataclass
+    return _identity
+
+
+def _shape(hint: Any) -> str:
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        fields = ",".join(f"{name}:{_shape(h)}" for name, h in _hints(hint))
+        return f"{hint.__qualname__}({fields})"
+    args = typing.get_args(hint)
+    if args:
+        origin = typing.get_origin(hint)
+        return f"{getattr(origin, '__name__', origin)}[{','.join(map(_shape, args))}]"
+    return getattr(hint, "__name__", repr(hint))
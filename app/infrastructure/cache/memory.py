@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from collections.abc import Sequence
+from dataclasses import asdict
+from typing import Any
+
+from app.infrastructure.cache.backend import CacheBackend
+from app.infrastructure.cache.lru import LRUCache
+
+
+class MemoryBackend(CacheBackend):
+    """
+    Cache private to this process, bounded to ``max_entries``.
+
+    Nothing is shared between workers: each keeps its own copy and only
+    sees its own invalidations.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int):
+        self.entries: LRUCache[str, bytes] = LRUCache(max_entries, ttl=0)
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        found = {}
+        for key in keys:
+            value = self.entries.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def set_many(self, items: Mapping[str, bytes], ttl: float) -> None:
+        for key, value in items.items():
+            self.entries.set(key, value, ttl=ttl)
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        self.entries.delete(*keys)
+
+    # Nothing to wait for, so no worker thread either.
+    async def get_many_async(self, keys: Sequence[str]) -> dict[str, bytes]:
+        return self.get_many(keys)
+
+    async def set_many_async(self, items: Mapping[str, bytes], ttl: float) -> None:
+        self.set_many(items, ttl)
+
+    async def delete_many_async(self, keys: Sequence[str]) -> None:
+        self.delete_many(keys)
+
+    def stats(self) -> dict[str, Any]:
+        return asdict(self.entries.stats())
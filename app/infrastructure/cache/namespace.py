@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Collection
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Generic
+from typing import TypeVar
+
+from app.infrastructure.cache.backend import CacheBackend
+from app.infrastructure.cache.backend import CacheUnavailableError
+from app.infrastructure.cache.codec import Codec
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class NamespaceStats:
+    hits: int
+    misses: int
+    errors: int
+
+
+class CacheNamespace(Generic[K, V]):
+    """
+    One kind of value in a shared ``CacheBackend``.
+
+    Keys are stored as ``<prefix>:<name>:<codec version>:<key>``, so
+    namespaces never collide and a change to the cached type makes entries
+    written by other releases unreachable rather than misread. An
+    unavailable backend reads as a miss and drops writes: the cache can only
+    make requests faster, never fail them.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        name: str,
+        codec: Codec[V],
+        ttl: float,
+        prefix: str = "",
+    ):
+        self.backend = backend
+        self.name = name
+        self.codec = codec
+        self.ttl = ttl
+        self._prefix = f"{prefix}:{name}:{codec.version}:"
+        self._hits = self._misses = self._errors = 0
+
+    def key(self, key: K) -> str:
+        return f"{self._prefix}{key}"
+
+    def get(self, key: K) -> V | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Collection[K]) -> dict[K, V]:
+        if not keys:
+            return {}
+        names = {self.key(k): k for k in keys}
+        try:
+            found = self.backend.get_many(list(names))
+        except CacheUnavailableError as exc:
+            self._failed("read", exc)
+            found = {}
+        return self._decode(names, found)
+
+    async def get_async(self, key: K) -> V | None:
+        names = {self.key(key): key}
+        try:
+            found = await self.backend.get_many_async(list(names))
+        except CacheUnavailableError as exc:
+            self._failed("read", exc)
+            found = {}
+        return self._decode(names, found).get(key)
+
+    def _decode(self, names: dict[str, K], found: dict[str, bytes]) -> dict[K, V]:
+        values: dict[K, V] = {}
+        for name, data in found.items():
+            try:
+                values[names[name]] = self.codec.decode(data)
+            except ValueError:
+                logger.warning("Dropping undecodable cache entry %s", name)
+        self._hits += len(values)
+        self._misses += len(names) - len(values)
+        return values
+
+    def set(self, key: K, value: V) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: Mapping[K, V]) -> None:
+        if not items:
+            return
+        encoded = {self.key(k): self.codec.encode(v) for k, v in items.items()}
+        try:
+            self.backend.set_many(encoded, self.ttl)
+        except CacheUnavailableError as exc:
+            self._failed("write", exc)
+
+    async def set_async(self, key: K, value: V) -> None:
+        try:
+            await self.backend.set_many_async(
+                {self.key(key): self.codec.encode(value)}, self.ttl
+            )
+        except CacheUnavailableError as exc:
+            self._failed("write", exc)
+
+    def delete(self, *keys: K) -> None:
+        if not keys:
+            return
+        try:
+            self.backend.delete_many([self.key(k) for k in keys])
+        except CacheUnavailableError as exc:
+            # The entries stay readable until they expire.
+            self._failed("invalidation", exc)
+
+    def stats(self) -> NamespaceStats:
+        return NamespaceStats(self._hits, self._misses, self._errors)
+
+    def _failed(self, operation: str, exc: CacheUnavailableError) -> None:
+        self._errors += 1
+        logger.warning("Cache %s failed in namespace %r: %s", operation, self.name, exc)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from collections.abc import Sequence
+
+from sqlalchemy.util.concurrency import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+from app.infrastructure.cache.backend import CacheBackend
+from app.infrastructure.cache.backend import unavailable_on
+
+try:
+    import redis
+    import redis.asyncio
+except ImportError:
+    redis = None
+
+
+class RedisBackend(CacheBackend):
+    """
+    Cache on a server speaking the Redis protocol (Redis, Valkey, KeyDB...),
+    shared by every worker and pod.
+
+    Coroutines use the ``_async`` methods, served by an asyncio client, so
+    waiting on the server never blocks the event loop. So do repositories
+    running under ``AsyncSession.run_sync``: in that greenlet the blocking
+    methods await the asyncio client the way the database driver does.
+    Anywhere else (worker threads, scripts) they use a blocking client.
+    ``timeout`` bounds how long an unreachable server is waited for before
+    the cache is skipped.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, timeout: float):
+        if redis is None:
+            raise RuntimeError(
+                "CACHE_URL points to a Redis server but the 'redis' package is "
+                "not installed; install the 'redis' extra"
+            )
+        options = {"socket_timeout": timeout, "socket_connect_timeout": timeout}
+        self.client = redis.Redis.from_url(url, **options)
+        self.async_client = redis.asyncio.Redis.from_url(url, **options)
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        if in_greenlet():
+            return await_only(self.get_many_async(keys))
+        if not keys:
+            return {}
+        with unavailable_on(redis.RedisError):
+            values = self.client.mget(keys)
+        return {k: v for k, v in zip(keys, values) if v is not None}
+
+    def set_many(self, items: Mapping[str, bytes], ttl: float) -> None:
+        if in_greenlet():
+            return await_only(self.set_many_async(items, ttl))
+        if not items:
+            return
+        with unavailable_on(redis.RedisError):
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(key, value, px=_milliseconds(ttl))
+            pipe.execute()
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        if in_greenlet():
+            return await_only(self.delete_many_async(keys))
+        if not keys:
+            return
+        with unavailable_on(redis.RedisError):
+            self.client.delete(*keys)
+
+    async def get_many_async(self, keys: Sequence[str]) -> dict[str, bytes]:
+        if not keys:
+            return {}
+        with unavailable_on(redis.RedisError):
+            values = await self.async_client.mget(keys)
+        return {k: v for k, v in zip(keys, values) if v is not None}
+
+    async def set_many_async(self, items: Mapping[str, bytes], ttl: float) -> None:
+        if not items:
+            return
+        with unavailable_on(redis.RedisError):
+            pipe = self.async_client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(key, value, px=_milliseconds(ttl))
+            await pipe.execute()
+
+    async def delete_many_async(self, keys: Sequence[str]) -> None:
+        if not keys:
+            return
+        with unavailable_on(redis.RedisError):
+            await self.async_client.delete(*keys)
+
+    def close(self) -> None:
+        # The asyncio client's connections belong to the event loop and are
+        # closed with it.
+        self.client.close()
+
+
+def _milliseconds(ttl: float) -> int:
+    return max(1, int(ttl * 1000))
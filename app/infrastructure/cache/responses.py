@@ -0,0 +1,103 @@
+"""
+Rendered API responses, in the shared cache backend.
+
+Entries are not invalidated one by one: a response may list any post, tag
+or category, so any write to one of them retires every cached response at
+once. Keys are prefixed with a generation stored in the backend itself;
+invalidating writes a new generation, which makes every older entry
+unreachable until it expires. Readers pass the generation they read to
+``put``, so a response rendered before a write committed is stored under the
+old generation and never served after it.
+"""
+
+from __future__ import annotations
+
+import json
+import secrets
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import Settings
+from app.infrastructure.cache import shared
+from app.infrastructure.cache.codec import Codec
+from app.infrastructure.cache.codec import JsonCodec
+from app.infrastructure.cache.namespace import CacheNamespace
+from app.infrastructure.database.changes import CATEGORIES
+from app.infrastructure.database.changes import POSTS
+from app.infrastructure.database.changes import TAGS
+from app.infrastructure.database.changes import subscribe
+
+# Generations outlive any response; they only need to be replaced by writes.
+GENERATION_TTL_SECONDS = 24 * 60 * 60
+_GENERATION = "current"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+    def header(self, name: str) -> str | None:
+        name = name.lower()
+        return next((v for k, v in self.headers if k.lower() == name), None)
+
+
+class ResponseCodec(Codec[CachedResponse]):
+    """Status and headers as a JSON line, followed by the body as is."""
+
+    version = "r1"
+
+    def encode(self, value: CachedResponse) -> bytes:
+        meta = json.dumps([value.status, value.headers], separators=(",", ":"))
+        return meta.encode() + b"\n" + value.body
+
+    def decode(self, data: bytes) -> CachedResponse:
+        meta, _, body = data.partition(b"\n")
+        try:
+            status, headers = json.loads(meta)
+            return CachedResponse(status, [(k, v) for k, v in headers], body)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Undecodable cached response: {exc}") from exc
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        responses: CacheNamespace[str, CachedResponse],
+        generations: CacheNamespace[str, Any],
+    ):
+        self.responses = responses
+        self.generations = generations
+
+    # Reads and stores are awaited by the middleware; invalidation runs in
+    # the commit hooks, with the rest of the unit of work.
+    async def generation(self) -> str:
+        generation = await self.generations.get_async(_GENERATION)
+        if not isinstance(generation, str):
+            generation = secrets.token_hex(8)
+            await self.generations.set_async(_GENERATION, generation)
+        return generation
+
+    async def get(self, generation: str, key: str) -> CachedResponse | None:
+        return await self.responses.get_async(f"{generation}:{key}")
+
+    async def put(self, generation: str, key: str, response: CachedResponse) -> None:
+        await self.responses.set_async(f"{generation}:{key}", response)
+
+    def invalidate(self, keys: Iterable[Any] = ()) -> None:
+        self.generations.set(_GENERATION, secrets.token_hex(8))
+
+
+settings = Settings()
+
+response_cache = ResponseCache(
+    shared.namespace(
+        "response", ResponseCodec(), ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+    ),
+    shared.namespace("response-generation", JsonCodec(), ttl=GENERATION_TTL_SECONDS),
+)
+
+for topic in (POSTS, TAGS, CATEGORIES):
+    subscribe(topic, response_cache.invalidate)
@@ -0,0 +1,44 @@
+"""The cache backend selected by ``CACHE_URL``, shared by this process."""
+
+from __future__ import annotations
+
+from urllib.parse import urlsplit
+
+from app.core.config import Settings
+from app.infrastructure.cache.backend import CacheBackend
+from app.infrastructure.cache.codec import Codec
+from app.infrastructure.cache.memory import MemoryBackend
+from app.infrastructure.cache.namespace import CacheNamespace
+from app.infrastructure.cache.redis import RedisBackend
+from app.infrastructure.cache.sqlite import SQLiteBackend
+
+
+def open_backend(url: str, max_entries: int, timeout: float) -> CacheBackend:
+    """
+    ``memory://``, ``redis://``/``rediss://``/``unix://`` or
+    ``sqlite:///<path>``.
+    """
+    scheme = urlsplit(url).scheme
+    if scheme == "memory":
+        return MemoryBackend(max_entries)
+    if scheme in ("redis", "rediss", "unix"):
+        return RedisBackend(url, timeout)
+    if scheme == "sqlite":
+        path = url.removeprefix("sqlite://").removeprefix("/")
+        if not path or path == ":memory:":
+            raise ValueError("CACHE_URL: a SQLite cache needs a file path")
+        return SQLiteBackend(path, timeout)
+    raise ValueError(f"CACHE_URL: unsupported cache backend {scheme!r}")
+
+
+settings = Settings()
+
+backend = open_backend(
+    settings.CACHE_URL,
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    timeout=settings.CACHE_TIMEOUT_SECONDS,
+)
+
+
+def namespace(name: str, codec: Codec, ttl: float) -> CacheNamespace:
+    return CacheNamespace(backend, name, codec, ttl, prefix=settings.CACHE_KEY_PREFIX)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from collections.abc import Sequence
+
+from app.infrastructure.cache.backend import CacheBackend
+from app.infrastructure.cache.backend import unavailable_on
+
+# Keys per statement, well under SQLite's bound-parameter limit.
+BATCH_SIZE = 500
+# Expired rows are purged once every this many writes.
+PURGE_EVERY = 1_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    Cache kept in a SQLite file, shared by every process that opens it.
+
+    A stand-in for a cache server on a single host, in tests and wherever
+    there is no network. The file is in WAL mode so that readers never wait
+    for a writer. Each thread gets its own connection.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, timeout: float):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+        now = time.time()
+        with unavailable_on(sqlite3.Error):
+            for start in range(0, len(keys), BATCH_SIZE):
+                batch = keys[start : start + BATCH_SIZE]
+                marks = ",".join("?" * len(batch))
+                found.update(
+                    self._connection().execute(
+                        f"SELECT key, value FROM cache "
+                        f"WHERE key IN ({marks}) AND expires_at > ?",
+                        [*batch, now],
+                    )
+                )
+        return found
+
+    def set_many(self, items: Mapping[str, bytes], ttl: float) -> None:
+        if not items:
+            return
+        expires_at = time.time() + ttl
+        with unavailable_on(sqlite3.Error), self._connection() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                [(key, value, expires_at) for key, value in items.items()],
+            )
+            self._writes += len(items)
+            if self._writes >= PURGE_EVERY:
+                self._writes = 0
+                db.execute("DELETE FROM cache WHERE expires_at <= ?", [time.time()])
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        if not keys:
+            return
+        with unavailable_on(sqlite3.Error), self._connection() as db:
+            db.executemany("DELETE FROM cache WHERE key = ?", [(k,) for k in keys])
+
+    def close(self) -> None:
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+    def _connection(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=self.timeout)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(SCHEMA)
+            self._local.db = db
+        return db
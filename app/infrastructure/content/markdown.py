@@ -0,0 +1,122 @@
+"""
+Post content: Markdown rendered to HTML once, when a post is written.
+
+``render`` is pure and deterministic for a given ``RENDER_VERSION``, so a
+stored rendering is as good as a fresh one until the renderer changes. Bump
+``RENDER_VERSION`` with any change to the output; stored renderings of older
+versions are then ignored and rebuilt in the background.
+
+Raw HTML in the Markdown is escaped, not passed through: the output is safe
+to insert into a page as is.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
+
+from app.core.config import Settings
+from app.domain.models.post import RenderedContent
+from app.infrastructure.feeds.render import excerpt
+
+RENDER_VERSION = 1
+WORDS_PER_MINUTE = 200
+WORD = re.compile(r"\w+(?:['’-]\w+)*")
+
+logger = logging.getLogger(__name__)
+
+_markdown = (
+    MarkdownIt("commonmark", {"html": False}).enable("table").enable("strikethrough")
+)
+
+
+def render(content: str) -> RenderedContent:
+    tokens = _markdown.parse(content)
+    html = _markdown.renderer.render(tokens, _markdown.options, {})
+    prose, code = _text(tokens)
+    word_count = len(WORD.findall(prose)) + len(WORD.findall(code))
+    return RenderedContent(
+        html=html,
+        excerpt=excerpt(prose),
+        word_count=word_count,
+        reading_time=math.ceil(word_count / WORDS_PER_MINUTE),
+        version=RENDER_VERSION,
+    )
+
+
+def _text(tokens: list[Token]) -> tuple[str, str]:
+    """Plain text of the paragraphs, headings and lists, and of the code."""
+    prose: list[str] = []
+    code: list[str] = []
+    for token in tokens:
+        if token.type in ("fence", "code_block"):
+            code.append(token.content)
+        elif token.type == "inline":
+            for child in token.children or ():
+                if child.type in ("text", "code_inline"):
+                    prose.append(child.content)
+                elif child.type in ("softbreak", "hardbreak"):
+                    prose.append(" ")
+            prose.append("\n")
+    return "".join(prose), "\n".join(code)
+
+
+class MarkdownRenderer:
+    """
+    ``render`` for async callers.
+
+    Contents up to ``inline_max_chars`` render in place, which takes well
+    under a millisecond. Longer ones go to a pool of ``workers`` processes,
+    so that a long document neither blocks the event loop nor contends for
+    the GIL with the requests it serves; with no workers everything renders
+    in place. The pool is started on first use.
+    """
+
+    def __init__(self, inline_max_chars: int, workers: int):
+        self.inline_max_chars = inline_max_chars
+        self.workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+
+    async def render(self, content: str) -> RenderedContent:
+        if self.workers <= 0 or len(content) <= self.inline_max_chars:
+            return render(content)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor(), render, content)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a new pool next
+            # time and do not fail the write meanwhile.
+            logger.warning("Markdown render pool broke; rendering in process")
+            self._pool = None
+            return render(content)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawned, not forked: the server process runs threads and holds
+            # connections that a fork would copy.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+
+settings = Settings()
+
+markdown_renderer = MarkdownRenderer(
+    inline_max_chars=settings.MARKDOWN_INLINE_MAX_CHARS,
+    workers=settings.MARKDOWN_RENDER_WORKERS,
+)
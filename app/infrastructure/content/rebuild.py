@@ -0,0 +1,85 @@
+"""
+Render again, in the background, the posts whose stored rendering is
+missing (e.g. imported posts) or was produced by an older renderer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from app.application.services.post import ListStaleRenderings
+from app.application.services.post import SaveRenderings
+from app.core.config import Settings
+from app.infrastructure.content.markdown import markdown_renderer
+from app.infrastructure.content.markdown import MarkdownRenderer
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.database.async_bridge import RunSyncService
+from app.infrastructure.repositories.sqlalchemy.post import SqlAlchemyPostRepository
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class RenderingRebuild:
+    """
+    At most one rebuild runs per process. Scheduling while one runs makes it
+    go over the posts once more when done, to pick up posts written since it
+    passed them.
+    """
+
+    def __init__(self, renderer: MarkdownRenderer, batch_size: int):
+        self.renderer = renderer
+        self.batch_size = batch_size
+        self._task: asyncio.Task[None] | None = None
+        self._again = False
+
+    def schedule(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._again = True
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            self._again = False
+            try:
+                stored = await self.rebuild()
+                if stored:
+                    logger.info("Rendered %d posts", stored)
+            except Exception:
+                logger.exception("Rendering posts in the background failed")
+            if not self._again:
+                return
+
+    async def rebuild(self) -> int:
+        """Render every stale post, a batch at a time; returns how many."""
+        stored = 0
+        after_id = 0
+        while True:
+            async with AsyncSessionLocal() as session:
+                stale = await RunSyncService(
+                    session,
+                    lambda s: ListStaleRenderings(SqlAlchemyPostRepository(s)),
+                ).execute(self.batch_size, after_id)
+            if not stale:
+                return stored
+
+            rendered = []
+            for post in stale:
+                rendered.append(await self.renderer.render(post.content))
+                # Let requests through between posts rendered in process.
+                await asyncio.sleep(0)
+
+            async with AsyncSessionLocal() as session:
+                stored += await RunSyncService(
+                    session, lambda s: SaveRenderings(SqlAlchemyUnitOfWork(s))
+                ).execute(list(zip(stale, rendered)))
+            after_id = stale[-1].id
+
+
+settings = Settings()
+
+rendering_rebuild = RenderingRebuild(
+    markdown_renderer, batch_size=settings.MARKDOWN_REBUILD_BATCH_SIZE
+)
@@ -4,30 +4,37 @@ from datetime import datetime, timezone
 import logging
 
 from sqlalchemy import DateTime, create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
 
 from ...core.config import Settings
+from .routing import ReplicaPool, RoutingSession
 
 
 class Base(DeclarativeBase):
     pass
 
 
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class TimestampMixin:
     """Mixin to add id, created_at and updated_at columns.
-    Created_at and updated_at are UTC timezone.
+    Created_at and updated_at are UTC timezone, taken when each row is
+    inserted or updated.
     """
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.now(timezone.utc),
+        default=utc_now,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        default=utc_now,
+        onupdate=utc_now,
     )
 
 
@@ -38,13 +45,40 @@ logger = logging.getLogger("sqlalchemy.engine")
 logger.warning(f"Database connection string: {config.connection_string}")
 
 
+POOL_OPTIONS = {
+    "pool_size": 5,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_recycle": 1800,
+}
+
 engine = create_engine(
     config.connection_string,
     connect_args={"check_same_thread": False} if config.is_sqlite else {},
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
-    pool_recycle=1800,
+    **POOL_OPTIONS,
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Native asyncio engine (asyncpg / aiosqlite) used by the async route handlers.
+async_engine = create_async_engine(config.async_connection_string, **POOL_OPTIONS)
+
+replica_engines = [
+    create_async_engine(url, **POOL_OPTIONS)
+    for url in config.async_replica_connection_strings
+]
+
+replicas = ReplicaPool(
+    [e.sync_engine for e in replica_engines],
+    max_lag=config.DATABASE_REPLICA_MAX_LAG_SECONDS,
+    retry_after=config.DATABASE_REPLICA_RETRY_SECONDS,
+    check_interval=config.DATABASE_REPLICA_CHECK_INTERVAL_SECONDS,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    sync_session_class=RoutingSession,
+    replicas=replicas,
+    autoflush=False,
+    expire_on_commit=False,
+)
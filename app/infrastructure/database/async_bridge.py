@@ -0,0 +1,111 @@
+"""
+Run the synchronous repositories and services on an ``AsyncSession``.
+
+``AsyncSession.run_sync`` executes plain ORM code inside a greenlet whose IO
+is awaited on the event loop by the async driver (asyncpg / aiosqlite). The
+repository and service code is therefore shared by the sync and async paths,
+while async handlers neither block the loop nor hop to a worker thread.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterator
+from itertools import islice
+from typing import Any
+from typing import TypeVar
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.application.services import AsyncService
+from app.application.services import AsyncStreamService
+from app.application.services import Service
+from app.infrastructure.database.routing import retry_on_primary
+from app.infrastructure.database.routing import use_replica
+
+T = TypeVar("T")
+
+
+async def _run_sync(session: AsyncSession, fn: Callable[[Session], T]) -> T:
+    try:
+        return await session.run_sync(fn)
+    except DBAPIError as exc:
+        # A replica failed mid-read: run the work again on the primary.
+        if not retry_on_primary(session.sync_session, exc):
+            raise
+        await session.rollback()
+        return await session.run_sync(fn)
+
+
+class RunSyncService(AsyncService):
+    """
+    Async variant of a use case built from the session.
+
+    ``factory`` receives the sync view of the ``AsyncSession`` and returns the
+    service to execute, wired with its repositories. With ``end_transaction``
+    the transaction is rolled back once the service returns, giving the
+    connection back to the pool for a caller with slow work left to do.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        factory: Callable[[Session], Service],
+        end_transaction: bool = False,
+    ):
+        self.session = session
+        self.factory = factory
+        self.end_transaction = end_transaction
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        def run(session: Session) -> Any:
+            return self.factory(session).execute(*args, **kwargs)
+
+        try:
+            return await _run_sync(self.session, run)
+        finally:
+            if self.end_transaction:
+                await self.session.rollback()
+
+
+class RunSyncStream(AsyncStreamService[Any]):
+    """
+    Async iteration over a use case that returns a lazy iterator.
+
+    The sync iterator is advanced one chunk per ``run_sync`` call, so its
+    cursor stays open across awaits and rows reach the caller as they are
+    read. A response body outlives the request's dependencies, so the stream
+    opens and closes its own session from ``session_factory``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        factory: Callable[[Session], Service],
+        chunk_size: int,
+        read_only: bool = True,
+    ):
+        self.session_factory = session_factory
+        self.factory = factory
+        self.chunk_size = chunk_size
+        self.read_only = read_only
+
+    async def execute(self, *args: Any, **kwargs: Any) -> AsyncIterator[list[Any]]:
+        async with self.session_factory() as session:
+            use_replica(session.sync_session, self.read_only)
+
+            def start(s: Session) -> tuple[Iterator[Any], list[Any]]:
+                items = iter(self.factory(s).execute(*args, **kwargs))
+                return items, list(islice(items, self.chunk_size))
+
+            # Only the first chunk can move to the primary: once rows have
+            # been handed out the stream cannot be restarted.
+            items, chunk = await _run_sync(session, start)
+            while chunk:
+                yield chunk
+                chunk = await session.run_sync(
+                    lambda _: list(islice(items, self.chunk_size))
+                )
@@ -0,0 +1,61 @@
+"""
+Tell in-process listeners which rows a committed transaction changed.
+
+Repositories call ``record_change`` as they write; the keys are collected on
+the session and handed to the topic's subscribers once the transaction
+commits. A rollback discards them, so listeners never hear of changes that
+were not persisted.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Hashable
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+CHANGES = "changes"
+CATEGORIES = "categories"
+POSTS = "posts"
+TAGS = "tags"
+TOKENS = "tokens"
+USERS = "users"
+
+Subscriber = Callable[[set[Any]], None]
+
+_subscribers: dict[str, list[Subscriber]] = defaultdict(list)
+
+
+def subscribe(topic: str, callback: Subscriber) -> None:
+    """Call ``callback`` with the changed keys after each commit touching ``topic``."""
+    _subscribers[topic].append(callback)
+
+
+def record_change(session: Session, topic: str, *keys: Hashable) -> None:
+    session.info.setdefault(CHANGES, defaultdict(set))[topic].update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch(session: Session) -> None:
+    changes = session.info.pop(CHANGES, None)
+    if not changes:
+        return
+    for topic, keys in changes.items():
+        for callback in _subscribers.get(topic, ()):
+            try:
+                callback(keys)
+            except Exception:
+                # The transaction is already committed; a failing listener
+                # must not turn it into an error for the caller.
+                logger.exception("Change listener for %s failed", topic)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(CHANGES, None)
@@ -2,10 +2,21 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table, Text
+from sqlalchemy import (
+    DDL,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+    event,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.infrastructure.database import Base, TimestampMixin
+from app.infrastructure.database import Base, TimestampMixin, utc_now
 
 post_tags = Table(
     "post_tags",
@@ -27,6 +38,26 @@ class User(TimestampMixin, Base):
         index=True,
     )
     hashed_password: Mapped[str] = mapped_column(String(256), nullable=False)
+    # Carried by every token issued to the user; bumping it revokes them all.
+    token_version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
+
+class RevokedToken(Base):
+    """Tokens revoked before they expire, by their ``jti`` claim"""
+
+    __tablename__ = "revoked_tokens"
+
+    jti: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # Rows are useless once the token has expired and are purged.
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=utc_now, index=True
+    )
 
 
 class Category(TimestampMixin, Base):
@@ -66,9 +97,95 @@ class Post(TimestampMixin, Base):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     status: Mapped[str] = mapped_column(String(20), default="draft")  # draft/published
     published_at: Mapped[datetime | None] = mapped_column(DateTime)
+    # ``content`` rendered at write time; NULL until rendered.
+    content_html: Mapped[str | None] = mapped_column(Text)
+    excerpt: Mapped[str | None] = mapped_column(Text)
+    word_count: Mapped[int | None] = mapped_column(Integer)
+    reading_time: Mapped[int | None] = mapped_column(Integer)
+    render_version: Mapped[int | None] = mapped_column(Integer)
 
     category: Mapped[Category | None] = relationship(back_populates="posts")
     tags: Mapped[list[Tag]] = relationship(
         secondary=post_tags,
         back_populates="posts",
     )
+
+
+# Keyset pagination sort key for post listings: newest first, drafts last.
+Index(
+    "ix_posts_published_at_id",
+    Post.published_at.desc().nulls_last(),
+    Post.id.desc(),
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_posts_published_at_id",
+    Post.published_at.desc(),
+    Post.id.desc(),
+).ddl_if(dialect="sqlite")
+
+# Filtered feeds: the equality filters first, then the same sort key, so a
+# feed page is a range scan of the index with no sort step.
+for name, prefix in (
+    ("ix_posts_status_published_at", (Post.status,)),
+    ("ix_posts_category_status_published_at", (Post.category_id, Post.status)),
+):
+    Index(
+        name,
+        *prefix,
+        Post.published_at.desc().nulls_last(),
+        Post.id.desc(),
+    ).ddl_if(dialect="postgresql")
+    Index(
+        name,
+        *prefix,
+        Post.published_at.desc(),
+        Post.id.desc(),
+    ).ddl_if(dialect="sqlite")
+
+# Tag -> posts; the primary key only serves post -> tags.
+Index("ix_post_tags_tag_id_post_id", post_tags.c.tag_id, post_tags.c.post_id)
+
+
+# Full-text search over posts. PostgreSQL keeps a weighted tsvector in a
+# generated column with a GIN index; SQLite keeps an external-content FTS5
+# table in sync with triggers. Neither is mapped: queries reference them
+# directly (see repositories/sqlalchemy/search.py).
+for statement in (
+    "ALTER TABLE posts ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'B')) STORED",
+    "CREATE INDEX ix_posts_search_vector ON posts USING GIN (search_vector)",
+):
+    event.listen(
+        Post.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
+
+for statement in (
+    "CREATE VIRTUAL TABLE posts_fts USING fts5("
+    "title, content, content='posts', content_rowid='id', "
+    "tokenize='porter unicode61')",
+    "CREATE TRIGGER posts_fts_ai AFTER INSERT ON posts BEGIN "
+    "INSERT INTO posts_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER posts_fts_ad AFTER DELETE ON posts BEGIN "
+    "INSERT INTO posts_fts(posts_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER posts_fts_au AFTER UPDATE OF title, content ON posts BEGIN "
+    "INSERT INTO posts_fts(posts_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO posts_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+):
+    event.listen(
+        Post.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="sqlite"),
+    )
+
+event.listen(
+    Post.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS posts_fts").execute_if(dialect="sqlite"),
+)
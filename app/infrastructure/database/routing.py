@@ -0,0 +1,171 @@
+"""
+Send read-only work to replicas and everything else to the primary.
+
+``RoutingSession`` is the sync session behind ``AsyncSessionLocal``. A
+session only reads from a replica once it has been marked read-only with
+``use_replica`` (``get_async_db`` does so for GET and HEAD requests). The
+first statement that is not a plain SELECT, and every flush, pins the
+session to the primary for the rest of its life, so a request always reads
+its own writes.
+
+Replicas whose replication lag exceeds the configured maximum, or that
+fail to answer, are skipped for a while and reads fall back to the primary.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Engine
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+USE_REPLICA = "use_replica"
+PINNED = "pinned_to_primary"
+REPLICA = "replica"
+
+# Seconds the replica is behind the primary; 0 while it has replayed
+# everything it received, so an idle primary does not look like lag.
+PG_REPLICATION_LAG = text(
+    "SELECT CASE"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+class Replica:
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.checked_at = float("-inf")
+        self.down_until = 0.0
+
+
+class ReplicaPool:
+    """
+    Round-robin over the replicas that are reachable and caught up.
+
+    Each replica's lag is measured at most once per ``check_interval``
+    seconds, on the first read that picks it after the interval elapsed.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[Engine],
+        max_lag: float,
+        retry_after: float,
+        check_interval: float,
+    ):
+        self.replicas = [Replica(e) for e in engines]
+        self.max_lag = max_lag
+        self.retry_after = retry_after
+        self.check_interval = check_interval
+        self._order = itertools.cycle(range(len(self.replicas)))
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> Engine | None:
+        """Return a usable replica, or ``None`` to read from the primary."""
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._order)]
+            now = time.monotonic()
+            if now < replica.down_until:
+                continue
+            if now - replica.checked_at >= self.check_interval and not self._check(
+                replica
+            ):
+                continue
+            return replica.engine
+        return None
+
+    def mark_down(self, engine: Engine) -> None:
+        for replica in self.replicas:
+            if replica.engine is engine:
+                replica.down_until = time.monotonic() + self.retry_after
+                logger.warning("Replica %s marked down", engine.url)
+
+    def _check(self, replica: Replica) -> bool:
+        replica.checked_at = time.monotonic()
+        try:
+            lag = self._lag(replica.engine)
+        except (DBAPIError, OSError):
+            logger.exception("Replica %s is unreachable", replica.engine.url)
+            self.mark_down(replica.engine)
+            return False
+        if lag > self.max_lag:
+            logger.warning("Replica %s is %.1fs behind", replica.engine.url, lag)
+            replica.down_until = replica.checked_at + self.check_interval
+            return False
+        return True
+
+    @staticmethod
+    def _lag(engine: Engine) -> float:
+        with engine.connect() as conn:
+            if engine.dialect.name != "postgresql":
+                conn.execute(text("SELECT 1"))
+                return 0.0
+            return float(conn.execute(PG_REPLICATION_LAG).scalar_one())
+
+
+class RoutingSession(Session):
+    def __init__(self, *args: Any, replicas: ReplicaPool | None = None, **kw: Any):
+        super().__init__(*args, **kw)
+        self.replicas = replicas
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Any:
+        if not self._reads_from_replica(clause):
+            return super().get_bind(mapper, clause=clause, **kw)
+        if REPLICA not in self.info:
+            # One replica per session keeps the reads of a request consistent.
+            self.info[REPLICA] = self.replicas.choose() if self.replicas else None
+        return self.info[REPLICA] or super().get_bind(mapper, clause=clause, **kw)
+
+    def _reads_from_replica(self, clause: Any) -> bool:
+        if not self.info.get(USE_REPLICA) or self.info.get(PINNED):
+            return False
+        if clause is None and not self._flushing:
+            # Not a statement, e.g. a lookup of the dialect.
+            return False
+        is_read = (
+            not self._flushing
+            and getattr(clause, "is_select", False)
+            and getattr(clause, "_for_update_arg", None) is None
+        )
+        if not is_read:
+            self.info[PINNED] = True
+        return is_read
+
+
+def use_replica(session: Session, enabled: bool = True) -> None:
+    """Allow ``session`` to serve its reads from a replica."""
+    session.info[USE_REPLICA] = enabled
+
+
+def retry_on_primary(session: Session, exc: BaseException) -> bool:
+    """
+    Prepare ``session`` to rerun its work on the primary after ``exc``.
+
+    Only read-only sessions that were using a replica are retried; the
+    replica is taken out of rotation and the session is pinned to the
+    primary. Returns whether the caller should retry.
+    """
+    replica = session.info.get(REPLICA)
+    if (
+        replica is None
+        or session.info.get(PINNED)
+        or not isinstance(exc, DBAPIError)
+        or not isinstance(session, RoutingSession)
+        or session.replicas is None
+    ):
+        return False
+    session.replicas.mark_down(replica)
+    session.info[PINNED] = True
+    return True
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
 from collections.abc import Generator
 
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.infrastructure.database import AsyncSessionLocal
 from app.infrastructure.database import SessionLocal
+from app.infrastructure.database.routing import use_replica
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD"})
 
 
 def get_db() -> Generator[Session]:
@@ -13,3 +20,9 @@ def get_db() -> Generator[Session]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        use_replica(db.sync_session, request.method in READ_ONLY_METHODS)
+        yield db
@@ -7,6 +7,9 @@ from app.infrastructure.repositories.sqlalchemy.category import (
 )
 from app.infrastructure.repositories.sqlalchemy.post import SqlAlchemyPostRepository
 from app.infrastructure.repositories.sqlalchemy.tag import SqlAlchemyTagRepository
+from app.infrastructure.repositories.sqlalchemy.token import (
+    SqlAlchemyRevokedTokenRepository,
+)
 from app.infrastructure.repositories.sqlalchemy.user import SqlAlchemyUserRepository
 
 
@@ -38,3 +41,12 @@ def get_tag_repository(db: Session = Depends(get_db)) -> SqlAlchemyTagRepository
     Dependency to provide a SQLAlchemyTagRepository with a session.
     """
     return SqlAlchemyTagRepository(db)
+
+
+def get_revoked_token_repository(
+    db: Session = Depends(get_db),
+) -> SqlAlchemyRevokedTokenRepository:
+    """
+    Dependency to provide a SqlAlchemyRevokedTokenRepository with a session.
+    """
+    return SqlAlchemyRevokedTokenRepository(db)
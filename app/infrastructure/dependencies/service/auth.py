@@ -1,14 +1,51 @@
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.services import AsyncService
+from app.application.services.auth import GetUserByUsername
 from app.application.services.auth import LoginUser
-from app.domain.repositories.user import UserRepository
-from app.infrastructure.dependencies.respository import get_user_repository
+from app.application.services.auth import RefreshTokens
+from app.application.services.auth import RehashPassword
+from app.application.services.auth import RevokeTokens
+from app.infrastructure.auth.passwords import password_hasher
+from app.infrastructure.database.async_bridge import RunSyncService
+from app.infrastructure.dependencies.database import get_async_db
+from app.infrastructure.repositories.sqlalchemy.user import SqlAlchemyUserRepository
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
 
 
 def get_login_user_service(
-    user_repository: UserRepository = Depends(get_user_repository),
-) -> LoginUser:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a LoginUserService with a repository.
     """
-    return LoginUser(user_repository)
+    return LoginUser(
+        get_user=RunSyncService(
+            db,
+            lambda s: GetUserByUsername(SqlAlchemyUserRepository(s)),
+            end_transaction=True,
+        ),
+        rehash_password=RunSyncService(
+            db, lambda s: RehashPassword(SqlAlchemyUnitOfWork(s))
+        ),
+        passwords=password_hasher,
+    )
+
+
+def get_refresh_tokens_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
+    """
+    Dependency to provide a RefreshTokensService with a unit of work.
+    """
+    return RunSyncService(db, lambda s: RefreshTokens(SqlAlchemyUnitOfWork(s)))
+
+
+def get_revoke_tokens_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
+    """
+    Dependency to provide a RevokeTokensService with a unit of work.
+    """
+    return RunSyncService(db, lambda s: RevokeTokens(SqlAlchemyUnitOfWork(s)))
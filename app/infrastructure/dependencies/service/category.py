@@ -1,3 +1,4 @@
+from app.application.services import AsyncService
 from app.application.services.category import (
     ListCategories,
     CreateCategory,
@@ -7,63 +8,68 @@ from app.application.services.category import (
     DeleteCategory,
 )
 from fastapi import Depends
-from app.infrastructure.dependencies.respository import (
-    get_category_repository,
-)
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.infrastructure.database.async_bridge import RunSyncService
+from app.infrastructure.dependencies.database import get_async_db
 from app.infrastructure.repositories.sqlalchemy.category import (
     SqlAlchemyCategoryRepository,
 )
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
 
 
 def get_create_category_service(
-    repo: SqlAlchemyCategoryRepository = Depends(get_category_repository),
-) -> CreateCategory:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a CategoryService with a repository.
     """
-    return CreateCategory(repo)
+    return RunSyncService(db, lambda s: CreateCategory(SqlAlchemyUnitOfWork(s)))
 
 
 def get_get_category_by_slug_service(
-    repo: SqlAlchemyCategoryRepository = Depends(get_category_repository),
-) -> GetCategoryBySlug:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a CategoryService with a repository.
     """
-    return GetCategoryBySlug(repo)
+    return RunSyncService(
+        db, lambda s: GetCategoryBySlug(SqlAlchemyCategoryRepository(s))
+    )
 
 
 def get_list_category_service(
-    repo: SqlAlchemyCategoryRepository = Depends(get_category_repository),
-) -> ListCategories:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a ListCategoriesService with a repository.
     """
-    return ListCategories(repo)
+    return RunSyncService(db, lambda s: ListCategories(SqlAlchemyCategoryRepository(s)))
 
 
 def get_get_category_by_id_service(
-    repo: SqlAlchemyCategoryRepository = Depends(get_category_repository),
-) -> GetCategoryById:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a GetCategoryByIdService with a repository.
     """
-    return GetCategoryById(repo)
+    return RunSyncService(
+        db, lambda s: GetCategoryById(SqlAlchemyCategoryRepository(s))
+    )
 
 
 def get_update_category_service(
-    repo: SqlAlchemyCategoryRepository = Depends(get_category_repository),
-) -> UpdateCategory:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a UpdateCategoryService with a repository.
     """
-    return UpdateCategory(repo)
+    return RunSyncService(db, lambda s: UpdateCategory(SqlAlchemyCategoryRepository(s)))
 
 
 def get_delete_category_service(
-    repo: SqlAlchemyCategoryRepository = Depends(get_category_repository),
-) -> DeleteCategory:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a DeleteCategoryService with a repository.
     """
-    return DeleteCategory(repo)
+    return RunSyncService(db, lambda s: DeleteCategory(SqlAlchemyUnitOfWork(s)))
@@ -0,0 +1,24 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.services import AsyncService
+from app.application.services.feed import GetFeed
+from app.infrastructure.database.async_bridge import RunSyncService
+from app.infrastructure.database.routing import use_replica
+from app.infrastructure.dependencies.database import get_async_db
+from app.infrastructure.feeds.cache import feed_cache
+from app.infrastructure.repositories.sqlalchemy.post import SqlAlchemyPostRepository
+
+
+def get_feed_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
+    """
+    Dependency to provide a GetFeedService backed by the shared feed cache.
+    """
+    # Refreshes apply changes committed moments ago and are rare: read them
+    # from the primary so a lagging replica cannot be cached as current.
+    use_replica(db.sync_session, False)
+    return RunSyncService(
+        db, lambda s: GetFeed(SqlAlchemyPostRepository(s), feed_cache)
+    )
@@ -1,68 +1,156 @@
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.services import AsyncService, AsyncStreamService
 from app.application.services.post import (
     CreatePost,
     DeletePost,
+    ExportPosts,
     GetPostById,
     GetPostBySlug,
+    GetPostVersion,
+    GetPostVersionBySlug,
+    ImportPosts,
+    ListPostSummaries,
+    ListPostVersions,
     ListPosts,
+    SearchPosts,
     UpdatePost,
 )
-from app.infrastructure.dependencies.respository import (
-    get_post_repository,
-)
+from app.domain.models.post import PostModel
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.database.async_bridge import RunSyncService, RunSyncStream
+from app.infrastructure.dependencies.database import get_async_db
+from app.infrastructure.repositories.cached.post import cached_post_repository
 from app.infrastructure.repositories.sqlalchemy.post import SqlAlchemyPostRepository
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
+
+# Posts handed to the event loop per hop of the export stream.
+EXPORT_CHUNK_SIZE = 100
 
 
 def get_create_post_service(
-    repo: SqlAlchemyPostRepository = Depends(get_post_repository),
-) -> CreatePost:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a PostService with a repository.
     """
-    return CreatePost(repo)
+    return RunSyncService(db, lambda s: CreatePost(SqlAlchemyUnitOfWork(s)))
 
 
 def get_get_post_by_slug_service(
-    repo: SqlAlchemyPostRepository = Depends(get_post_repository),
-) -> GetPostBySlug:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a CategoryService with a repository.
     """
-    return GetPostBySlug(repo)
+    return RunSyncService(
+        db,
+        lambda s: GetPostBySlug(cached_post_repository(SqlAlchemyPostRepository(s))),
+    )
 
 
 def get_list_post_service(
-    repo: SqlAlchemyPostRepository = Depends(get_post_repository),
-) -> ListPosts:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a ListPostsService with a repository.
     """
-    return ListPosts(repo)
+    return RunSyncService(db, lambda s: ListPosts(SqlAlchemyPostRepository(s)))
+
+
+def get_list_post_summary_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
+    """
+    Dependency to provide a ListPostSummariesService with a repository.
+    """
+    return RunSyncService(db, lambda s: ListPostSummaries(SqlAlchemyPostRepository(s)))
+
+
+def get_search_posts_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
+    """
+    Dependency to provide a SearchPostsService with a repository.
+    """
+    return RunSyncService(db, lambda s: SearchPosts(SqlAlchemyPostRepository(s)))
 
 
 def get_get_post_by_id_service(
-    repo: SqlAlchemyPostRepository = Depends(get_post_repository),
-) -> GetPostById:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a GetPostByIdService with a repository.
     """
-    return GetPostById(repo)
+    return RunSyncService(
+        db,
+        lambda s: GetPostById(cached_post_repository(SqlAlchemyPostRepository(s))),
+    )
+
+
+def get_get_post_version_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
+    """
+    Dependency to provide a GetPostVersionService with a repository.
+    """
+    return RunSyncService(db, lambda s: GetPostVersion(SqlAlchemyPostRepository(s)))
+
+
+def get_get_post_version_by_slug_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
+    """
+    Dependency to provide a GetPostVersionBySlugService with a repository.
+    """
+    return RunSyncService(
+        db, lambda s: GetPostVersionBySlug(SqlAlchemyPostRepository(s))
+    )
+
+
+def get_list_post_versions_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
+    """
+    Dependency to provide a ListPostVersionsService with a repository.
+    """
+    return RunSyncService(db, lambda s: ListPostVersions(SqlAlchemyPostRepository(s)))
 
 
 def get_update_post_service(
-    repo: SqlAlchemyPostRepository = Depends(get_post_repository),
-) -> UpdatePost:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a UpdatePostService with a repository.
     """
-    return UpdatePost(repo)
+    return RunSyncService(db, lambda s: UpdatePost(SqlAlchemyUnitOfWork(s)))
 
 
 def get_delete_post_service(
-    repo: SqlAlchemyPostRepository = Depends(get_post_repository),
-) -> DeletePost:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a DeletePostService with a repository.
     """
-    return DeletePost(repo)
+    return RunSyncService(db, lambda s: DeletePost(SqlAlchemyUnitOfWork(s)))
+
+
+def get_import_posts_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
+    """
+    Dependency to provide an ImportPostsService with a repository.
+    """
+    return RunSyncService(db, lambda s: ImportPosts(SqlAlchemyUnitOfWork(s)))
+
+
+def get_export_posts_service() -> AsyncStreamService[PostModel]:
+    """
+    Dependency to provide an ExportPostsService streaming on its own session.
+    """
+    return RunSyncStream(
+        AsyncSessionLocal,
+        lambda s: ExportPosts(SqlAlchemyPostRepository(s)),
+        chunk_size=EXPORT_CHUNK_SIZE,
+    )
@@ -1,5 +1,7 @@
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.application.services import AsyncService
 from app.application.services.tag import (
     CreateTag,
     DeleteTag,
@@ -8,59 +10,61 @@ from app.application.services.tag import (
     ListTags,
     UpdateTag,
 )
-from app.infrastructure.dependencies.respository import get_tag_repository
+from app.infrastructure.database.async_bridge import RunSyncService
+from app.infrastructure.dependencies.database import get_async_db
 from app.infrastructure.repositories.sqlalchemy.tag import SqlAlchemyTagRepository
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
 
 
 def get_create_tag_service(
-    repo: SqlAlchemyTagRepository = Depends(get_tag_repository),
-) -> CreateTag:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a TagService with a repository.
     """
-    return CreateTag(repo)
+    return RunSyncService(db, lambda s: CreateTag(SqlAlchemyUnitOfWork(s)))
 
 
 def get_get_tag_by_slug_service(
-    repo: SqlAlchemyTagRepository = Depends(get_tag_repository),
-) -> GetTagBySlug:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a TagService with a repository.
     """
-    return GetTagBySlug(repo)
+    return RunSyncService(db, lambda s: GetTagBySlug(SqlAlchemyTagRepository(s)))
 
 
 def get_list_tag_service(
-    repo: SqlAlchemyTagRepository = Depends(get_tag_repository),
-) -> ListTags:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a ListTagsService with a repository.
     """
-    return ListTags(repo)
+    return RunSyncService(db, lambda s: ListTags(SqlAlchemyTagRepository(s)))
 
 
 def get_get_tag_by_id_service(
-    repo: SqlAlchemyTagRepository = Depends(get_tag_repository),
-) -> GetTagById:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a GetTagByIdService with a repository.
     """
-    return GetTagById(repo)
+    return RunSyncService(db, lambda s: GetTagById(SqlAlchemyTagRepository(s)))
 
 
 def get_update_tag_service(
-    repo: SqlAlchemyTagRepository = Depends(get_tag_repository),
-) -> UpdateTag:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a UpdateTagService with a repository.
     """
-    return UpdateTag(repo)
+    return RunSyncService(db, lambda s: UpdateTag(SqlAlchemyTagRepository(s)))
 
 
 def get_delete_tag_service(
-    repo: SqlAlchemyTagRepository = Depends(get_tag_repository),
-) -> DeleteTag:
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncService:
     """
     Dependency to provide a DeleteTagService with a repository.
     """
-    return DeleteTag(repo)
+    return RunSyncService(db, lambda s: DeleteTag(SqlAlchemyUnitOfWork(s)))
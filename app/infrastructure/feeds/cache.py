@@ -0,0 +1,198 @@
+"""
+Feeds and sitemap kept as pre-rendered bytes, updated one post at a time.
+
+Every published post keeps its rendered fragments; a document is rebuilt by
+joining them, which never touches the database, and only when it is
+requested after a change. Posts committed through
+``SqlAlchemyPostRepository`` in this process are marked dirty and only those
+are read and rendered again on the next request. Every
+``FEED_REFRESH_SECONDS`` the published posts' stamps are read again so that
+writes made by other processes show up too; only posts whose stamp changed
+are rendered again.
+
+Refreshes run on the event loop thread inside ``run_sync`` and can
+interleave while they wait on the database. A refresh is therefore built
+aside and only published if no other refresh was published meanwhile;
+otherwise its posts are marked dirty again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from bisect import bisect_left
+from bisect import insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import replace
+from datetime import datetime
+from datetime import timezone
+
+from app.core.config import Settings
+from app.domain.models.feed import FeedDocument
+from app.domain.models.feed import FeedKind
+from app.domain.models.post import PostStamp
+from app.domain.repositories.post import PostRepository
+from app.infrastructure.database.changes import POSTS
+from app.infrastructure.database.changes import subscribe
+from app.infrastructure.feeds import render
+from app.infrastructure.feeds.render import Site
+
+# Limit of URLs in a single sitemap file.
+SITEMAP_MAX_URLS = 50_000
+# Beyond this many dirty posts (e.g. after a bulk import) one full read of
+# the stamps is cheaper than a long ``IN`` list.
+MAX_DIRTY_LOOKUP = 1_000
+
+
+def _order(stamp: PostStamp) -> tuple[datetime, int]:
+    return stamp.published_at, stamp.id
+
+
+@dataclass(frozen=True)
+class _Entry:
+    stamp: PostStamp
+    sitemap: bytes
+    # Rendered only once the post is among the newest ``size`` posts.
+    rss: bytes | None = None
+    atom: bytes | None = None
+
+
+@dataclass(frozen=True)
+class _State:
+    stamps: list[PostStamp]  # oldest first
+    entries: dict[int, _Entry]
+    refreshed_at: float
+    # Documents of earlier states, to keep their validators when unchanged.
+    previous: dict[FeedKind, FeedDocument]
+    documents: dict[FeedKind, FeedDocument] = field(default_factory=dict)
+
+    def newest(self, limit: int) -> list[_Entry]:
+        return [self.entries[s.id] for s in reversed(self.stamps[-limit:])]
+
+
+class FeedCache:
+    def __init__(self, site: Site, size: int, refresh_after: float):
+        self.site = site
+        self.size = size
+        self.refresh_after = refresh_after
+        self._state: _State | None = None
+        self._dirty: set[int] = set()
+
+    def invalidate(self, post_ids: Iterable[int]) -> None:
+        self._dirty.update(post_ids)
+
+    def document(self, kind: FeedKind, posts: PostRepository) -> FeedDocument:
+        state = self._state
+        if state is None or self._dirty or self._expired(state):
+            state = self._refresh(posts)
+        if kind not in state.documents:
+            state.documents[kind] = self._render(state, kind)
+        return state.documents[kind]
+
+    def _expired(self, state: _State) -> bool:
+        return time.monotonic() - state.refreshed_at >= self.refresh_after
+
+    def _refresh(self, posts: PostRepository) -> _State:
+        base = self._state
+        dirty, self._dirty = self._dirty, set()
+        try:
+            state = self._build(base, dirty, posts)
+        except BaseException:
+            self._dirty |= dirty
+            raise
+        if self._state is base:
+            self._state = state
+        else:
+            self._dirty |= dirty
+        return state
+
+    def _build(
+        self,
+        base: _State | None,
+        dirty: set[int],
+        posts: PostRepository,
+    ) -> _State:
+        entries = dict(base.entries) if base else {}
+        if base is None or self._expired(base) or len(dirty) > MAX_DIRTY_LOOKUP:
+            refreshed_at = time.monotonic()
+            stamps = posts.get_published_stamps()
+            stamps.reverse()
+            changed = dirty | (entries.keys() - {s.id for s in stamps})
+            changed.update(
+                s.id for s in stamps if s.id not in entries or entries[s.id].stamp != s
+            )
+            fresh = [s for s in stamps if s.id in changed]
+        else:
+            refreshed_at = base.refreshed_at
+            changed = dirty
+            fresh = posts.get_published_stamps(ids=dirty)
+            stamps = list(base.stamps)
+            for post_id in changed & entries.keys():
+                old = entries[post_id].stamp
+                del stamps[bisect_left(stamps, _order(old), key=_order)]
+            for stamp in fresh:
+                insort(stamps, stamp, key=_order)
+
+        for post_id in changed:
+            entries.pop(post_id, None)
+        for stamp in fresh:
+            entries[stamp.id] = _Entry(stamp, render.sitemap_url(self.site, stamp))
+
+        missing = [s.id for s in stamps[-self.size :] if entries[s.id].rss is None]
+        for post in posts.get_by_ids(missing, include=()):
+            if post.id in entries:
+                entries[post.id] = replace(
+                    entries[post.id],
+                    rss=render.rss_item(self.site, post),
+                    atom=render.atom_entry(self.site, post),
+                )
+
+        previous = {**base.previous, **base.documents} if base else {}
+        return _State(stamps, entries, refreshed_at, previous)
+
+    def _render(self, state: _State, kind: FeedKind) -> FeedDocument:
+        if kind is FeedKind.SITEMAP:
+            mapped = state.newest(SITEMAP_MAX_URLS)
+            updated = _latest(e.stamp.updated_at for e in mapped)
+            body = render.sitemap_document(e.sitemap for e in mapped)
+        else:
+            window = state.newest(self.size)
+            updated = _latest(e.stamp.updated_at for e in window)
+            if kind is FeedKind.RSS:
+                items = (e.rss for e in window if e.rss)
+                body = render.rss_document(self.site, items, updated)
+            else:
+                items = (e.atom for e in window if e.atom)
+                body = render.atom_document(self.site, items, updated)
+
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        previous = state.previous.get(kind)
+        if previous is not None and previous.etag == etag:
+            return previous
+        if (
+            previous
+            and previous.last_modified
+            and (updated is None or updated <= previous.last_modified)
+        ):
+            # Removing a post changes the document without making any
+            # remaining entry newer; Last-Modified must still move on.
+            updated = datetime.now(timezone.utc)
+        return FeedDocument(body, etag, updated)
+
+
+def _latest(values: Iterable[datetime]) -> datetime | None:
+    latest = max(values, default=None)
+    return render.utc(latest) if latest else None
+
+
+settings = Settings()
+
+feed_cache = FeedCache(
+    Site.from_settings(settings),
+    size=settings.FEED_SIZE,
+    refresh_after=settings.FEED_REFRESH_SECONDS,
+)
+
+subscribe(POSTS, feed_cache.invalidate)
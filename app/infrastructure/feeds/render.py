@@ -0,0 +1,154 @@
+"""
+XML for the RSS 2.0 and Atom 1.0 feeds and the sitemap.
+
+Every post renders to a self-contained fragment, so a document is the
+concatenation of its entries' fragments between a header and a footer and
+a changed post only needs its own fragments rendered again.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from email.utils import format_datetime
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+from xml.sax.saxutils import quoteattr
+
+from app.core.config import Settings
+from app.domain.models.post import PostModel
+from app.domain.models.post import PostStamp
+
+EXCERPT_LENGTH = 280
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+# ``<updated>`` of an empty Atom feed; fixed so that its ETag is stable.
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Characters XML 1.0 does not allow even escaped; a single one makes the
+# whole document unreadable to a conforming parser.
+XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+
+@dataclass(frozen=True)
+class Site:
+    url: str
+    title: str
+    description: str
+    author: str
+    post_path: str
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> Site:
+        return cls(
+            url=settings.SITE_URL.rstrip("/"),
+            title=settings.SITE_TITLE,
+            description=settings.SITE_DESCRIPTION,
+            author=settings.SITE_AUTHOR,
+            post_path=settings.SITE_POST_PATH,
+        )
+
+    def post_url(self, slug: str) -> str:
+        return self.url + self.post_path.format(slug=quote(slug))
+
+
+def utc(value: datetime) -> datetime:
+    """Timestamps are stored as naive UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def excerpt(content: str, length: int = EXCERPT_LENGTH) -> str:
+    text = " ".join(content.split())
+    if len(text) <= length:
+        return text
+    return text[:length].rsplit(" ", 1)[0] + "…"
+
+
+def rss_item(site: Site, post: PostModel) -> bytes:
+    url = escape(site.post_url(post.slug))
+    return (
+        "<item>"
+        f"<title>{_text(post.title)}</title>"
+        f"<link>{url}</link>"
+        f'<guid isPermaLink="true">{url}</guid>'
+        f"<pubDate>{_rfc822(post.published_at or post.created_at)}</pubDate>"
+        f"<description>{_text(excerpt(post.content))}</description>"
+        "</item>\n"
+    ).encode()
+
+
+def atom_entry(site: Site, post: PostModel) -> bytes:
+    url = site.post_url(post.slug)
+    return (
+        "<entry>"
+        f"<title>{_text(post.title)}</title>"
+        f"<link href={quoteattr(url)}/>"
+        f"<id>{escape(url)}</id>"
+        f"<published>{_iso(post.published_at or post.created_at)}</published>"
+        f"<updated>{_iso(post.updated_at)}</updated>"
+        f"<summary>{_text(excerpt(post.content))}</summary>"
+        "</entry>\n"
+    ).encode()
+
+
+def sitemap_url(site: Site, stamp: PostStamp) -> bytes:
+    return (
+        "<url>"
+        f"<loc>{escape(site.post_url(stamp.slug))}</loc>"
+        f"<lastmod>{_iso(stamp.updated_at)}</lastmod>"
+        "</url>\n"
+    ).encode()
+
+
+def rss_document(
+    site: Site,
+    items: Iterable[bytes],
+    updated: datetime | None,
+) -> bytes:
+    head = (
+        XML_DECLARATION + '<rss version="2.0"><channel>'
+        f"<title>{_text(site.title)}</title>"
+        f"<link>{escape(site.url)}/</link>"
+        f"<description>{_text(site.description)}</description>"
+    )
+    if updated:
+        head += f"<lastBuildDate>{_rfc822(updated)}</lastBuildDate>"
+    return b"".join([(head + "\n").encode(), *items, b"</channel></rss>\n"])
+
+
+def atom_document(
+    site: Site,
+    entries: Iterable[bytes],
+    updated: datetime | None,
+) -> bytes:
+    head = (
+        XML_DECLARATION + '<feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>{_text(site.title)}</title>"
+        f"<link href={quoteattr(site.url + '/')}/>"
+        f"<id>{escape(site.url)}/</id>"
+        f"<updated>{_iso(updated or EPOCH)}</updated>"
+        f"<author><name>{_text(site.author)}</name></author>"
+    )
+    return b"".join([(head + "\n").encode(), *entries, b"</feed>\n"])
+
+
+def sitemap_document(urls: Iterable[bytes]) -> bytes:
+    head = (
+        XML_DECLARATION
+        + '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    )
+    return b"".join([head.encode(), *urls, b"</urlset>\n"])
+
+
+def _text(value: str) -> str:
+    """``value`` as XML character data."""
+    return escape(XML_ILLEGAL.sub("", value))
+
+
+def _rfc822(value: datetime) -> str:
+    return format_datetime(utc(value), usegmt=True)
+
+
+def _iso(value: datetime) -> str:
+    return utc(value).isoformat(timespec="seconds")
@@ -1,5 +1,7 @@
 from typing import Optional
 
+from sqlalchemy import inspect
+
 from app.domain.models.category import CategoryModel
 from app.infrastructure.database.models import Category as CategoryORM
 from app.presentation.schemas.category import CategoryResponse
@@ -8,11 +10,14 @@ from app.presentation.schemas.category import CategoryResponse
 class CategoryMapper:
     @staticmethod
     def to_domain(orm: CategoryORM) -> CategoryModel:
+        # Columns that were not read come back empty.
+        unloaded = inspect(orm).unloaded
         return CategoryModel(
             id=orm.id,
-            name=orm.name,
-            slug=orm.slug,
-            description=orm.description,
+            name="" if "name" in unloaded else orm.name,
+            slug="" if "slug" in unloaded else orm.slug,
+            description=None if "description" in unloaded else orm.description,
+            updated_at=orm.updated_at,
         )
 
     @staticmethod
@@ -33,4 +38,5 @@ class CategoryMapper:
             name=entity.name,
             slug=entity.slug,
             description=entity.description,
+            post_count=entity.post_count,
         )
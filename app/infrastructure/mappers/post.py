@@ -1,19 +1,101 @@
 from __future__ import annotations
 
+from typing import Any
+
+from sqlalchemy import inspect
+
+from app.domain.models import stored_id
+from app.domain.models.category import CategoryModel
 from app.domain.models.post import PostModel
+from app.domain.models.post import PostSearchHit
+from app.domain.models.post import PostSummary
+from app.domain.models.post import RenderedContent
+from app.domain.models.tag import TagModel
 from app.infrastructure.database.models import Post as PostORM
 from app.infrastructure.mappers.category import CategoryMapper
 from app.infrastructure.mappers.tag import TagMapper
+from app.presentation.schemas.post import PostExportRecord
 from app.presentation.schemas.post import PostResponse
+from app.presentation.schemas.post import PostSearchHitResponse
+from app.presentation.schemas.post import PostSummaryResponse
+
+RENDERED_COLUMNS = (
+    "content_html",
+    "excerpt",
+    "word_count",
+    "reading_time",
+    "render_version",
+)
 
 
 class PostMapper:
     @staticmethod
     def to_domain(orm: PostORM) -> PostModel:
-        return PostModel(
+        category, tags = PostMapper._relations(orm)
+        # Columns that were not read come back empty, like relations.
+        unloaded = inspect(orm).unloaded
+        post = PostModel(
+            id=orm.id,
+            title="" if "title" in unloaded else orm.title,
+            content="" if "content" in unloaded else orm.content,
+            category=category,
+            tags=tags,
+            status=orm.status,
+            published_at=orm.published_at,
+            created_at=orm.created_at,
+            updated_at=orm.updated_at,
+            rendered=(
+                None if "render_version" in unloaded else PostMapper.to_rendered(orm)
+            ),
+        )
+        post.slug = "" if "slug" in unloaded else orm.slug
+        return post
+
+    @staticmethod
+    def to_rendered(orm: PostORM) -> RenderedContent | None:
+        # The columns are written together; a row missing any of them has
+        # no rendering.
+        if (
+            orm.render_version is None
+            or orm.content_html is None
+            or orm.excerpt is None
+            or orm.word_count is None
+            or orm.reading_time is None
+        ):
+            return None
+        return RenderedContent(
+            html=orm.content_html,
+            excerpt=orm.excerpt,
+            word_count=orm.word_count,
+            reading_time=orm.reading_time,
+            version=orm.render_version,
+        )
+
+    @staticmethod
+    def rendered_values(rendered: RenderedContent | None) -> dict[str, Any]:
+        """Column values storing ``rendered``, or clearing a stale rendering."""
+        if rendered is None:
+            return dict.fromkeys(RENDERED_COLUMNS)
+        return {
+            "content_html": rendered.html,
+            "excerpt": rendered.excerpt,
+            "word_count": rendered.word_count,
+            "reading_time": rendered.reading_time,
+            "render_version": rendered.version,
+        }
+
+    @staticmethod
+    def to_summary(orm: PostORM) -> PostSummary:
+        category, tags = PostMapper._relations(orm)
+        return PostSummary(
             id=orm.id,
             title=orm.title,
-            content=orm.content,
+            slug=orm.slug,
+            category=category,
+            tags=tags,
+            status=orm.status,
+            published_at=orm.published_at,
+            updated_at=orm.updated_at,
         )
 
     @staticmethod
@@ -28,8 +110,11 @@ class PostMapper:
         )
 
     @staticmethod
-    def to_dto(entity: PostModel) -> PostResponse:
-        return PostResponse(
+    def to_dto(
+        entity: PostModel,
+        rendered: RenderedContent | None = None,
+    ) -> PostResponse:
+        dto = PostResponse(
             id=entity.id,
             title=entity.title,
             content=entity.content,
@@ -37,3 +122,58 @@ class PostMapper:
             category=CategoryMapper.to_dto(entity.category),
             tags=[TagMapper.to_dto(t) for t in entity.tags],
         )
+        if rendered is not None:
+            dto.content_html = rendered.html
+            dto.excerpt = rendered.excerpt
+            dto.word_count = rendered.word_count
+            dto.reading_time = rendered.reading_time
+        return dto
+
+    @staticmethod
+    def to_summary_dto(entity: PostSummary) -> PostSummaryResponse:
+        return PostSummaryResponse(
+            id=entity.id,
+            title=entity.title,
+            slug=entity.slug,
+            category=CategoryMapper.to_dto(entity.category),
+            tags=[TagMapper.to_dto(t) for t in entity.tags],
+        )
+
+    @staticmethod
+    def to_search_hit_dto(entity: PostSearchHit) -> PostSearchHitResponse:
+        return PostSearchHitResponse(
+            id=entity.id,
+            title=entity.title,
+            slug=entity.slug,
+            snippet=entity.snippet,
+            rank=entity.rank,
+            published_at=entity.published_at,
+        )
+
+    @staticmethod
+    def to_export_record(entity: PostModel) -> PostExportRecord:
+        return PostExportRecord(
+            id=stored_id(entity.id),
+            title=entity.title,
+            slug=entity.slug,
+            content=entity.content,
+            status=entity.status,
+            published_at=entity.published_at,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+            category=entity.category.slug if entity.category else None,
+            tags=[t.slug for t in entity.tags],
+        )
+
+    @staticmethod
+    def _relations(orm: PostORM) -> tuple[CategoryModel | None, list[TagModel]]:
+        # Relations that were not loaded are skipped rather than lazy-loaded,
+        # so mapping never issues queries of its own.
+        unloaded = inspect(orm).unloaded
+        category = None
+        if "category" not in unloaded and orm.category is not None:
+            category = CategoryMapper.to_domain(orm.category)
+        tags = []
+        if "tags" not in unloaded:
+            tags = [TagMapper.to_domain(t) for t in orm.tags]
+        return category, tags
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from sqlalchemy import inspect
+
 from app.domain.models.tag import TagModel
 from app.infrastructure.database.models import Tag as TagORM
 from app.presentation.schemas.tag import TagResponse
@@ -12,10 +14,13 @@ class TagMapper:
         if orm is None:
             raise ValueError('ORM object cannot be None')
 
+        # Columns that were not read come back empty.
+        unloaded = inspect(orm).unloaded
         return TagModel(
             id=orm.id,
-            name=orm.name,
-            slug=orm.slug,
+            name="" if "name" in unloaded else orm.name,
+            slug="" if "slug" in unloaded else orm.slug,
+            updated_at=orm.updated_at,
         )
 
     @staticmethod
@@ -32,4 +37,5 @@ class TagMapper:
             id=entity.id,
             name=entity.name,
             slug=entity.slug,
+            post_count=entity.post_count,
         )
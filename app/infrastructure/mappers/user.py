@@ -11,6 +11,7 @@ class UserMapper:
             id=orm.id,
             username=orm.username,
             hashed_password=orm.hashed_password,
+            token_version=orm.token_version,
         )
 
     @staticmethod
@@ -19,4 +20,5 @@ class UserMapper:
             id=entity.id,
             username=entity.username,
             hashed_password=entity.hashed_password,
+            token_version=entity.token_version,
         )
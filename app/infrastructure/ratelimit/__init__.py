@@ -0,0 +1,153 @@
+"""
+Token bucket rate limiting.
+
+Buckets are kept by this process, or, with ``RATE_LIMIT_SHARED``, on the
+cache backend's server (Redis, or the SQLite file) so that every worker
+counts the same attempts. A shared store that cannot be reached is replaced
+by this process's own buckets until it answers again: limits then apply
+per worker rather than not at all.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from collections.abc import Sequence
+from contextlib import asynccontextmanager
+
+from app.core.config import Settings
+from app.core.exceptions import OverloadedError
+from app.core.exceptions import RateLimitError
+from app.infrastructure.cache import shared
+from app.infrastructure.cache.backend import CacheBackend
+from app.infrastructure.cache.backend import CacheUnavailableError
+from app.infrastructure.cache.redis import RedisBackend
+from app.infrastructure.cache.sqlite import SQLiteBackend
+from app.infrastructure.ratelimit.buckets import BucketStore
+from app.infrastructure.ratelimit.buckets import Limit
+from app.infrastructure.ratelimit.buckets import MemoryBucketStore
+from app.infrastructure.ratelimit.redis import RedisBucketStore
+from app.infrastructure.ratelimit.sqlite import SQLiteBucketStore
+
+# Usernames can be as long as a client likes; bucket keys cannot.
+USERNAME_KEY_LENGTH = 64
+# What an overloaded process asks clients to wait before trying again.
+OVERLOADED_RETRY_AFTER_SECONDS = 1.0
+
+logger = logging.getLogger(__name__)
+
+
+def open_store(backend: CacheBackend, prefix: str) -> BucketStore | None:
+    """Buckets on ``backend``'s server, if it is shared between processes."""
+    if isinstance(backend, RedisBackend):
+        return RedisBucketStore(backend.client, prefix)
+    if isinstance(backend, SQLiteBackend):
+        return SQLiteBucketStore(backend.path, backend.timeout, prefix)
+    return None
+
+
+class RateLimiter:
+    def __init__(self, local: MemoryBucketStore, store: BucketStore | None = None):
+        self.local = local
+        self.store = store
+
+    @property
+    def shared(self) -> bool:
+        return self.store is not None
+
+    def take(self, buckets: Sequence[tuple[str, Limit]]) -> float:
+        if self.store is not None:
+            try:
+                return self.store.take(buckets)
+            except CacheUnavailableError as exc:
+                logger.warning(
+                    "Rate limit store unavailable, limiting locally: %s", exc
+                )
+        return self.local.take(buckets)
+
+    @property
+    def name(self) -> str:
+        return (self.store or self.local).name
+
+
+class LoginGuard:
+    """
+    Admission of login attempts, before they reach the database or the
+    password hasher.
+
+    An attempt takes a token from the bucket of its client address and
+    from that of the username it tries; either one being empty turns it
+    away with ``RateLimitError``. Past ``max_in_flight`` logins in progress
+    in this process, attempts are turned away with ``OverloadedError``
+    without taking tokens. Used from the event loop only; a shared store is
+    asked from a worker thread, as it may wait on its server.
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        per_client: Limit,
+        per_username: Limit,
+        max_in_flight: int,
+        enabled: bool = True,
+    ):
+        self.enabled = enabled
+        self.limiter = limiter
+        self.per_client = per_client
+        self.per_username = per_username
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+
+    @asynccontextmanager
+    async def admit(self, client: str | None, username: str) -> AsyncIterator[None]:
+        if not self.enabled:
+            yield
+            return
+        if self.in_flight >= self.max_in_flight:
+            raise OverloadedError(
+                "Too many logins in progress",
+                retry_after=OVERLOADED_RETRY_AFTER_SECONDS,
+            )
+
+        self.in_flight += 1
+        try:
+            username = username.casefold()[:USERNAME_KEY_LENGTH]
+            buckets = [(f"login:username:{username}", self.per_username)]
+            if client:
+                buckets.append((f"login:client:{client}", self.per_client))
+            if self.limiter.shared:
+                wait = await asyncio.to_thread(self.limiter.take, buckets)
+            else:
+                wait = self.limiter.take(buckets)
+            if wait > 0:
+                raise RateLimitError("Too many login attempts", retry_after=wait)
+            yield
+        finally:
+            self.in_flight -= 1
+
+
+settings = Settings()
+
+rate_limiter = RateLimiter(
+    MemoryBucketStore(settings.RATE_LIMIT_MAX_BUCKETS),
+    (
+        open_store(shared.backend, f"{settings.CACHE_KEY_PREFIX}:ratelimit")
+        if settings.RATE_LIMIT_SHARED
+        else None
+    ),
+)
+
+login_guard = LoginGuard(
+    rate_limiter,
+    per_client=Limit(
+        rate=settings.LOGIN_ATTEMPTS_PER_MINUTE_PER_CLIENT / 60,
+        burst=settings.LOGIN_BURST_PER_CLIENT,
+    ),
+    per_username=Limit(
+        rate=settings.LOGIN_ATTEMPTS_PER_MINUTE_PER_USERNAME / 60,
+        burst=settings.LOGIN_BURST_PER_USERNAME,
+    ),
+    max_in_flight=settings.LOGIN_MAX_IN_FLIGHT,
+    enabled=settings.LOGIN_RATE_LIMIT_ENABLED,
+)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Any
+
+from app.infrastructure.cache.lru import LRUCache
+
+
+@dataclass(frozen=True)
+class Limit:
+    """
+    A token bucket: holds up to ``burst`` tokens, refilled at ``rate`` per
+    second; each attempt takes one.
+    """
+
+    rate: float
+    burst: int
+
+    def refill(self, tokens: float, elapsed: float) -> float:
+        return min(float(self.burst), tokens + max(0.0, elapsed) * self.rate)
+
+    def wait(self, tokens: float) -> float:
+        """Seconds until a bucket holding ``tokens`` has one to take."""
+        return 0.0 if tokens >= 1 else (1 - tokens) / self.rate
+
+    def full_after(self) -> float:
+        """Seconds an empty bucket takes to fill: how long to keep one."""
+        return self.burst / self.rate
+
+
+class BucketStore:
+    """
+    Token buckets under string keys.
+
+    ``take`` is all or nothing over the buckets it is given: a token is
+    taken from each only if every one of them has a token to give.
+    """
+
+    name: str
+
+    def take(self, buckets: Sequence[tuple[str, Limit]]) -> float:
+        """0 when the tokens were taken, else the seconds to wait for them."""
+        raise NotImplementedError
+
+    def stats(self) -> dict[str, Any]:
+        return {}
+
+
+class MemoryBucketStore(BucketStore):
+    """
+    Buckets private to this process, bounded to ``max_entries``.
+
+    A bucket left alone until it is full again is the same as no bucket,
+    so buckets expire then, and the least recently used go first when the
+    store is full.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int):
+        # (tokens, monotonic time they were counted)
+        self.buckets: LRUCache[str, tuple[float, float]] = LRUCache(max_entries, ttl=0)
+        self._lock = threading.Lock()
+
+    def take(self, buckets: Sequence[tuple[str, Limit]]) -> float:
+        now = time.monotonic()
+        with self._lock:
+            levels = []
+            for key, limit in buckets:
+                tokens, counted_at = self.buckets.get(key) or (limit.burst, now)
+                levels.append(limit.refill(tokens, now - counted_at))
+            wait = max(
+                (limit.wait(tokens) for (_, limit), tokens in zip(buckets, levels)),
+                default=0.0,
+            )
+            if wait > 0:
+                return wait
+            for (key, limit), tokens in zip(buckets, levels):
+                self.buckets.set(key, (tokens - 1, now), ttl=limit.full_after())
+            return 0.0
+
+    def stats(self) -> dict[str, Any]:
+        return asdict(self.buckets.stats())
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from app.infrastructure.cache.backend import unavailable_on
+from app.infrastructure.ratelimit.buckets import BucketStore
+from app.infrastructure.ratelimit.buckets import Limit
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# KEYS are the buckets, ARGV their rate and burst in turn. Buckets are
+# hashes of the tokens left and the server time they were counted at; the
+# server's clock is the only one, whichever worker asks (reading it before
+# writing needs effects replication, the default from Redis 7). The wait
+# is returned as a string: Redis truncates Lua numbers to integers.
+TAKE = """
+redis.replicate_commands()
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local levels = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local burst = tonumber(ARGV[2 * i])
+    local bucket = redis.call('HMGET', key, 'tokens', 'at')
+    local tokens = tonumber(bucket[1]) or burst
+    local at = tonumber(bucket[2]) or now
+    tokens = math.min(burst, tokens + math.max(0, now - at) * rate)
+    levels[i] = tokens
+    if tokens < 1 then
+        wait = math.max(wait, (1 - tokens) / rate)
+    end
+end
+if wait > 0 then
+    return tostring(wait)
+end
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local burst = tonumber(ARGV[2 * i])
+    redis.call('HSET', key, 'tokens', tostring(levels[i] - 1), 'at', tostring(now))
+    redis.call('PEXPIRE', key, math.ceil(burst / rate * 1000))
+end
+return '0'
+"""
+
+
+class RedisBucketStore(BucketStore):
+    """
+    Buckets on the Redis server of the cache, shared by every worker and
+    pod. A script takes the tokens, so concurrent attempts from different
+    workers never take the same token twice.
+    """
+
+    name = "redis"
+
+    def __init__(self, client: redis.Redis, prefix: str):
+        self.prefix = prefix
+        self._take = client.register_script(TAKE)
+
+    def take(self, buckets: Sequence[tuple[str, Limit]]) -> float:
+        keys = [f"{self.prefix}:{key}" for key, _ in buckets]
+        args = [value for _, limit in buckets for value in (limit.rate, limit.burst)]
+        with unavailable_on(redis.RedisError):
+            return float(self._take(keys=keys, args=args))
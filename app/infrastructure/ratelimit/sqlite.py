@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Sequence
+
+from app.infrastructure.cache.backend import unavailable_on
+from app.infrastructure.ratelimit.buckets import BucketStore
+from app.infrastructure.ratelimit.buckets import Limit
+
+# Buckets untouched for this long are full again and deleted.
+PURGE_AFTER_SECONDS = 24 * 60 * 60
+# Stale buckets are purged once every this many attempts.
+PURGE_EVERY = 1_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit (
+    key TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    counted_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+class SQLiteBucketStore(BucketStore):
+    """
+    Buckets in the SQLite file of the cache, shared by every process on the
+    host. Each attempt is a write transaction, taken before the buckets are
+    read, so that processes take tokens one at a time.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, timeout: float, prefix: str):
+        self.path = path
+        self.timeout = timeout
+        self.prefix = prefix
+        self._local = threading.local()
+        self._attempts = 0
+
+    def take(self, buckets: Sequence[tuple[str, Limit]]) -> float:
+        keys = [f"{self.prefix}:{key}" for key, _ in buckets]
+        with unavailable_on(sqlite3.Error):
+            db = self._connection()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                wait = self._take(db, keys, [limit for _, limit in buckets])
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return wait
+
+    def _take(
+        self, db: sqlite3.Connection, keys: list[str], limits: list[Limit]
+    ) -> float:
+        now = time.time()
+        marks = ",".join("?" * len(keys))
+        stored = dict(
+            (key, (tokens, counted_at))
+            for key, tokens, counted_at in db.execute(
+                f"SELECT key, tokens, counted_at FROM rate_limit "
+                f"WHERE key IN ({marks})",
+                keys,
+            )
+        )
+        levels = []
+        for key, limit in zip(keys, limits):
+            tokens, counted_at = stored.get(key, (limit.burst, now))
+            levels.append(limit.refill(tokens, now - counted_at))
+        wait = max(map(Limit.wait, limits, levels), default=0.0)
+        if wait > 0:
+            return wait
+
+        db.executemany(
+            "INSERT OR REPLACE INTO rate_limit (key, tokens, counted_at) "
+            "VALUES (?, ?, ?)",
+            [(key, tokens - 1, now) for key, tokens in zip(keys, levels)],
+        )
+        self._attempts += 1
+        if self._attempts >= PURGE_EVERY:
+            self._attempts = 0
+            db.execute(
+                "DELETE FROM rate_limit WHERE counted_at <= ?",
+                [now - PURGE_AFTER_SECONDS],
+            )
+        return 0.0
+
+    def _connection(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            # Transactions are managed by hand (BEGIN IMMEDIATE).
+            db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(SCHEMA)
+            self._local.db = db
+        return db
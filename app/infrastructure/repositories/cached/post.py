@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+
+from app.core.config import Settings
+from app.domain.models import stored_id
+from app.domain.models.page import Page
+from app.domain.models.post import PostContent
+from app.domain.models.post import PostFilter
+from app.domain.models.post import PostModel
+from app.domain.models.post import PostSearchHit
+from app.domain.models.post import PostStamp
+from app.domain.models.post import PostSummary
+from app.domain.models.post import RenderedContent
+from app.domain.models.version import Version
+from app.domain.repositories.post import ALL_POST_FIELDS
+from app.domain.repositories.post import ALL_POST_RELATIONS
+from app.domain.repositories.post import PostField
+from app.domain.repositories.post import PostRelation
+from app.domain.repositories.post import PostRepository
+from app.infrastructure.cache import shared
+from app.infrastructure.cache.codec import DataclassCodec
+from app.infrastructure.cache.codec import JsonCodec
+from app.infrastructure.cache.namespace import CacheNamespace
+from app.infrastructure.database.changes import POSTS
+from app.infrastructure.database.changes import subscribe
+
+
+class PostCache:
+    """
+    Posts by id, and post ids by slug, in the shared cache backend.
+
+    A slug only maps to an id; the post found under that id must still have
+    the slug, so a renamed post is never served under its old slug even if
+    the mapping outlived it.
+
+    ``epoch`` moves on with every invalidation made by this process. A
+    reader that loaded posts from the database passes the epoch it saw
+    before loading to ``put``, so posts read before a concurrent write
+    committed are not stored after that write invalidated them.
+    """
+
+    def __init__(
+        self,
+        posts: CacheNamespace[int, PostModel],
+        slugs: CacheNamespace[str, int],
+    ):
+        self.posts = posts
+        self.slugs = slugs
+        self.epoch = 0
+
+    def get(self, post_id: int) -> PostModel | None:
+        return self.posts.get(post_id)
+
+    def get_many(self, post_ids: Collection[int]) -> dict[int, PostModel]:
+        return self.posts.get_many(post_ids)
+
+    def get_by_slug(self, slug: str) -> PostModel | None:
+        post_id = self.slugs.get(slug)
+        post = self.get(post_id) if post_id is not None else None
+        return post if post is not None and post.slug == slug else None
+
+    def put(self, posts: Sequence[PostModel], epoch: int) -> None:
+        if epoch != self.epoch or not posts:
+            return
+        ids = [stored_id(p.id) for p in posts]
+        self.posts.set_many(dict(zip(ids, posts)))
+        self.slugs.set_many({p.slug: i for p, i in zip(posts, ids)})
+
+    def invalidate(self, post_ids: Iterable[int], slugs: Iterable[str] = ()) -> None:
+        self.epoch += 1
+        post_ids = list(post_ids)
+        cached = self.posts.get_many(post_ids)
+        self.posts.delete(*post_ids)
+        self.slugs.delete(*{p.slug for p in cached.values()}, *slugs)
+
+
+class CachedPostRepository(PostRepository):
+    """
+    Read-through cache in front of a post repository.
+
+    Only whole posts (every relation and field included) looked up by id,
+    ids or slug are cached. ``save`` and ``delete`` drop the post under its
+    id, its old slug and its new one; writes committed through any
+    repository of this process drop it again after the commit, so a read
+    racing the write cannot keep the old row. With a shared backend those
+    drops reach every process; with the in-memory one, other processes'
+    writes show up once entries expire. Posts come back decoded afresh, so
+    callers may edit them.
+    """
+
+    def __init__(self, inner: PostRepository, cache: PostCache):
+        self.inner = inner
+        self.cache = cache
+
+    def get_by_id(
+        self,
+        post_id: int,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> PostModel | None:
+        if not _is_whole(include, fields):
+            return self.inner.get_by_id(post_id, include, fields)
+        post = self.cache.get(post_id)
+        if post is None:
+            epoch = self.cache.epoch
+            post = self.inner.get_by_id(post_id)
+            if post is None:
+                return None
+            self.cache.put([post], epoch)
+        return post
+
+    def get_by_slug(
+        self,
+        slug: str,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> PostModel | None:
+        if not _is_whole(include, fields):
+            return self.inner.get_by_slug(slug, include, fields)
+        post = self.cache.get_by_slug(slug)
+        if post is None:
+            epoch = self.cache.epoch
+            post = self.inner.get_by_slug(slug)
+            if post is None:
+                return None
+            self.cache.put([post], epoch)
+        return post
+
+    def save(self, post: PostModel) -> PostModel:
+        saved = self.inner.save(post)
+        self.cache.invalidate([stored_id(saved.id)], [post.slug, saved.slug])
+        return saved
+
+    def delete(self, post_id: int) -> None:
+        self.inner.delete(post_id)
+        self.cache.invalidate([post_id])
+
+    def get_by_ids(
+        self,
+        ids: Collection[int],
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> list[PostModel]:
+        if not _is_whole(include, fields):
+            return self.inner.get_by_ids(ids, include, fields)
+        found = self.cache.get_many(ids)
+        missing = [i for i in ids if i not in found]
+        if missing:
+            epoch = self.cache.epoch
+            loaded = self.inner.get_by_ids(missing)
+            self.cache.put(loaded, epoch)
+            found.update((stored_id(p.id), p) for p in loaded)
+        return [found[i] for i in ids if i in found]
+
+    def get_published_stamps(
+        self,
+        ids: Collection[int] | None = None,
+    ) -> list[PostStamp]:
+        return self.inner.get_published_stamps(ids)
+
+    def get_version(self, post_id: int) -> Version | None:
+        return self.inner.get_version(post_id)
+
+    def get_version_by_slug(self, slug: str) -> Version | None:
+        return self.inner.get_version_by_slug(slug)
+
+    def get_page_versions(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        filters: PostFilter | None = None,
+    ) -> Page[Version]:
+        return self.inner.get_page_versions(limit, cursor, filters)
+
+    def get_all(
+        self,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+    ) -> list[PostModel]:
+        return self.inner.get_all(include)
+
+    def iter_all(
+        self,
+        batch_size: int,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+    ) -> Iterator[PostModel]:
+        return self.inner.iter_all(batch_size, include)
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        filters: PostFilter | None = None,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> Page[PostModel]:
+        return self.inner.get_page(limit, cursor, include, filters, fields)
+
+    def get_summary_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        filters: PostFilter | None = None,
+    ) -> Page[PostSummary]:
+        return self.inner.get_summary_page(limit, cursor, include, filters)
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+    ) -> Page[PostSearchHit]:
+        return self.inner.search(query, limit, cursor)
+
+    def insert_many(self, posts: Sequence[PostModel]) -> list[str | None]:
+        return self.inner.insert_many(posts)
+
+    def get_stale_renderings(
+        self,
+        version: int,
+        limit: int,
+        after_id: int = 0,
+    ) -> list[PostContent]:
+        return self.inner.get_stale_renderings(version, limit, after_id)
+
+    def save_renderings(
+        self,
+        renderings: Sequence[tuple[PostContent, RenderedContent]],
+    ) -> int:
+        stored = self.inner.save_renderings(renderings)
+        self.cache.invalidate([post.id for post, _ in renderings])
+        return stored
+
+
+def _is_whole(
+    include: Collection[PostRelation],
+    fields: Collection[PostField],
+) -> bool:
+    return set(include) >= ALL_POST_RELATIONS and set(fields) >= ALL_POST_FIELDS
+
+
+settings = Settings()
+
+post_cache = PostCache(
+    posts=shared.namespace(
+        "post", DataclassCodec(PostModel), ttl=settings.POST_CACHE_TTL_SECONDS
+    ),
+    slugs=shared.namespace(
+        "post-slug", JsonCodec(), ttl=settings.POST_CACHE_TTL_SECONDS
+    ),
+)
+
+subscribe(POSTS, post_cache.invalidate)
+
+
+def cached_post_repository(inner: PostRepository) -> PostRepository:
+    """``inner`` behind the shared post cache, unless caching is disabled."""
+    if not settings.POST_CACHE_ENABLED:
+        return inner
+    return CachedPostRepository(inner, post_cache)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+
+from app.core.config import Settings
+from app.domain.repositories.token import RevokedTokenRepository
+from app.infrastructure.cache.bloom import BloomFilter
+from app.infrastructure.cache.bloom import BloomStats
+from app.infrastructure.database.changes import subscribe
+from app.infrastructure.database.changes import TOKENS
+
+
+class RevocationFilter:
+    """
+    Every revoked token id, of every process, in a Bloom filter.
+
+    A token id the filter has not seen was not revoked, which answers the
+    check for almost every token without reading the database; only the
+    ids it may have seen are looked up. Revocations committed by this
+    process are added as they commit; those of other processes arrive with
+    ``sync`` (see ``app.infrastructure.auth.revocation``).
+
+    Until the first ``rebuild`` the filter knows nothing, so every id is
+    reported as possibly revoked and looked up.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.loaded = False
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._lock = threading.Lock()
+        # Ids added while a rebuild reads the table, which it may miss.
+        self._pending: list[str] | None = None
+
+    def might_be_revoked(self, token_id: str) -> bool:
+        return not self.loaded or token_id in self._bloom
+
+    def add(self, token_ids: Iterable[str]) -> None:
+        with self._lock:
+            for token_id in token_ids:
+                # Syncs read overlapping windows; only count new ids.
+                if token_id not in self._bloom:
+                    self._bloom.add(token_id)
+                if self._pending is not None:
+                    self._pending.append(token_id)
+
+    def sync(self, revoked: RevokedTokenRepository, since: datetime) -> int:
+        """Add the revocations committed since ``since``; returns how many."""
+        token_ids = revoked.list_revoked(since)
+        self.add(token_ids)
+        return len(token_ids)
+
+    def rebuild(self, revoked: RevokedTokenRepository) -> int:
+        """
+        Replace the filter with one of the unexpired revocations, which
+        drops the expired ones and grows it past ``capacity`` if needed.
+        """
+        with self._lock:
+            self._pending = []
+        try:
+            token_ids = revoked.list_revoked()
+            bloom = BloomFilter.of(
+                token_ids,
+                capacity=max(self.capacity, 2 * len(token_ids)),
+                error_rate=self.error_rate,
+            )
+        except BaseException:
+            with self._lock:
+                self._pending = None
+            raise
+        with self._lock:
+            for token_id in self._pending:
+                bloom.add(token_id)
+            self._bloom = bloom
+            self._pending = None
+            self.loaded = True
+        return len(token_ids)
+
+    def full(self) -> bool:
+        return self._bloom.full()
+
+    def stats(self) -> BloomStats:
+        return self._bloom.stats()
+
+
+class FilteredRevokedTokenRepository(RevokedTokenRepository):
+    """Revoked token repository that only reads what the filter may hold."""
+
+    def __init__(self, inner: RevokedTokenRepository, revocations: RevocationFilter):
+        self.inner = inner
+        self.revocations = revocations
+
+    def revoke(self, token_id: str, expires_at: datetime) -> bool:
+        return self.inner.revoke(token_id, expires_at)
+
+    def is_revoked(self, token_id: str) -> bool:
+        if not self.revocations.might_be_revoked(token_id):
+            return False
+        return self.inner.is_revoked(token_id)
+
+    def list_revoked(self, since: datetime | None = None) -> list[str]:
+        return self.inner.list_revoked(since)
+
+    def purge_expired(self) -> int:
+        return self.inner.purge_expired()
+
+
+settings = Settings()
+
+revocation_filter = RevocationFilter(
+    capacity=settings.TOKEN_REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.TOKEN_REVOCATION_FILTER_ERROR_RATE,
+)
+
+subscribe(TOKENS, revocation_filter.add)
+
+
+def filtered_revoked_token_repository(
+    inner: RevokedTokenRepository,
+) -> RevokedTokenRepository:
+    """``inner`` behind the process's revocation filter."""
+    return FilteredRevokedTokenRepository(inner, revocation_filter)
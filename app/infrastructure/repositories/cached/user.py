@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from app.core.config import Settings
+from app.domain.models import stored_id
+from app.domain.models.user import UserIdentity
+from app.domain.models.user import UserModel
+from app.domain.repositories.user import UserRepository
+from app.infrastructure.auth import verified_tokens
+from app.infrastructure.cache import shared
+from app.infrastructure.cache.codec import DataclassCodec
+from app.infrastructure.cache.namespace import CacheNamespace
+from app.infrastructure.database.changes import subscribe
+from app.infrastructure.database.changes import USERS
+
+
+class UserCache:
+    """
+    User identities by id, in the shared cache backend.
+
+    Only identities are kept: credentials never leave the database. See
+    ``PostCache`` for the meaning of ``epoch``.
+    """
+
+    def __init__(self, identities: CacheNamespace[int, UserIdentity]):
+        self.identities = identities
+        self.epoch = 0
+
+    def get(self, user_id: int) -> UserIdentity | None:
+        return self.identities.get(user_id)
+
+    def put(self, identity: UserIdentity, epoch: int) -> None:
+        if epoch == self.epoch:
+            self.identities.set(identity.id, identity)
+
+    def invalidate(self, user_ids: Iterable[int]) -> None:
+        self.epoch += 1
+        self.identities.delete(*user_ids)
+
+
+class CachedUserRepository(UserRepository):
+    """
+    Read-through cache of user identities in front of a user repository.
+
+    A user saved through any repository of this process is dropped after
+    the commit; with the in-memory backend, other processes' writes show up
+    once entries expire, which bounds how long a revoked token keeps
+    working there.
+    """
+
+    def __init__(self, inner: UserRepository, cache: UserCache):
+        self.inner = inner
+        self.cache = cache
+
+    def get_identity(self, user_id: int) -> UserIdentity | None:
+        identity = self.cache.get(user_id)
+        if identity is None:
+            epoch = self.cache.epoch
+            identity = self.inner.get_identity(user_id)
+            if identity is None:
+                return None
+            self.cache.put(identity, epoch)
+        return identity
+
+    def get_by_username(self, username: str) -> UserModel | None:
+        return self.inner.get_by_username(username)
+
+    def save(self, user: UserModel) -> UserModel:
+        saved = self.inner.save(user)
+        self.cache.invalidate([stored_id(saved.id)])
+        return saved
+
+
+settings = Settings()
+
+user_cache = UserCache(
+    shared.namespace(
+        "user", DataclassCodec(UserIdentity), ttl=settings.USER_CACHE_TTL_SECONDS
+    )
+)
+
+subscribe(USERS, user_cache.invalidate)
+subscribe(USERS, verified_tokens.forget_users)
+
+
+def cached_user_repository(inner: UserRepository) -> UserRepository:
+    """``inner`` behind the shared user cache."""
+    return CachedUserRepository(inner, user_cache)
@@ -1,30 +1,66 @@
-from typing import List, Optional
+from dataclasses import replace
+from typing import Collection, List, Optional, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, Select
+from sqlalchemy.orm import load_only, Session
 
 from app.domain.models.category import CategoryModel
-from app.domain.repositories.category import CategoryRepository
+from app.domain.models.page import Page
+from app.domain.repositories.category import (
+    ALL_CATEGORY_FIELDS,
+    CategoryField,
+    CategoryRepository,
+)
+from app.infrastructure.database.changes import CATEGORIES, record_change
 from app.infrastructure.database.models import Category as CategoryORM
+from app.infrastructure.database.models import Post as PostORM
 from app.infrastructure.mappers.category import CategoryMapper
+from app.infrastructure.repositories.sqlalchemy.pagination import Keyset
+from app.infrastructure.repositories.sqlalchemy.pagination import KeysetColumn
+
+CATEGORY_KEYSET = Keyset(KeysetColumn(CategoryORM.id))
+
+CATEGORY_FIELD_COLUMNS = {
+    CategoryField.NAME: CategoryORM.name,
+    CategoryField.SLUG: CategoryORM.slug,
+    CategoryField.DESCRIPTION: CategoryORM.description,
+}
 
 
 class SqlAlchemyCategoryRepository(CategoryRepository):
     def __init__(self, session: Session):
         self.session = session
 
-    def get_by_id(self, category_id: int) -> Optional[CategoryModel]:
-        orm = self.session.get(CategoryORM, category_id)
-        return CategoryMapper.to_domain(orm) if orm else None
+    def get_by_id(
+        self,
+        category_id: int,
+        fields: Collection[CategoryField] = ALL_CATEGORY_FIELDS,
+    ) -> Optional[CategoryModel]:
+        orm = self.session.scalars(
+            self._select(fields).where(CategoryORM.id == category_id)
+        ).first()
+        return self._with_post_counts([orm], fields)[0] if orm else None
 
     def get_by_slug(self, slug: str) -> Optional[CategoryModel]:
         orm = self.session.query(CategoryORM).filter_by(slug=slug).first()
-        return CategoryMapper.to_domain(orm) if orm else None
+        return self._with_post_counts([orm])[0] if orm else None
 
     def get_all(self) -> List[CategoryModel]:
         return [
             CategoryMapper.to_domain(o) for o in self.session.query(CategoryORM).all()
         ]
 
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Collection[CategoryField] = ALL_CATEGORY_FIELDS,
+    ) -> Page[CategoryModel]:
+        stmt = CATEGORY_KEYSET.apply(self._select(fields), limit, cursor)
+        rows = self.session.scalars(stmt).all()
+        page = CATEGORY_KEYSET.paginate(rows, limit, cursor)
+        return replace(page, items=self._with_post_counts(page.items, fields))
+
     def save(self, category: CategoryModel) -> CategoryModel:
         orm = self.session.get(CategoryORM, category.id)
 
@@ -40,11 +76,55 @@ class SqlAlchemyCategoryRepository(CategoryRepository):
             )
             self.session.add(orm)
 
-        self.session.commit()
+        self.session.flush()
+        record_change(self.session, CATEGORIES, orm.id)
         return CategoryMapper.to_domain(orm)
 
     def delete(self, category_id: int) -> None:
         orm = self.session.get(CategoryORM, category_id)
         if orm:
             self.session.delete(orm)
-            self.session.commit()
+            self.session.flush()
+            record_change(self.session, CATEGORIES, category_id)
+
+    def _select(self, fields: Collection[CategoryField]) -> Select:
+        """The categories, reading only the columns of ``fields``."""
+        stmt = select(CategoryORM)
+        if not set(fields) >= ALL_CATEGORY_FIELDS:
+            columns = [
+                CATEGORY_FIELD_COLUMNS[f] for f in fields if f in CATEGORY_FIELD_COLUMNS
+            ]
+            stmt = stmt.options(
+                load_only(
+                    CategoryORM.id, CategoryORM.updated_at, *columns, raiseload=True
+                )
+            )
+        return stmt
+
+    def _with_post_counts(
+        self,
+        orms: Sequence[CategoryORM],
+        fields: Collection[CategoryField] = ALL_CATEGORY_FIELDS,
+    ) -> List[CategoryModel]:
+        """
+        Map ``orms``, counting their posts with one grouped query if
+        ``post_count`` is among ``fields``.
+        """
+        if not orms:
+            return []
+        if CategoryField.POST_COUNT not in fields:
+            return [CategoryMapper.to_domain(orm) for orm in orms]
+        category_ids = [orm.id for orm in orms]
+        counts: dict[int | None, int] = dict(
+            self.session.execute(
+                select(PostORM.category_id, func.count())
+                .where(PostORM.category_id.in_(category_ids))
+                .group_by(PostORM.category_id)
+            )
+            .tuples()
+            .all()
+        )
+        categories = [CategoryMapper.to_domain(orm) for orm in orms]
+        for category in categories:
+            category.post_count = counts.get(category.id, 0)
+        return categories
@@ -0,0 +1,210 @@
+"""Keyset (seek) pagination helpers shared by the SQLAlchemy repositories.
+
+Instead of ``OFFSET`` every page is fetched with a ``WHERE (k1, k2) < (:v1, :v2)``
+seek on an indexed sort key, so the cost of a page does not depend on how deep
+into the listing it is.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import operator
+from collections.abc import Callable
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import and_
+from sqlalchemy import ColumnElement
+from sqlalchemy import or_
+from sqlalchemy import Select
+from sqlalchemy import tuple_
+
+from app.core.exceptions import InvalidCursorError
+from app.domain.models.page import Page
+
+NEXT = "n"
+PREV = "p"
+
+
+@dataclass(frozen=True)
+class KeysetColumn:
+    """A column of the sort key.
+
+    ``name`` is the attribute used to read the key back from a fetched row; it
+    defaults to the column key, so labelled expressions must use the same label.
+    """
+
+    column: Any
+    name: str | None = None
+
+    @property
+    def key(self) -> str:
+        return self.name or self.column.key
+
+    def load(self, value: Any) -> Any:
+        if value is None:
+            return None
+        python_type = self.column.type.python_type
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        return python_type(value)
+
+
+@dataclass(frozen=True)
+class Position:
+    values: tuple[Any, ...]
+    direction: str
+
+
+class Keyset:
+    """Seek pagination over a uniform-direction sort key.
+
+    The first column may be nullable; ``NULL`` values always sort after every
+    non-null value, whatever the direction.
+    """
+
+    def __init__(
+        self,
+        *columns: KeysetColumn,
+        descending: bool = False,
+        nullable_first: bool = False,
+    ):
+        self.columns = columns
+        self.descending = descending
+        self.nullable_first = nullable_first
+
+    def apply(self, stmt: Select, limit: int, cursor: str | None) -> Select:
+        """Add the seek predicate, ordering and ``LIMIT`` to ``stmt``.
+
+        One row more than ``limit`` is requested so :meth:`paginate` can tell
+        whether another page exists.
+        """
+        position = self.decode(cursor) if cursor else None
+        backwards = position is not None and position.direction == PREV
+        if position is not None:
+            stmt = stmt.where(self._seek(position.values, backwards))
+        return stmt.order_by(*self._order_by(backwards)).limit(limit + 1)
+
+    def paginate(
+        self,
+        rows: Sequence[Any],
+        limit: int,
+        cursor: str | None,
+    ) -> Page[Any]:
+        """Build a :class:`Page` from the rows fetched with :meth:`apply`."""
+        position = self.decode(cursor) if cursor else None
+        items = list(rows[:limit])
+        has_more = len(rows) > limit
+
+        if position is not None and position.direction == PREV:
+            items.reverse()
+            next_cursor = self.encode(items[-1], NEXT) if items else None
+            prev_cursor = self.encode(items[0], PREV) if has_more else None
+        else:
+            next_cursor = self.encode(items[-1], NEXT) if has_more else None
+            prev_cursor = (
+                self.encode(items[0], PREV) if position is not None and items else None
+            )
+
+        return Page(
+            items=items,
+            limit=limit,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
+    def encode(self, row: Any, direction: str) -> str:
+        values = [getattr(row, column.key) for column in self.columns]
+        payload = json.dumps(
+            {"d": direction, "k": values},
+            default=_json_default,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> Position:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+            direction = payload["d"]
+            raw = payload["k"]
+            if direction not in (NEXT, PREV) or len(raw) != len(self.columns):
+                raise ValueError(cursor)
+            values = tuple(
+                column.load(value) for column, value in zip(self.columns, raw)
+            )
+        except (binascii.Error, KeyError, TypeError, ValueError) as exc:
+            raise InvalidCursorError(cursor) from exc
+
+        if not self.nullable_first and None in values:
+            raise InvalidCursorError(cursor)
+        return Position(values=values, direction=direction)
+
+    def order_by(
+        self,
+        cursor: str | None,
+        columns: Sequence[Any] | None = None,
+    ) -> list[ColumnElement[Any]]:
+        """The ``ORDER BY`` clauses :meth:`apply` uses for ``cursor``.
+
+        ``columns`` replaces the key columns, e.g. with the columns of a
+        subquery that wraps the statement built by :meth:`apply`.
+        """
+        position = self.decode(cursor) if cursor else None
+        backwards = position is not None and position.direction == PREV
+        return self._order_by(backwards, columns)
+
+    def _order_by(
+        self,
+        backwards: bool,
+        columns: Sequence[Any] | None = None,
+    ) -> list[ColumnElement[Any]]:
+        descending = self.descending != backwards
+        clauses = []
+        for index, column in enumerate(
+            columns or [keyset_column.column for keyset_column in self.columns]
+        ):
+            clause = column.desc() if descending else column.asc()
+            if index == 0 and self.nullable_first:
+                clause = clause.nulls_first() if backwards else clause.nulls_last()
+            clauses.append(clause)
+        return clauses
+
+    def _seek(self, values: tuple[Any, ...], backwards: bool) -> ColumnElement[bool]:
+        columns = [keyset_column.column for keyset_column in self.columns]
+        compare = operator.lt if self.descending != backwards else operator.gt
+
+        if not self.nullable_first:
+            return _compare(columns, values, compare)
+
+        head, *rest = columns
+        first, *others = values
+        if first is None:
+            # The cursor sits in the trailing block of NULL keys.
+            in_null_block = and_(head.is_(None), _compare(rest, others, compare))
+            if backwards:
+                return or_(head.is_not(None), in_null_block)
+            return in_null_block
+
+        seek = _compare(columns, values, compare)
+        return seek if backwards else or_(seek, head.is_(None))
+
+
+def _compare(
+    columns: Sequence[Any],
+    values: Sequence[Any],
+    compare: Callable[[Any, Any], ColumnElement[bool]],
+) -> ColumnElement[bool]:
+    if len(columns) == 1:
+        return compare(columns[0], values[0])
+    return compare(tuple_(*columns), tuple_(*values))
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Unsupported cursor value: {value!r}")
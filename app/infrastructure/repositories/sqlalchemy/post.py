@@ -1,16 +1,170 @@
 # app/infrastructure/repositories/sqlalchemy_post_repository.py
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Collection
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from dataclasses import replace
+from datetime import datetime
+from typing import Any
+from typing import cast
+
+from sqlalchemy import bindparam
+from sqlalchemy import ColumnElement
+from sqlalchemy import insert
+from sqlalchemy import or_
+from sqlalchemy import Row
+from sqlalchemy import select
+from sqlalchemy import Select
+from sqlalchemy import Table
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import LoaderOption
 
+from app.core.exceptions import InvalidPostError
 from app.domain.models.category import CategoryModel
+from app.domain.models.page import Page
+from app.domain.models.post import PostContent
+from app.domain.models.post import PostFilter
 from app.domain.models.post import PostModel
+from app.domain.models.post import PostSearchHit
+from app.domain.models.post import PostStamp
+from app.domain.models.post import post_version
+from app.domain.models.post import PostSummary
+from app.domain.models.post import RenderedContent
 from app.domain.models.tag import TagModel
+from app.domain.models.version import Version
+from app.domain.repositories.post import ALL_POST_FIELDS
+from app.domain.repositories.post import ALL_POST_RELATIONS
+from app.domain.repositories.post import PostField
+from app.domain.repositories.post import PostRelation
 from app.domain.repositories.post import PostRepository
+from app.infrastructure.database.changes import POSTS
+from app.infrastructure.database.changes import record_change
 from app.infrastructure.database.models import Category as CategoryORM
 from app.infrastructure.database.models import Post as PostORM
+from app.infrastructure.database.models import post_tags
 from app.infrastructure.database.models import Tag as TagORM
 from app.infrastructure.mappers.post import PostMapper
+from app.infrastructure.mappers.post import RENDERED_COLUMNS
+from app.infrastructure.repositories.sqlalchemy.pagination import Keyset
+from app.infrastructure.repositories.sqlalchemy.pagination import KeysetColumn
+from app.infrastructure.repositories.sqlalchemy.search import post_search
+from app.infrastructure.repositories.sqlalchemy.search import snippet_html
+from app.infrastructure.repositories.sqlalchemy.upsert import insert_ignoring_conflicts
+
+POST_KEYSET = Keyset(
+    KeysetColumn(PostORM.published_at),
+    KeysetColumn(PostORM.id),
+    descending=True,
+    nullable_first=True,
+)
+
+
+def post_loader_options(include: Collection[PostRelation]) -> list[LoaderOption]:
+    """
+    Loader options hydrating ``include`` in a constant number of queries.
+
+    The category is many-to-one, so it is joined into the main query; tags are
+    a collection and are fetched with a single ``IN`` query for the whole
+    result. Relations that are not included raise instead of lazy-loading.
+    """
+    return [
+        (
+            joinedload(PostORM.category)
+            if PostRelation.CATEGORY in include
+            else raiseload(PostORM.category)
+        ),
+        (
+            selectinload(PostORM.tags)
+            if PostRelation.TAGS in include
+            else raiseload(PostORM.tags)
+        ),
+    ]
+
+
+# Columns read whatever ``fields`` a read asks for: the keyset, the version
+# and what the mapper cannot leave empty.
+ALWAYS_READ_COLUMNS = (
+    PostORM.id,
+    PostORM.status,
+    PostORM.published_at,
+    PostORM.created_at,
+    PostORM.updated_at,
+    PostORM.category_id,
+)
+
+FIELD_COLUMNS = {
+    PostField.TITLE: (PostORM.title,),
+    PostField.SLUG: (PostORM.slug,),
+    PostField.CONTENT: (PostORM.content,),
+    PostField.RENDERED: tuple(getattr(PostORM, c) for c in RENDERED_COLUMNS),
+}
+
+
+def post_column_options(fields: Collection[PostField]) -> list[LoaderOption]:
+    """
+    Loader options reading only the columns of ``fields``; the others are
+    neither selected nor lazy-loaded later.
+    """
+    if set(fields) >= ALL_POST_FIELDS:
+        return []
+    columns = [c for f in fields for c in FIELD_COLUMNS[f]]
+    return [load_only(*ALWAYS_READ_COLUMNS, *columns, raiseload=True)]
+
+
+def post_filter_criteria(filters: PostFilter | None) -> list[ColumnElement[bool]]:
+    """
+    WHERE criteria for ``filters``.
+
+    Status and category are equality prefixes of the
+    ``ix_posts_(category_)status_published_at`` indexes, so the listing is
+    read in sort order straight from them. The tag is resolved through the
+    ``(tag_id, post_id)`` index of ``post_tags`` without touching the table.
+    """
+    if filters is None:
+        return []
+    criteria = []
+    if filters.status is not None:
+        criteria.append(PostORM.status == filters.status)
+    if filters.category is not None:
+        criteria.append(
+            PostORM.category_id
+            == select(CategoryORM.id)
+            .where(CategoryORM.slug == filters.category)
+            .scalar_subquery()
+        )
+    if filters.tag is not None:
+        criteria.append(
+            PostORM.id.in_(
+                select(post_tags.c.post_id).where(
+                    post_tags.c.tag_id
+                    == select(TagORM.id)
+                    .where(TagORM.slug == filters.tag)
+                    .scalar_subquery()
+                )
+            )
+        )
+    return criteria
+
+
+# Columns read for PostSummary; ``content`` is never selected.
+SUMMARY_COLUMNS = (
+    PostORM.id,
+    PostORM.title,
+    PostORM.slug,
+    PostORM.status,
+    PostORM.published_at,
+    PostORM.updated_at,
+    PostORM.category_id,
+)
 
 
 class SqlAlchemyPostRepository(PostRepository):
@@ -21,62 +175,406 @@ class SqlAlchemyPostRepository(PostRepository):
     def __init__(self, session: Session):
         self.session = session
 
-    def get_by_id(self, post_id: int) -> PostModel | None:
-        orm = self.session.get(PostORM, post_id)
+    def get_by_id(
+        self,
+        post_id: int,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> PostModel | None:
+        stmt = self._select(include, fields).where(PostORM.id == post_id)
+        orm = self.session.scalars(stmt).first()
         return PostMapper.to_domain(orm) if orm else None
 
-    def get_by_slug(self, slug: str) -> PostModel | None:
-        orm = self.session.query(PostORM).filter_by(slug=slug).first()
+    def get_by_slug(
+        self,
+        slug: str,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> PostModel | None:
+        stmt = self._select(include, fields).where(PostORM.slug == slug)
+        orm = self.session.scalars(stmt).first()
         return PostMapper.to_domain(orm) if orm else None
 
-    def get_all(self) -> list[PostModel]:
-        return [PostMapper.to_domain(o) for o in self.session.query(PostORM).all()]
+    def get_by_ids(
+        self,
+        ids: Collection[int],
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> list[PostModel]:
+        if not ids:
+            return []
+        stmt = self._select(include, fields).where(PostORM.id.in_(ids))
+        return [PostMapper.to_domain(o) for o in self.session.scalars(stmt)]
+
+    def get_published_stamps(
+        self,
+        ids: Collection[int] | None = None,
+    ) -> list[PostStamp]:
+        stmt = (
+            select(
+                PostORM.id,
+                PostORM.slug,
+                PostORM.published_at,
+                PostORM.updated_at,
+            )
+            .where(
+                *post_filter_criteria(PostFilter(status="published")),
+                PostORM.published_at.is_not(None),
+            )
+            .order_by(PostORM.published_at.desc(), PostORM.id.desc())
+        )
+        if ids is not None:
+            stmt = stmt.where(PostORM.id.in_(ids))
+        return [PostStamp(*row) for row in self.session.execute(stmt)]
+
+    def get_version(self, post_id: int) -> Version | None:
+        rows = self.session.execute(
+            self._version_select().where(PostORM.id == post_id)
+        ).all()
+        return next(iter(self._versions(rows)), None)
+
+    def get_version_by_slug(self, slug: str) -> Version | None:
+        rows = self.session.execute(
+            self._version_select().where(PostORM.slug == slug)
+        ).all()
+        return next(iter(self._versions(rows)), None)
+
+    def get_page_versions(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        filters: PostFilter | None = None,
+    ) -> Page[Version]:
+        stmt = self._version_select().where(*post_filter_criteria(filters))
+        stmt = POST_KEYSET.apply(stmt, limit, cursor)
+        page = POST_KEYSET.paginate(self.session.execute(stmt).all(), limit, cursor)
+        return replace(page, items=self._versions(page.items))
+
+    def get_all(
+        self,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+    ) -> list[PostModel]:
+        return [
+            PostMapper.to_domain(o)
+            for o in self.session.scalars(self._select(include)).all()
+        ]
+
+    def iter_all(
+        self,
+        batch_size: int,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+    ) -> Iterator[PostModel]:
+        """
+        Read the posts through a server-side cursor, ``batch_size`` at a time.
+
+        Only one batch of rows is buffered; each batch gets its own tag
+        query. Mapped posts are not kept by the session, so memory stays
+        flat however many posts are read.
+        """
+        stmt = (
+            self._select(include)
+            .order_by(PostORM.id)
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        for orm in self.session.scalars(stmt):
+            yield PostMapper.to_domain(orm)
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        filters: PostFilter | None = None,
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> Page[PostModel]:
+        stmt = self._select(include, fields).where(*post_filter_criteria(filters))
+        stmt = POST_KEYSET.apply(stmt, limit, cursor)
+        rows = self.session.scalars(stmt).all()
+        return POST_KEYSET.paginate(rows, limit, cursor).map(PostMapper.to_domain)
+
+    def get_summary_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        include: Collection[PostRelation] = ALL_POST_RELATIONS,
+        filters: PostFilter | None = None,
+    ) -> Page[PostSummary]:
+        stmt = self._select(include).options(
+            load_only(*SUMMARY_COLUMNS, raiseload=True),
+        )
+        stmt = stmt.where(*post_filter_criteria(filters))
+        stmt = POST_KEYSET.apply(stmt, limit, cursor)
+        rows = self.session.scalars(stmt).all()
+        return POST_KEYSET.paginate(rows, limit, cursor).map(PostMapper.to_summary)
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+    ) -> Page[PostSearchHit]:
+        search = post_search(self.session, query)
+        # The rank is recomputed for the seek. On SQLite bm25() depends on
+        # the whole corpus, so writes between two pages can shift a hit
+        # across the cursor.
+        keyset = Keyset(
+            KeysetColumn(search.rank, name="rank"),
+            KeysetColumn(search.id, name="id"),
+            descending=True,
+        )
+        ranked = keyset.apply(search.ranked(), limit, cursor).subquery("ranked")
+        stmt = search.hits(ranked).order_by(
+            *keyset.order_by(cursor, [ranked.c.rank, ranked.c.id])
+        )
+        rows = self.session.execute(stmt).all()
+        return keyset.paginate(rows, limit, cursor).map(
+            lambda row: PostSearchHit(
+                id=row.id,
+                title=row.title,
+                slug=row.slug,
+                snippet=snippet_html(row.snippet),
+                rank=row.rank,
+                published_at=row.published_at,
+            )
+        )
 
     def save(self, post: PostModel) -> PostModel:
 
-        orm = self.session.get(PostORM, post.id if post.id else None)
+        orm = None
+        if post.id:
+            stmt = self._select(ALL_POST_RELATIONS).where(PostORM.id == post.id)
+            orm = self.session.scalars(stmt).first()
 
         if orm:
             orm.title = post.title
             orm.content = post.content
             orm.slug = post.slug
             orm.status = post.status
+            orm.published_at = post.published_at
             orm.updated_at = post.updated_at
+            for column, value in PostMapper.rendered_values(post.rendered).items():
+                setattr(orm, column, value)
+            orm.category = (
+                self._resolve_category(post.category) if post.category else None
+            )
+            orm.tags = self._resolve_tags(post.tags)
         else:
             orm = self._to_orm(post)
             self.session.add(orm)
 
-        self.session.commit()
+        # Map while the instance is still fresh: after the unit of work
+        # commits every attribute is expired and would be reloaded one query
+        # at a time.
+        self.session.flush()
+        record_change(self.session, POSTS, orm.id)
         return PostMapper.to_domain(orm)
 
+    def insert_many(self, posts: Sequence[PostModel]) -> list[str | None]:
+        errors: list[str | None] = [None] * len(posts)
+        category_ids = self._ids_by_slug(
+            CategoryORM, {p.category.slug for p in posts if p.category}
+        )
+        self._create_missing_tags(t for p in posts for t in p.tags)
+        tag_ids = self._ids_by_slug(TagORM, {t.slug for p in posts for t in p.tags})
+        taken = set(
+            self.session.scalars(
+                select(PostORM.slug).where(PostORM.slug.in_({p.slug for p in posts}))
+            )
+        )
+
+        accepted: list[int] = []
+        rows: list[tuple[dict[str, Any], list[int]]] = []
+        for index, post in enumerate(posts):
+            error = self._bulk_error(post, taken, category_ids, tag_ids)
+            if error:
+                errors[index] = error
+                continue
+            taken.add(post.slug)
+            accepted.append(index)
+            rows.append(
+                (
+                    {
+                        "title": post.title,
+                        "content": post.content,
+                        "slug": post.slug,
+                        "status": post.status,
+                        "published_at": post.published_at,
+                        "category_id": (
+                            category_ids[post.category.slug] if post.category else None
+                        ),
+                        "created_at": post.created_at,
+                        "updated_at": post.updated_at,
+                        **PostMapper.rendered_values(post.rendered),
+                    },
+                    sorted({tag_ids[t.slug] for t in post.tags}),
+                )
+            )
+
+        try:
+            with self.session.begin_nested():
+                self._insert_rows(rows)
+        except SQLAlchemyError:
+            # Something slipped past the checks above (e.g. a concurrent
+            # insert of the same slug): retry row by row to isolate it.
+            for index, row in zip(accepted, rows):
+                try:
+                    with self.session.begin_nested():
+                        self._insert_rows([row])
+                except SQLAlchemyError as exc:
+                    errors[index] = str(getattr(exc, "orig", None) or exc)
+
+        return errors
+
+    def get_stale_renderings(
+        self,
+        version: int,
+        limit: int,
+        after_id: int = 0,
+    ) -> list[PostContent]:
+        stmt = (
+            select(PostORM.id, PostORM.content, PostORM.updated_at)
+            .where(
+                PostORM.id > after_id,
+                or_(
+                    PostORM.render_version.is_(None),
+                    PostORM.render_version != version,
+                ),
+            )
+            .order_by(PostORM.id)
+            .limit(limit)
+        )
+        return [PostContent(*row) for row in self.session.execute(stmt)]
+
+    def save_renderings(
+        self,
+        renderings: Sequence[tuple[PostContent, RenderedContent]],
+    ) -> int:
+        if not renderings:
+            return 0
+        # Not an edit: updated_at keeps its value, so validators and feeds
+        # do not move. A post edited meanwhile no longer matches and is left
+        # to the rendering of that edit. One executemany round trip on the
+        # table, bypassing the ORM.
+        posts = cast(Table, PostORM.__table__)
+        stmt = (
+            update(posts)
+            .where(
+                posts.c.id == bindparam("post_id"),
+                posts.c.updated_at == bindparam("read_updated_at"),
+            )
+            .values(
+                updated_at=posts.c.updated_at,
+                **{c: bindparam(c) for c in RENDERED_COLUMNS},
+            )
+        )
+        result = self.session.execute(
+            stmt,
+            [
+                {
+                    "post_id": post.id,
+                    "read_updated_at": post.updated_at,
+                    **PostMapper.rendered_values(rendered),
+                }
+                for post, rendered in renderings
+            ],
+        )
+        record_change(self.session, POSTS, *(post.id for post, _ in renderings))
+        return result.rowcount
+
     def delete(self, post_id: int) -> None:
         orm = self.session.get(PostORM, post_id)
         if orm:
             self.session.delete(orm)
-            self.session.commit()
-
-    def _to_domain(self, orm: PostORM) -> PostModel:
-        category = None
-        if orm.category:
-            category = CategoryModel(
-                id=orm.category.id,
-                name=orm.category.name,
-                slug=orm.category.slug,
-                description=orm.category.description,
-            )
-        tags = [TagModel(id=t.id, name=t.name, slug=t.slug) for t in orm.tags]
-        return PostModel(
-            id=orm.id,
-            title=orm.title,
-            content=orm.content,
-            category=category,
-            tags=tags,
-            status=orm.status,
-            published_at=orm.published_at,
-            created_at=orm.created_at,
-            updated_at=orm.updated_at,
+            self.session.flush()
+            record_change(self.session, POSTS, post_id)
+
+    def _select(
+        self,
+        include: Collection[PostRelation],
+        fields: Collection[PostField] = ALL_POST_FIELDS,
+    ) -> Select:
+        return select(PostORM).options(
+            *post_loader_options(include),
+            *post_column_options(fields),
         )
 
+    def _version_select(self) -> Select:
+        return select(
+            PostORM.id,
+            PostORM.published_at,
+            PostORM.updated_at,
+            PostORM.category_id,
+            CategoryORM.updated_at.label("category_updated_at"),
+        ).outerjoin(CategoryORM, CategoryORM.id == PostORM.category_id)
+
+    def _versions(self, rows: Sequence[Row]) -> list[Version]:
+        """Versions of the posts in ``rows``, with one query for all their tags."""
+        tags: dict[int, list[tuple[int, datetime]]] = defaultdict(list)
+        if rows:
+            stmt = (
+                select(post_tags.c.post_id, TagORM.id, TagORM.updated_at)
+                .join(TagORM, TagORM.id == post_tags.c.tag_id)
+                .where(post_tags.c.post_id.in_([row.id for row in rows]))
+            )
+            for post_id, tag_id, updated_at in self.session.execute(stmt):
+                tags[post_id].append((tag_id, updated_at))
+        return [
+            post_version(
+                row.id,
+                row.updated_at,
+                (
+                    (row.category_id, row.category_updated_at)
+                    if row.category_id is not None
+                    else None
+                ),
+                tags[row.id],
+            )
+            for row in rows
+        ]
+
+    def _insert_rows(self, rows: Sequence[tuple[dict[str, Any], list[int]]]) -> None:
+        """Two executemany round trips: one for the posts, one for their tags."""
+        if not rows:
+            return
+        ids = self.session.scalars(
+            insert(PostORM).returning(PostORM.id, sort_by_parameter_order=True),
+            [values for values, _ in rows],
+        ).all()
+        links = [
+            {"post_id": post_id, "tag_id": tag_id}
+            for post_id, (_, tags) in zip(ids, rows)
+            for tag_id in tags
+        ]
+        if links:
+            self.session.execute(insert(post_tags), links)
+        record_change(self.session, POSTS, *ids)
+
+    def _ids_by_slug(
+        self,
+        model: type[CategoryORM] | type[TagORM],
+        slugs: Collection[str],
+    ) -> dict[str, int]:
+        if not slugs:
+            return {}
+        stmt = select(model.slug, model.id).where(model.slug.in_(slugs))
+        return {slug: id_ for slug, id_ in self.session.execute(stmt)}
+
+    @staticmethod
+    def _bulk_error(
+        post: PostModel,
+        taken: set[str],
+        category_ids: dict[str, int],
+        tag_ids: dict[str, int],
+    ) -> str | None:
+        if post.slug in taken:
+            return f"Post with slug '{post.slug}' already exists"
+        if post.category and post.category.slug not in category_ids:
+            return f"Category '{post.category.slug}' does not exist"
+        missing = sorted(t.slug for t in post.tags if t.slug not in tag_ids)
+        if missing:
+            return f"Tags could not be created: {', '.join(missing)}"
+        return None
+
     def _to_orm(self, post: PostModel) -> PostORM:
         orm = PostORM(
             title=post.title,
@@ -84,14 +582,62 @@ class SqlAlchemyPostRepository(PostRepository):
             slug=post.slug,
             status=post.status,
             published_at=post.published_at,
+            **PostMapper.rendered_values(post.rendered),
         )
         if post.category:
-            orm.category = self.session.get(CategoryORM, post.category.id)
+            orm.category = self._resolve_category(post.category)
+        orm.tags = self._resolve_tags(post.tags)
+        return orm
 
-        # TODO - Revisar esto
-        orm.tags = [
-            tag
-            for tag in (self.session.get(TagORM, t.id) for t in post.tags if t.id)
-            if tag is not None
-        ]
+    def _resolve_category(self, category: CategoryModel) -> CategoryORM:
+        stmt = select(CategoryORM).where(
+            CategoryORM.id == category.id
+            if category.id
+            else CategoryORM.slug == category.slug
+        )
+        orm = self.session.scalars(stmt).first()
+        if orm is None:
+            raise InvalidPostError(
+                [f"Category '{category.id or category.slug}' does not exist"]
+            )
         return orm
+
+    def _resolve_tags(self, tags: Sequence[TagModel]) -> list[TagORM]:
+        """
+        Resolve ``tags`` in two statements whatever their number.
+
+        Tags given only by slug are created first if missing; then every tag is
+        fetched with a single ``IN`` query on ids and slugs.
+        """
+        if not tags:
+            return []
+        self._create_missing_tags(tags)
+
+        ids = {t.id for t in tags if t.id}
+        slugs = {t.slug for t in tags if not t.id}
+        found = self.session.scalars(
+            select(TagORM).where(or_(TagORM.id.in_(ids), TagORM.slug.in_(slugs)))
+        ).all()
+        by_id = {t.id: t for t in found}
+        by_slug = {t.slug: t for t in found}
+
+        resolved: list[TagORM] = []
+        missing: list[str] = []
+        for tag in tags:
+            orm = by_id.get(tag.id) if tag.id else by_slug.get(tag.slug)
+            if orm is None:
+                missing.append(str(tag.id or tag.slug))
+            elif orm not in resolved:
+                resolved.append(orm)
+        if missing:
+            raise InvalidPostError([f"Tags do not exist: {', '.join(missing)}"])
+        return resolved
+
+    def _create_missing_tags(self, tags: Iterable[TagModel]) -> None:
+        """Get-or-create tags referenced by slug in one ``ON CONFLICT`` insert."""
+        rows = {t.slug: {"name": t.name, "slug": t.slug} for t in tags if not t.id}
+        if rows:
+            self.session.execute(
+                insert_ignoring_conflicts(self.session, cast(Table, TagORM.__table__)),
+                list(rows.values()),
+            )
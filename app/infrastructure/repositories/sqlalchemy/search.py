@@ -0,0 +1,163 @@
+"""
+Dialect-specific pieces of the post full-text search query.
+
+Both backends expose the same three expressions: a filter matching the
+query against the index, a relevance score where higher is better, and a
+snippet of the best-matching column. The database marks the matched terms
+with placeholder characters; ``snippet_html`` then escapes the snippet and
+turns them into ``<mark>`` tags, so no markup from the post itself survives.
+"""
+
+from __future__ import annotations
+
+import html
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import column
+from sqlalchemy import ColumnElement
+from sqlalchemy import Float
+from sqlalchemy import func
+from sqlalchemy import Integer
+from sqlalchemy import literal_column
+from sqlalchemy import select
+from sqlalchemy import Select
+from sqlalchemy import Subquery
+from sqlalchemy import table
+from sqlalchemy import TableClause
+from sqlalchemy import Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models import Post as PostORM
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+# What the database wraps matches in: private-use characters, which are
+# left alone by escaping and do not occur in ordinary text.
+MATCH_START = "\ue000"
+MATCH_STOP = "\ue001"
+ELLIPSIS = "…"
+SNIPPET_WORDS = 24
+# Title matches count this much more than content matches on SQLite,
+# in line with the A/B weights of the PostgreSQL vector.
+TITLE_WEIGHT = 10.0
+
+# Text search configuration of the generated ``posts.search_vector`` column.
+TS_CONFIG: ColumnElement[Any] = literal_column("'english'::regconfig")
+
+# The SQLite FTS5 index, joined to posts on its rowid.
+POSTS_FTS = table("posts_fts", column("rowid", Integer))
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """
+    Expressions for one search.
+
+    ``ranked`` only touches the index and is what gets sorted and limited;
+    ``hits`` then reads the posts and builds snippets for that page alone,
+    as snippets are by far the most expensive part of the query.
+    """
+
+    match: ColumnElement[bool]
+    rank: ColumnElement[float]
+    snippet: ColumnElement[str]
+    id: ColumnElement[int]
+    index: TableClause | None = None
+
+    def ranked(self) -> Select:
+        stmt = select(self.id.label("id"), self.rank.label("rank"))
+        if self.index is not None:
+            stmt = stmt.select_from(self.index)
+        return stmt.where(self.match)
+
+    def hits(self, ranked: Subquery) -> Select:
+        stmt = select(
+            PostORM.id,
+            PostORM.title,
+            PostORM.slug,
+            PostORM.published_at,
+            ranked.c.rank,
+            self.snippet.label("snippet"),
+        ).join_from(ranked, PostORM, PostORM.id == ranked.c.id)
+        if self.index is None:
+            return stmt
+        # snippet() needs the FTS5 cursor of a MATCH on the same row.
+        return stmt.join(self.index, self.index.c.rowid == ranked.c.id).where(
+            self.match
+        )
+
+
+def postgres_search(query: str) -> SearchQuery:
+    search_vector = literal_column("posts.search_vector", TSVECTOR)
+    tsquery = func.websearch_to_tsquery(TS_CONFIG, query)
+    return SearchQuery(
+        match=search_vector.op("@@")(tsquery),
+        rank=func.ts_rank_cd(search_vector, tsquery, type_=Float),
+        snippet=func.ts_headline(
+            TS_CONFIG,
+            PostORM.content,
+            tsquery,
+            f'StartSel="{MATCH_START}", StopSel="{MATCH_STOP}", '
+            f"FragmentDelimiter={ELLIPSIS}, MaxFragments=2, "
+            f"MaxWords={SNIPPET_WORDS // 2}, MinWords=5",
+            type_=Text,
+        ),
+        id=PostORM.id.expression,
+    )
+
+
+def sqlite_search(query: str) -> SearchQuery:
+    fts: ColumnElement[Any] = literal_column(POSTS_FTS.name)
+    return SearchQuery(
+        match=fts.op("MATCH")(fts5_query(query)),
+        # bm25() is lower for better matches.
+        rank=-func.bm25(fts, TITLE_WEIGHT, 1.0, type_=Float),
+        snippet=func.snippet(
+            fts,
+            -1,
+            MATCH_START,
+            MATCH_STOP,
+            ELLIPSIS,
+            SNIPPET_WORDS,
+            type_=Text,
+        ),
+        id=POSTS_FTS.c.rowid,
+        index=POSTS_FTS,
+    )
+
+
+def snippet_html(snippet: str) -> str:
+    """A snippet from the database as HTML, its matches in ``<mark>``."""
+    return (
+        html.escape(snippet, quote=False)
+        .replace(MATCH_START, HIGHLIGHT_START)
+        .replace(MATCH_STOP, HIGHLIGHT_STOP)
+    )
+
+
+def fts5_query(query: str) -> str:
+    """
+    Quote every term so user input can never be parsed as FTS5 syntax.
+
+    Quoted terms are ANDed, like ``websearch_to_tsquery`` does for plain words.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+SEARCH_BUILDERS = {
+    "postgresql": postgres_search,
+    "sqlite": sqlite_search,
+}
+
+
+def post_search(session: Session, query: str) -> SearchQuery:
+    dialect = session.get_bind().dialect.name
+    try:
+        build = SEARCH_BUILDERS[dialect]
+    except KeyError:
+        raise NotImplementedError(
+            f"Full-text search is not supported for dialect '{dialect}'"
+        ) from None
+    return build(query)
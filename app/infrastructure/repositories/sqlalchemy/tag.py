@@ -1,47 +1,117 @@
-from typing import List, Optional
+from dataclasses import replace
+from typing import Collection, List, Optional, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, Select
+from sqlalchemy.orm import load_only, Session
 
+from app.domain.models.page import Page
 from app.domain.models.tag import TagModel
-from app.domain.repositories.tag import TagRepository
+from app.domain.repositories.tag import ALL_TAG_FIELDS, TagField, TagRepository
+from app.infrastructure.database.changes import TAGS, record_change
 from app.infrastructure.database.models import Tag as TagORM
+from app.infrastructure.database.models import post_tags
 from app.infrastructure.mappers.tag import TagMapper
+from app.infrastructure.repositories.sqlalchemy.pagination import Keyset
+from app.infrastructure.repositories.sqlalchemy.pagination import KeysetColumn
+
+TAG_KEYSET = Keyset(KeysetColumn(TagORM.id))
+
+TAG_FIELD_COLUMNS = {
+    TagField.NAME: TagORM.name,
+    TagField.SLUG: TagORM.slug,
+}
 
 
 class SqlAlchemyTagRepository(TagRepository):
     def __init__(self, session: Session):
         self.session = session
 
-    def get_by_id(self, tag_id: int) -> Optional[TagModel]:
-        orm = self.session.get(TagORM, tag_id)
-        return TagMapper.to_domain(orm) if orm else None
+    def get_by_id(
+        self,
+        tag_id: int,
+        fields: Collection[TagField] = ALL_TAG_FIELDS,
+    ) -> Optional[TagModel]:
+        orm = self.session.scalars(
+            self._select(fields).where(TagORM.id == tag_id)
+        ).first()
+        return self._with_post_counts([orm], fields)[0] if orm else None
 
     def get_by_slug(self, slug: str) -> Optional[TagModel]:
         orm = self.session.query(TagORM).filter_by(slug=slug).first()
-        return TagMapper.to_domain(orm) if orm else None
+        return self._with_post_counts([orm])[0] if orm else None
 
     def get_all(self) -> List[TagModel]:
         tags = self.session.query(TagORM).all()
         return [TagMapper.to_domain(o) for o in tags]
 
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Collection[TagField] = ALL_TAG_FIELDS,
+    ) -> Page[TagModel]:
+        stmt = TAG_KEYSET.apply(self._select(fields), limit, cursor)
+        rows = self.session.scalars(stmt).all()
+        page = TAG_KEYSET.paginate(rows, limit, cursor)
+        return replace(page, items=self._with_post_counts(page.items, fields))
+
     def save(self, tag: TagModel) -> TagModel:
-        if tag.id:
-            orm = self.session.get(TagORM, tag.id)
-            if orm:
-                orm.name = tag.name
-                orm.slug = tag.slug
+        orm = self.session.get(TagORM, tag.id) if tag.id else None
+        if orm:
+            orm.name = tag.name
+            orm.slug = tag.slug
         else:
             orm = TagORM(name=tag.name, slug=tag.slug)
             self.session.add(orm)
 
-        self.session.commit()
+        self.session.flush()
+        record_change(self.session, TAGS, orm.id)
         return TagMapper.to_domain(orm)
 
     def delete(self, tag_id: int) -> None:
         orm = self.session.get(TagORM, tag_id)
         if orm:
             self.session.delete(orm)
-            self.session.commit()
+            self.session.flush()
+            record_change(self.session, TAGS, tag_id)
+
+    def _select(self, fields: Collection[TagField]) -> Select:
+        """The tags, reading only the columns of ``fields``."""
+        stmt = select(TagORM)
+        if not set(fields) >= ALL_TAG_FIELDS:
+            columns = [TAG_FIELD_COLUMNS[f] for f in fields if f in TAG_FIELD_COLUMNS]
+            stmt = stmt.options(
+                load_only(TagORM.id, TagORM.updated_at, *columns, raiseload=True)
+            )
+        return stmt
+
+    def _with_post_counts(
+        self,
+        orms: Sequence[TagORM],
+        fields: Collection[TagField] = ALL_TAG_FIELDS,
+    ) -> List[TagModel]:
+        """
+        Map ``orms``, counting their posts with one grouped query if
+        ``post_count`` is among ``fields``.
+        """
+        if not orms:
+            return []
+        if TagField.POST_COUNT not in fields:
+            return [TagMapper.to_domain(orm) for orm in orms]
+        tag_ids = [orm.id for orm in orms]
+        counts: dict[int | None, int] = dict(
+            self.session.execute(
+                select(post_tags.c.tag_id, func.count())
+                .where(post_tags.c.tag_id.in_(tag_ids))
+                .group_by(post_tags.c.tag_id)
+            )
+            .tuples()
+            .all()
+        )
+        tags = [TagMapper.to_domain(orm) for orm in orms]
+        for tag in tags:
+            tag.post_count = counts.get(tag.id, 0)
+        return tags
 
     def _to_domain(self, orm: TagORM) -> TagModel:
         return TagModel(
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import delete, exists, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.domain.repositories.token import RevokedTokenRepository
+from app.infrastructure.database import utc_now
+from app.infrastructure.database.changes import TOKENS, record_change
+from app.infrastructure.database.models import RevokedToken as RevokedTokenORM
+
+
+class SqlAlchemyRevokedTokenRepository(RevokedTokenRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def revoke(self, token_id: str, expires_at: datetime) -> bool:
+        # The primary key settles concurrent revocations of the same token:
+        # exactly one insert succeeds.
+        try:
+            with self.session.begin_nested():
+                self.session.add(RevokedTokenORM(jti=token_id, expires_at=expires_at))
+        except IntegrityError:
+            return False
+        record_change(self.session, TOKENS, token_id)
+        return True
+
+    def is_revoked(self, token_id: str) -> bool:
+        return bool(
+            self.session.scalar(select(exists().where(RevokedTokenORM.jti == token_id)))
+        )
+
+    def list_revoked(self, since: datetime | None = None) -> list[str]:
+        query = select(RevokedTokenORM.jti).where(
+            RevokedTokenORM.expires_at > utc_now()
+        )
+        if since is not None:
+            query = query.where(RevokedTokenORM.revoked_at >= since)
+        return list(self.session.scalars(query))
+
+    def purge_expired(self) -> int:
+        result = self.session.execute(
+            delete(RevokedTokenORM).where(RevokedTokenORM.expires_at <= utc_now())
+        )
+        return result.rowcount
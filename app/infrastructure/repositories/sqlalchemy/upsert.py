@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from sqlalchemy import Insert
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+
+
+def insert_ignoring_conflicts(session: Session, table: Table) -> Insert:
+    """
+    ``INSERT ... ON CONFLICT DO NOTHING`` for the session's dialect.
+
+    Rows clashing with any unique constraint are skipped instead of failing
+    the statement, which makes get-or-create a single round trip that is safe
+    against concurrent writers.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(table).on_conflict_do_nothing()
+    if dialect == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing()
+    raise NotImplementedError(f"ON CONFLICT is not supported for dialect '{dialect}'")
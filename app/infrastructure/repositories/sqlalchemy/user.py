@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.domain.models.user import UserModel
+from app.domain.models.user import UserIdentity, UserModel
 from app.domain.repositories.user import UserRepository
-from app.infrastructure.auth import PasswordService
+from app.infrastructure.database.changes import USERS, record_change
 from app.infrastructure.database.models import User as UserORM
+from app.infrastructure.mappers.user import UserMapper
 
 
 class SqlAlchemyUserRepository(UserRepository):
@@ -18,32 +20,33 @@ class SqlAlchemyUserRepository(UserRepository):
         )
         if not user_orm:
             return None
-        return UserModel(
-            id=user_orm.id,
-            username=user_orm.username,
-            hashed_password=user_orm.hashed_password,
-        )
+        return UserMapper.to_domain(user_orm)
+
+    def get_identity(self, user_id: int) -> UserIdentity | None:
+        row = self.session.execute(
+            select(UserORM.id, UserORM.username, UserORM.token_version).where(
+                UserORM.id == user_id
+            )
+        ).first()
+        return UserIdentity(*row) if row else None
 
     def save(self, user: UserModel) -> UserModel:
+        # The password is stored as hashed by the domain model
+        # (UserModel.set_password), never hashed again here.
         if user.id:
             user_orm = self.session.get(UserORM, user.id)
             if not user_orm:
                 raise ValueError("User not found")
             user_orm.username = user.username
-            user_orm.hashed_password = PasswordService.hash_password(
-                user.hashed_password
-            )
+            user_orm.hashed_password = user.hashed_password
+            user_orm.token_version = user.token_version
         else:
             user_orm = UserORM(
                 username=user.username,
-                hashed_password=PasswordService.hash_password(user.hashed_password),
+                hashed_password=user.hashed_password,
             )
             self.session.add(user_orm)
 
-        self.session.commit()
-        self.session.refresh(user_orm)
-        return UserModel(
-            id=user_orm.id,
-            username=user_orm.username,
-            hashed_password=user_orm.hashed_password,
-        )
+        self.session.flush()
+        record_change(self.session, USERS, user_orm.id)
+        return UserMapper.to_domain(user_orm)
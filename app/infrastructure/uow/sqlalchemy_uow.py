@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from types import TracebackType
+
+from sqlalchemy.orm import Session
+
+from app.application.uow import UnitOfWork
+from app.infrastructure.repositories.sqlalchemy.category import (
+    SqlAlchemyCategoryRepository,
+)
+from app.infrastructure.repositories.sqlalchemy.post import SqlAlchemyPostRepository
+from app.infrastructure.repositories.sqlalchemy.tag import SqlAlchemyTagRepository
+from app.infrastructure.repositories.sqlalchemy.token import (
+    SqlAlchemyRevokedTokenRepository,
+)
+from app.infrastructure.repositories.sqlalchemy.user import SqlAlchemyUserRepository
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork):
+    """
+    Unit of work over the request session.
+
+    The session belongs to the caller (``get_db`` / ``get_async_db``), so it
+    is rolled back on error but never closed here.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.posts = SqlAlchemyPostRepository(session)
+        self.tags = SqlAlchemyTagRepository(session)
+        self.categories = SqlAlchemyCategoryRepository(session)
+        self.users = SqlAlchemyUserRepository(session)
+        self.revoked_tokens = SqlAlchemyRevokedTokenRepository(session)
+
+    def __enter__(self) -> SqlAlchemyUnitOfWork:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            self.rollback()
+
+    def commit(self) -> None:
+        self.session.commit()
+
+    def rollback(self) -> None:
+        self.session.rollback()
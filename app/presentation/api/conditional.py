@@ -0,0 +1,130 @@
+"""Conditional GET (RFC 9110 section 13) for responses with known validators."""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from email.utils import format_datetime
+from email.utils import parsedate_to_datetime
+
+from fastapi import Request
+from fastapi import Response
+from fastapi import status
+
+from app.domain.models.page import Page
+from app.domain.models.version import Version
+
+# API responses are per user: clients may keep them but must revalidate.
+REVALIDATE = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class Validators:
+    """
+    Strong ETag, and Last-Modified when meaningful, of a representation
+    built from resources with known ``Version``s.
+
+    ``kind`` names the representation, so that two renderings of the same
+    rows never share an ETag.
+    """
+
+    etag: str
+    last_modified: datetime | None = None
+
+    @classmethod
+    def for_resource(cls, kind: str, version: Version) -> Validators:
+        return cls(_etag(kind, [version]), version.updated_at)
+
+    @classmethod
+    def for_page(cls, kind: str, page: Page[Version]) -> Validators:
+        # No Last-Modified: a post leaving the page makes none of the
+        # remaining ones newer, so only the ETag notices it.
+        return cls(_etag(kind, page.items, page.next_cursor, page.prev_cursor))
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": REVALIDATE}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                _utc(self.last_modified), usegmt=True
+            )
+        return headers
+
+    def matches(self, request: Request) -> bool:
+        return not_modified(request, self.etag, self.last_modified)
+
+    def not_modified(self) -> Response:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers()
+        )
+
+
+def is_conditional(request: Request) -> bool:
+    """
+    Whether the client holds a copy to revalidate, making it worth checking
+    the versions before loading anything else.
+    """
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def _etag(kind: str, versions: Iterable[Version], *extra: str | None) -> str:
+    digest = hashlib.blake2b(kind.encode(), digest_size=16)
+    for v in versions:
+        stamp = _utc(v.updated_at).isoformat() if v.updated_at else ""
+        digest.update(f"\n{v.id} {stamp} {v.parts}".encode())
+    for value in extra:
+        digest.update(f"\n{value or ''}".encode())
+    return '"' + digest.hexdigest() + '"'
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    *,
+    etag: str,
+    last_modified: datetime | None = None,
+    media_type: str | None = None,
+    cache_control: str | None = None,
+) -> Response:
+    """
+    ``body`` with its validators, or an empty 304 when the client's copy is
+    current according to ``If-None-Match`` or, failing that,
+    ``If-Modified-Since``.
+    """
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_utc(last_modified), usegmt=True)
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+
+    if not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
+
+
+def not_modified(
+    request: Request,
+    etag: str,
+    last_modified: datetime | None = None,
+) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence; comparison is weak.
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have a one second resolution.
+    return _utc(last_modified).replace(microsecond=0) <= _utc(since)
+
+
+def _utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,70 @@
+"""
+Sparse fieldsets: ``?fields=id,title,slug`` names the response fields a
+client wants; the others are neither read nor sent.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import Query
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel
+
+Fields = frozenset[str] | None
+
+
+def sparse_fields(schema: type[BaseModel]) -> Callable[..., Fields]:
+    """
+    Dependency reading ``?fields=`` as a subset of ``schema``'s fields, or
+    ``None`` when every field is wanted. Unknown names are rejected like
+    any other invalid parameter.
+    """
+    known = tuple(schema.model_fields)
+
+    def dependency(
+        fields: str | None = Query(
+            None,
+            description=f"Comma-separated fields to return, of: {', '.join(known)}",
+        ),
+    ) -> Fields:
+        if fields is None:
+            return None
+        names = frozenset(name.strip() for name in fields.split(",") if name.strip())
+        unknown = sorted(names.difference(known))
+        if unknown or not names:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "value_error",
+                        "loc": ("query", "fields"),
+                        "msg": (
+                            f"Unknown fields: {', '.join(unknown)}"
+                            if unknown
+                            else "No fields given"
+                        ),
+                        "input": fields,
+                    }
+                ]
+            )
+        return names
+
+    return dependency
+
+
+def with_fields(kind: str, fields: Fields) -> str:
+    """``kind`` of a representation narrowed to ``fields``, for its ETag."""
+    return kind if fields is None else f"{kind};fields={','.join(sorted(fields))}"
+
+
+def page_include(fields: Fields) -> dict[str, Any] | None:
+    """What to serialize of a ``PageResponse`` whose items are narrowed."""
+    if fields is None:
+        return None
+    return {
+        "items": {"__all__": set(fields)},
+        "limit": True,
+        "next_cursor": True,
+        "prev_cursor": True,
+    }
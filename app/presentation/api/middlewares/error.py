@@ -17,8 +17,10 @@ from app.core.exceptions import ConnectionError
 from app.core.exceptions import DatabaseError
 from app.core.exceptions import DomainValidationError
 from app.core.exceptions import InvalidPostError
+from app.core.exceptions import OverloadedError
 from app.core.exceptions import PostException
 from app.core.exceptions import PostNotFoundError
+from app.core.exceptions import RateLimitError
 from app.core.exceptions import TransactionError
 from app.core.exceptions import UnauthorizedError
 
@@ -30,6 +32,7 @@ def create_error_response(
     error_type: str,
     message: str,
     details: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
 ) -> JSONResponse:
     """Create a standardized error response."""
     content: dict[str, str | dict[str, Any]] = {
@@ -42,6 +45,7 @@ def create_error_response(
     return JSONResponse(
         status_code=status_code or status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=content,
+        headers=headers,
     )
 
 
@@ -84,6 +88,16 @@ def add_error_handlers(app: FastAPI) -> None:
             status.HTTP_401_UNAUTHORIZED,
             'UNAUTHORIZED',
         ),
+        ExceptionHandlerConfig(
+            RateLimitError,
+            status.HTTP_429_TOO_MANY_REQUESTS,
+            'RATE_LIMITED',
+        ),
+        ExceptionHandlerConfig(
+            OverloadedError,
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            'OVERLOADED',
+        ),
         ExceptionHandlerConfig(
             ConnectionError,
             status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -157,6 +171,7 @@ def add_error_handlers(app: FastAPI) -> None:
                 error_type=config.error_type,
                 message=message,
                 details=details,
+                headers=getattr(exc, 'headers', None),
             )
 
         app.add_exception_handler(config.exc_class, handler)
@@ -4,7 +4,7 @@ from fastapi import Request, Response
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.infrastructure.database import SessionLocal
+from app.infrastructure.database import AsyncSessionLocal
 
 
 async def db_health_check_middleware(request: Request, call_next: Callable) -> Response:
@@ -24,14 +24,12 @@ async def db_health_check_middleware(request: Request, call_next: Callable) -> R
 
     try:
         if is_health_check:
-            db = SessionLocal()
-            try:
-                db.execute(text("SELECT 1"))
-            except SQLAlchemyError as e:
-                is_db_healthy = False
-                db_status = str(e)
-            finally:
-                db.close()
+            async with AsyncSessionLocal() as db:
+                try:
+                    await db.execute(text("SELECT 1"))
+                except SQLAlchemyError as e:
+                    is_db_healthy = False
+                    db_status = str(e)
     except Exception as e:
         is_db_healthy = False
         db_status = str(e)
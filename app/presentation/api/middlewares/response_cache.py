@@ -0,0 +1,229 @@
+"""
+Serve repeated GETs of the listed paths from rendered responses.
+
+Only authenticated ``GET`` requests under one of the cached path prefixes
+are looked up, keyed by path and query string, and only complete ``200``
+responses are stored (see ``app.infrastructure.cache.responses`` for how
+writes retire them). Concurrent misses for the same key wait for the first
+one to render instead of running the same queries again.
+
+A request that is not authenticated, or that the cache cannot answer, is
+passed on untouched, so the application still produces its own errors.
+Conditional requests are answered from the cached validators.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+
+from fastapi import HTTPException
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from app.infrastructure.cache.responses import CachedResponse
+from app.infrastructure.cache.responses import ResponseCache
+from app.infrastructure.database import SessionLocal
+from app.infrastructure.dependencies.auth import authenticate
+from app.infrastructure.repositories.sqlalchemy.token import (
+    SqlAlchemyRevokedTokenRepository,
+)
+from app.infrastructure.repositories.sqlalchemy.user import SqlAlchemyUserRepository
+from app.presentation.api.conditional import not_modified
+
+CONDITIONAL_HEADERS = frozenset({b"if-none-match", b"if-modified-since"})
+# Headers of a 304, which carries no body (RFC 9110 section 15.4.5).
+NOT_MODIFIED_HEADERS = frozenset({"etag", "last-modified", "cache-control", "vary"})
+
+
+class ResponseCacheMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        cache: ResponseCache,
+        paths: Sequence[str],
+        max_body_bytes: int,
+    ):
+        self.app = app
+        self.cache = cache
+        self.paths = tuple(paths)
+        self.max_body_bytes = max_body_bytes
+        self._inflight: dict[str, asyncio.Future[CachedResponse | None]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._cacheable(scope):
+            await self.app(scope, receive, send)
+            return
+
+        token = _bearer_token(scope)
+        if token is None or not await run_in_threadpool(_authenticated, token):
+            await self.app(scope, receive, send)
+            return
+
+        key = _key(scope)
+        generation = await self.cache.generation()
+        cached = await self.cache.get(generation, key)
+        if cached is not None:
+            await _replay(scope, send, cached, "HIT")
+            return
+
+        rendered = await self._render(scope, receive, generation, key)
+        if rendered is None:
+            # Another request's rendering could not be stored.
+            await self.app(scope, receive, send)
+            return
+        await _replay(scope, send, rendered, "MISS")
+
+    def _cacheable(self, scope: Scope) -> bool:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return False
+        path: str = scope["path"]
+        return path.startswith(self.paths)
+
+    async def _render(
+        self,
+        scope: Scope,
+        receive: Receive,
+        generation: str,
+        key: str,
+    ) -> CachedResponse | None:
+        """
+        Render ``key`` once however many requests miss it at the same time.
+
+        The request that renders gets its response, stored or not; the ones
+        that waited for it get ``None`` when it could not be stored.
+        """
+        flight = f"{generation}:{key}"
+        pending = self._inflight.get(flight)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[CachedResponse | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[flight] = future
+        stored = None
+        try:
+            rendered = await self._capture(_unconditional(scope), receive)
+            if self._storable(rendered):
+                stored = rendered
+                await self.cache.put(generation, key, rendered)
+        finally:
+            # Waiters render for themselves if nothing was stored.
+            future.set_result(stored)
+            del self._inflight[flight]
+        return rendered
+
+    def _storable(self, response: CachedResponse) -> bool:
+        return (
+            response.status == 200
+            and len(response.body) <= self.max_body_bytes
+            and response.header("set-cookie") is None
+        )
+
+    async def _capture(self, scope: Scope, receive: Receive) -> CachedResponse:
+        status = 500
+        headers: list[tuple[str, str]] = []
+        chunks: list[bytes] = []
+
+        async def send(message: Message) -> None:
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = [
+                    (k.decode("latin-1"), v.decode("latin-1"))
+                    for k, v in message["headers"]
+                ]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return CachedResponse(status, headers, b"".join(chunks))
+
+
+def _authenticated(token: str) -> bool:
+    # The session only connects if the user's identity is not cached.
+    with SessionLocal() as db:
+        try:
+            authenticate(
+                token,
+                SqlAlchemyUserRepository(db),
+                SqlAlchemyRevokedTokenRepository(db),
+            )
+        except HTTPException:
+            return False
+    return True
+
+
+def _bearer_token(scope: Scope) -> str | None:
+    headers: list[tuple[bytes, bytes]] = scope["headers"]
+    for name, value in headers:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return token.strip()
+    return None
+
+
+def _key(scope: Scope) -> str:
+    # Parameter order does not change the response.
+    query = parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True)
+    return f"{scope['path']}?{urlencode(sorted(query))}"
+
+
+def _unconditional(scope: Scope) -> Scope:
+    """
+    ``scope`` without validators: the rendered response is stored for every
+    client, whatever copy this one holds.
+    """
+    headers = [(k, v) for k, v in scope["headers"] if k not in CONDITIONAL_HEADERS]
+    return {**scope, "headers": headers}
+
+
+async def _replay(
+    scope: Scope, send: Send, cached: CachedResponse, outcome: str
+) -> None:
+    last_modified = cached.header("last-modified")
+    etag = cached.header("etag")
+    if (
+        cached.status == 200
+        and etag is not None
+        and not_modified(Request(scope), etag, _http_date(last_modified))
+    ):
+        status = 304
+        headers = [
+            (k, v) for k, v in cached.headers if k.lower() in NOT_MODIFIED_HEADERS
+        ]
+        body = b""
+    else:
+        status, headers, body = cached.status, cached.headers, cached.body
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                *((k.encode("latin-1"), v.encode("latin-1")) for k, v in headers),
+                (b"x-cache", outcome.encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def _http_date(value: str | None) -> datetime | None:
+    if value is None:
+        return None
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,46 @@
+"""
+JSON responses for data the application built itself.
+
+FastAPI validates whatever a route returns against its ``response_model``
+before serializing it, which for DTOs mapped from domain objects repeats the
+validation they went through when they were built. Routes return
+``ORJSONResponse`` instead, which serializes them as they are; their
+``response_model`` still documents them.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    Models are serialized by their own compiled serializer, the same as
+    ``TypeAdapter(type(model)).dump_json``, without being validated; any
+    other content by orjson, with models inside it dumped to JSON data.
+
+    Also the application's default response class, so that routes still
+    returning plain data are encoded by orjson.
+    """
+
+    def __init__(self, content: Any, *args: Any, include: Any = None, **kwargs: Any):
+        # Fields of a model to serialize, as pydantic's ``include``.
+        self.include = include
+        super().__init__(content, *args, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(
+                content, include=self.include
+            )
+        return orjson.dumps(content, default=_default)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
@@ -16,4 +16,8 @@ def register_routes(app: FastAPI, prefix: str = "/api") -> None:
         module = importlib.import_module(f"{package}.{module_name}")
         if hasattr(module, "router"):
             logger.warning(f"Registering {module_name} router")
-            app.include_router(module.router, prefix=prefix)
+            # A module may set ROUTER_PREFIX to be mounted elsewhere.
+            app.include_router(
+                module.router,
+                prefix=getattr(module, "ROUTER_PREFIX", prefix),
+            )
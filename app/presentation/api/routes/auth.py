@@ -3,12 +3,20 @@ from __future__ import annotations
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi import Request
+from fastapi import Response
 from fastapi import status
 
-from app.application.services.auth import LoginUser
-from app.infrastructure.auth import JWTService
+from app.application.services import AsyncService
+from app.domain.models.user import UserIdentity
+from app.infrastructure.dependencies.auth import get_current_user
+from app.infrastructure.dependencies.auth import oauth2_scheme
 from app.infrastructure.dependencies.service.auth import get_login_user_service
+from app.infrastructure.dependencies.service.auth import get_refresh_tokens_service
+from app.infrastructure.dependencies.service.auth import get_revoke_tokens_service
+from app.infrastructure.ratelimit import login_guard
 from app.presentation.schemas.auth import LoginRequest
+from app.presentation.schemas.auth import LogoutRequest
 from app.presentation.schemas.auth import RefreshRequest
 from app.presentation.schemas.auth import TokenPairResponse
 
@@ -16,35 +24,55 @@ router = APIRouter(prefix='/auth', tags=['Auth'])
 
 
 @router.post('/login', response_model=TokenPairResponse)
-def login(
+async def login(
     data: LoginRequest,
-    service: LoginUser = Depends(get_login_user_service),
+    request: Request,
+    service: AsyncService = Depends(get_login_user_service),
 ) -> TokenPairResponse:
-    token = service.execute(data.username, data.password)
-    if not token:
+    client = request.client.host if request.client else None
+    async with login_guard.admit(client, data.username):
+        tokens = await service.execute(data.username, data.password)
+    if not tokens:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail='Invalid credentials',
         )
 
-    refresh_token = JWTService.create_refresh_token({'sub': data.username})
-
-    if not refresh_token:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail='Error creating refresh token',
-        )
-
-    return TokenPairResponse(access_token=token, refresh_token=refresh_token)
+    return TokenPairResponse(
+        access_token=tokens.access_token,
+        refresh_token=tokens.refresh_token,
+    )
 
 
-@router.post('/refresh', response_model=dict)
-def refresh(data: RefreshRequest) -> dict[str, str]:
-    new_access_token = JWTService.refresh_access_token(data.refresh_token)
-    if not new_access_token:
+@router.post('/refresh', response_model=TokenPairResponse)
+async def refresh(
+    data: RefreshRequest,
+    service: AsyncService = Depends(get_refresh_tokens_service),
+) -> TokenPairResponse:
+    """
+    Exchange a refresh token for a new pair of tokens. Each refresh token
+    is accepted once: keep the new one.
+    """
+    tokens = await service.execute(data.refresh_token)
+    if not tokens:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail='Invalid refresh token',
         )
 
-    return {'access_token': new_access_token, 'token_type': 'bearer'}
+    return TokenPairResponse(
+        access_token=tokens.access_token,
+        refresh_token=tokens.refresh_token,
+    )
+
+
+@router.post('/logout', status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    data: LogoutRequest,
+    token: str = Depends(oauth2_scheme),
+    _: UserIdentity = Depends(get_current_user),
+    service: AsyncService = Depends(get_revoke_tokens_service),
+) -> Response:
+    """Revoke the access token of the request and the given refresh token."""
+    await service.execute(token, data.refresh_token)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
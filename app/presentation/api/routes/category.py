@@ -1,17 +1,38 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from app.application.services import Service
+from app.application.services import AsyncService
+from app.domain.models.page import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from app.domain.models.post import PostFilter
+from app.domain.repositories.category import CategoryField
+from app.domain.repositories.post import PostRelation
 from app.infrastructure.dependencies.auth import get_current_user
 from app.infrastructure.dependencies.service.category import (
     get_create_category_service,
     get_delete_category_service,
     get_get_category_by_id_service,
+    get_get_category_by_slug_service,
     get_list_category_service,
     get_update_category_service,
 )
+from app.infrastructure.dependencies.service.post import (
+    get_list_post_summary_service,
+    get_list_post_versions_service,
+)
+from app.infrastructure.mappers.category import CategoryMapper
+from app.infrastructure.mappers.post import PostMapper
+from app.presentation.api.conditional import Validators, is_conditional
+from app.presentation.api.fields import (
+    Fields,
+    page_include,
+    sparse_fields,
+    with_fields,
+)
+from app.presentation.api.responses import ORJSONResponse
 from app.presentation.schemas.category import CategoryRequest, CategoryResponse
+from app.presentation.schemas.page import PageResponse
+from app.presentation.schemas.post import PostSummaryResponse
 
 router = APIRouter(
     prefix="/category",
@@ -20,54 +41,115 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=list[CategoryResponse])
+@router.get("/", response_model=PageResponse[CategoryResponse])
 async def get_all(
-    service: Service = Depends(get_list_category_service),
-) -> list[CategoryResponse]:
-    categories = service.execute()
-    return [CategoryResponse(id=c.id, name=c.name, slug=c.slug) for c in categories]
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    fields: Fields = Depends(sparse_fields(CategoryResponse)),
+    service: AsyncService = Depends(get_list_category_service),
+) -> Response:
+    page = await service.execute(limit, cursor, _selection(fields))
+    validators = Validators.for_page(
+        with_fields("categories", fields), page.map(lambda c: c.version())
+    )
+    if validators.matches(request):
+        return validators.not_modified()
+    return ORJSONResponse(
+        PageResponse[CategoryResponse](
+            items=[
+                dto for dto in map(CategoryMapper.to_dto, page.items) if dto is not None
+            ],
+            limit=page.limit,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        ),
+        headers=validators.headers(),
+        include=page_include(fields),
+    )
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
 async def get(
     category_id: int,
-    service: Service = Depends(get_get_category_by_id_service),
-) -> CategoryResponse:
-    category = service.execute(category_id)
+    request: Request,
+    fields: Fields = Depends(sparse_fields(CategoryResponse)),
+    service: AsyncService = Depends(get_get_category_by_id_service),
+) -> Response:
+    category = await service.execute(category_id, _selection(fields))
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found",
         )
 
-    category_dto = CategoryResponse(
-        id=category.id,
-        name=category.name,
-        slug=category.slug,
-        description=category.description,
+    validators = Validators.for_resource(
+        with_fields("category", fields), category.version()
+    )
+    if validators.matches(request):
+        return validators.not_modified()
+    return ORJSONResponse(
+        CategoryMapper.to_dto(category), headers=validators.headers(), include=fields
+    )
+
+
+@router.get("/{slug}/posts", response_model=PageResponse[PostSummaryResponse])
+async def get_posts(
+    slug: str,
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    fields: Fields = Depends(sparse_fields(PostSummaryResponse)),
+    category_service: AsyncService = Depends(get_get_category_by_slug_service),
+    post_service: AsyncService = Depends(get_list_post_summary_service),
+    version_service: AsyncService = Depends(get_list_post_versions_service),
+) -> Response:
+    if not await category_service.execute(slug):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Category not found",
+        )
+    filters = PostFilter(category=slug)
+    kind = with_fields("posts:summary", fields)
+    if fields is None and is_conditional(request):
+        versions = await version_service.execute(limit, cursor, filters)
+        current = Validators.for_page(kind, versions)
+        if current.matches(request):
+            return current.not_modified()
+
+    include = [r for r in PostRelation if fields is None or r.value in fields]
+    page = await post_service.execute(limit, cursor, filters, include)
+    validators = Validators.for_page(kind, page.map(lambda p: p.version()))
+    if validators.matches(request):
+        return validators.not_modified()
+    return ORJSONResponse(
+        PageResponse[PostSummaryResponse](
+            items=[PostMapper.to_summary_dto(p) for p in page.items],
+            limit=page.limit,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        ),
+        headers=validators.headers(),
+        include=page_include(fields),
     )
-    return category_dto
 
 
 @router.post("/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
 async def post(
     data: CategoryRequest,
-    service: Service = Depends(get_create_category_service),
-) -> CategoryResponse:
-    category = service.execute(data.name, data.slug, data.description)
-    return CategoryResponse(
-        id=category.id,
-        name=category.name,
-        slug=category.slug,
-        description=category.description,
+    service: AsyncService = Depends(get_create_category_service),
+) -> Response:
+    category = await service.execute(data.name, data.slug, data.description)
+    return ORJSONResponse(
+        CategoryMapper.to_dto(category), status_code=status.HTTP_201_CREATED
     )
 
 
 @router.delete("/{category_id}")
 async def delete(
-    category_id: int, service: Service = Depends(get_delete_category_service)
+    category_id: int, service: AsyncService = Depends(get_delete_category_service)
 ) -> None:
-    service.execute(category_id)
+    await service.execute(category_id)
     return None
 
 
@@ -78,9 +160,9 @@ async def delete(
 )
 async def update(
     category_id: int,
-    service: Service = Depends(get_update_category_service),
-) -> CategoryResponse:
-    category = service.execute(category_id)
+    service: AsyncService = Depends(get_update_category_service),
+) -> Response:
+    category = await service.execute(category_id)
 
     if category is None:
         raise HTTPException(
@@ -88,9 +170,9 @@ async def update(
             detail="Category not found",
         )
 
-    return CategoryResponse(
-        id=category.id,
-        name=category.name,
-        slug=category.slug,
-        description=category.description,
-    )
+    return ORJSONResponse(CategoryMapper.to_dto(category))
+
+
+def _selection(fields: Fields) -> list[CategoryField]:
+    """The columns to read for the response ``fields``."""
+    return [f for f in CategoryField if fields is None or f.value in fields]
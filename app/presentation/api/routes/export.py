@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.application.services import AsyncStreamService
+from app.application.services.post import DEFAULT_EXPORT_BATCH_SIZE
+from app.domain.models.post import PostModel
+from app.infrastructure.dependencies.auth import get_current_user
+from app.infrastructure.dependencies.service.post import get_export_posts_service
+from app.infrastructure.mappers.post import PostMapper
+
+MAX_EXPORT_BATCH_SIZE = 5_000
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+router = APIRouter(
+    prefix="/export",
+    tags=["Export"],
+    dependencies=[Depends(get_current_user)],
+)
+
+
+@router.get("", response_class=StreamingResponse)
+async def export_posts(
+    batch_size: int = Query(DEFAULT_EXPORT_BATCH_SIZE, ge=1, le=MAX_EXPORT_BATCH_SIZE),
+    service: AsyncStreamService[PostModel] = Depends(get_export_posts_service),
+) -> StreamingResponse:
+    """
+    Stream every post as NDJSON, one post per line, in id order.
+    Lines have the shape accepted by ``POST /post/bulk``.
+    :param batch_size: Number of rows fetched per database round trip
+    :param service: ExportPostsService dependency
+    :return: NDJSON stream of posts with their category and tag slugs
+    """
+    return StreamingResponse(
+        _ndjson(service.execute(batch_size)),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
+
+
+async def _ndjson(chunks: AsyncIterator[list[PostModel]]) -> AsyncIterator[bytes]:
+    async for posts in chunks:
+        yield "".join(
+            PostMapper.to_export_record(p).model_dump_json() + "\n" for p in posts
+        ).encode()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request, Response
+
+from app.application.services import AsyncService
+from app.domain.models.feed import FeedDocument, FeedKind
+from app.infrastructure.dependencies.service.feed import get_feed_service
+from app.presentation.api.conditional import conditional_response
+
+# Feeds and the sitemap live at well-known URLs, outside the API prefix.
+ROUTER_PREFIX = ""
+
+MEDIA_TYPES = {
+    FeedKind.RSS: "application/rss+xml",
+    FeedKind.ATOM: "application/atom+xml",
+    FeedKind.SITEMAP: "application/xml",
+}
+CACHE_CONTROL = "public, max-age=300"
+
+router = APIRouter(tags=["Feed"])
+
+
+@router.get("/feed.xml", response_class=Response)
+async def rss_feed(
+    request: Request,
+    service: AsyncService = Depends(get_feed_service),
+) -> Response:
+    """
+    RSS 2.0 feed of the newest published posts.
+    :param request: Request carrying the conditional GET headers
+    :param service: GetFeedService dependency
+    :return: The feed, or 304 when the client's copy is current
+    """
+    return _respond(request, FeedKind.RSS, await service.execute(FeedKind.RSS))
+
+
+@router.get("/atom.xml", response_class=Response)
+async def atom_feed(
+    request: Request,
+    service: AsyncService = Depends(get_feed_service),
+) -> Response:
+    """
+    Atom 1.0 feed of the newest published posts.
+    :param request: Request carrying the conditional GET headers
+    :param service: GetFeedService dependency
+    :return: The feed, or 304 when the client's copy is current
+    """
+    return _respond(request, FeedKind.ATOM, await service.execute(FeedKind.ATOM))
+
+
+@router.get("/sitemap.xml", response_class=Response)
+async def sitemap(
+    request: Request,
+    service: AsyncService = Depends(get_feed_service),
+) -> Response:
+    """
+    Sitemap of the published posts.
+    :param request: Request carrying the conditional GET headers
+    :param service: GetFeedService dependency
+    :return: The sitemap, or 304 when the client's copy is current
+    """
+    return _respond(request, FeedKind.SITEMAP, await service.execute(FeedKind.SITEMAP))
+
+
+def _respond(request: Request, kind: FeedKind, document: FeedDocument) -> Response:
+    return conditional_response(
+        request,
+        document.body,
+        etag=document.etag,
+        last_modified=document.last_modified,
+        media_type=MEDIA_TYPES[kind],
+        cache_control=CACHE_CONTROL,
+    )
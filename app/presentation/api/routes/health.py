@@ -1,4 +1,5 @@
-from typing import Dict
+from dataclasses import asdict
+from typing import Any, Dict
 
 from fastapi import APIRouter, Depends
 from sqlalchemy import text
@@ -6,17 +7,28 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.infrastructure.dependencies.database import get_db
+from app.infrastructure.auth import verified_tokens
+from app.infrastructure.cache import shared
+from app.infrastructure.cache.responses import response_cache
+from app.infrastructure.ratelimit import login_guard
+from app.infrastructure.ratelimit import rate_limiter
+from app.infrastructure.repositories.cached.post import post_cache
+from app.infrastructure.repositories.cached.token import revocation_filter
+from app.infrastructure.repositories.cached.user import user_cache
 
 router = APIRouter(tags=["Health"])
 
 
 @router.get("/health")
-def health_check(db: Session = Depends(get_db)) -> Dict[str, str | Dict[str, str]]:
+def health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
     """
     Health check endpoint that verifies:
     - API is responsive
     - Database connection is working
 
+    Also reports the cache backend, this process's cache counters and its
+    login rate limiting.
+
     Returns:
         Dict with status information
     """
@@ -32,4 +44,18 @@ def health_check(db: Session = Depends(get_db)) -> Dict[str, str | Dict[str, str
     return {
         "status": "healthy" if db_status == "healthy" else "unhealthy",
         "database": {"status": db_status, "details": db_details},
+        "caches": {
+            "backend": {"name": shared.backend.name, **shared.backend.stats()},
+            "posts": asdict(post_cache.posts.stats()),
+            "post_slugs": asdict(post_cache.slugs.stats()),
+            "users": asdict(user_cache.identities.stats()),
+            "responses": asdict(response_cache.responses.stats()),
+            "verified_tokens": asdict(verified_tokens.stats()),
+            "revoked_tokens": asdict(revocation_filter.stats()),
+        },
+        "login_rate_limit": {
+            "store": rate_limiter.name,
+            "in_flight": login_guard.in_flight,
+            "local_buckets": rate_limiter.local.stats(),
+        },
     }
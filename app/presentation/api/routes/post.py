@@ -1,19 +1,79 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from collections.abc import AsyncIterator
+from enum import Enum
 
-from app.application.services import Service
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+
+from app.application.services import AsyncService
+from app.application.services.post import DEFAULT_IMPORT_BATCH_SIZE
+from app.core.exceptions import PostNotFoundError
+from app.domain.models.page import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from app.domain.models.post import (
+    ImportReport,
+    PostFilter,
+    PostModel,
+    RenderedContent,
+)
+from app.domain.repositories.post import (
+    ALL_POST_FIELDS,
+    ALL_POST_RELATIONS,
+    PostField,
+    PostRelation,
+)
+from app.infrastructure.content.markdown import RENDER_VERSION, markdown_renderer
+from app.infrastructure.content.rebuild import rendering_rebuild
 from app.infrastructure.dependencies.auth import get_current_user
 from app.infrastructure.dependencies.service.post import (
     get_create_post_service,
     get_delete_post_service,
     get_get_post_by_id_service,
     get_get_post_by_slug_service,
+    get_get_post_version_by_slug_service,
+    get_get_post_version_service,
+    get_import_posts_service,
     get_list_post_service,
+    get_list_post_summary_service,
+    get_list_post_versions_service,
+    get_search_posts_service,
     get_update_post_service,
 )
 from app.infrastructure.mappers.post import PostMapper
-from app.presentation.schemas.post import PostRequest, PostResponse
+from app.presentation.api.conditional import Validators, is_conditional
+from app.presentation.api.fields import (
+    Fields,
+    page_include,
+    sparse_fields,
+    with_fields,
+)
+from app.presentation.api.responses import ORJSONResponse
+from app.presentation.schemas.page import PageResponse
+from app.presentation.schemas.post import (
+    ImportReportResponse,
+    PostRequest,
+    PostResponse,
+    PostSearchHitResponse,
+    PostSummaryResponse,
+    RowErrorResponse,
+)
+
+MAX_IMPORT_BATCH_SIZE = 10_000
+MAX_IMPORT_LINE_BYTES = 1_048_576
+MAX_SEARCH_QUERY_LENGTH = 200
+
+# Response fields filled from the stored rendering.
+RENDERED_FIELDS = frozenset({"content_html", "excerpt", "word_count", "reading_time"})
+
+
+class PostView(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"
+
+
+class PostStatus(str, Enum):
+    DRAFT = "draft"
+    PUBLISHED = "published"
+
 
 router = APIRouter(
     prefix="/post",
@@ -25,8 +85,8 @@ router = APIRouter(
 @router.post("/", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def create_post(
     body: PostRequest,
-    service: Service = Depends(get_create_post_service),
-) -> PostResponse:
+    service: AsyncService = Depends(get_create_post_service),
+) -> Response:
     """
     Create a new post from the request body.
         :param body: PostRequest from request
@@ -34,54 +94,332 @@ async def create_post(
 
     :return: Created PostResponse
     """
-    created = service.execute(
+    created = await service.execute(
         body.title,
         body.content,
+        body.tags,
+        body.category,
+        rendered=await markdown_renderer.render(body.content),
+    )
+    return ORJSONResponse(
+        PostMapper.to_dto(created), status_code=status.HTTP_201_CREATED
+    )
+
+
+@router.post("/bulk", response_model=ImportReportResponse)
+async def import_posts(
+    request: Request,
+    batch_size: int = Query(DEFAULT_IMPORT_BATCH_SIZE, ge=1, le=MAX_IMPORT_BATCH_SIZE),
+    service: AsyncService = Depends(get_import_posts_service),
+) -> ImportReportResponse:
+    """
+    Import posts from an NDJSON request body, one post per line.
+    The body is consumed as it arrives and written in batches; a line
+    longer than ``MAX_IMPORT_LINE_BYTES`` ends the import with a 413.
+    :param request: Request streaming the NDJSON body
+    :param batch_size: Number of posts written per batch
+    :param service: ImportPostsService dependency
+    :return: Number of inserted posts and the rejected lines
+    """
+    report = ImportReport()
+    batch: list[bytes] = []
+    first_line = 1
+    async for line in _ndjson_lines(request):
+        batch.append(line)
+        if len(batch) >= batch_size:
+            report.merge(await service.execute(batch, batch_size, first_line))
+            first_line += len(batch)
+            batch = []
+    if batch:
+        report.merge(await service.execute(batch, batch_size, first_line))
+    if report.inserted:
+        rendering_rebuild.schedule()
+
+    return ImportReportResponse(
+        inserted=report.inserted,
+        errors=[
+            RowErrorResponse(line=e.line, message=e.message) for e in report.errors
+        ],
     )
-    return PostMapper.to_dto(created)
 
 
-@router.get("/", response_model=list[PostResponse])
+@router.get(
+    "/",
+    response_model=PageResponse[PostResponse] | PageResponse[PostSummaryResponse],
+)
 async def list_posts(
-    service: Service = Depends(get_list_post_service),
-) -> list[PostResponse]:
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    view: PostView = PostView.FULL,
+    rendered: bool = False,
+    status: PostStatus | None = None,
+    category: str | None = None,
+    tag: str | None = None,
+    fields: Fields = Depends(sparse_fields(PostResponse)),
+    service: AsyncService = Depends(get_list_post_service),
+    summary_service: AsyncService = Depends(get_list_post_summary_service),
+    version_service: AsyncService = Depends(get_list_post_versions_service),
+) -> Response:
+    """
+    List posts, newest first, one keyset page at a time.
+    :param request: Request with the client's validators, if any
+    :param limit: Maximum number of posts in the page
+    :param cursor: Opaque cursor from a previous page
+    :param view: ``summary`` leaves out the post content
+    :param rendered: With the full view, include the content rendered to
+        HTML, its excerpt, word count and reading time
+    :param status: Only posts with this status
+    :param category: Only posts in the category with this slug
+    :param tag: Only posts with the tag with this slug
+    :param fields: Only these fields of each post
+    :param service: PostService dependency
+    :param summary_service: PostSummaryService dependency
+    :param version_service: ListPostVersionsService dependency
+    :return: Page of PostResponse or PostSummaryResponse, or 304 when the
+        client's copy is current
+    """
+    filters = PostFilter(
+        status=status.value if status else None,
+        category=category,
+        tag=tag,
+    )
+    return await _list_page(
+        request,
+        limit,
+        cursor,
+        view,
+        rendered,
+        filters,
+        fields,
+        service,
+        summary_service,
+        version_service,
+    )
+
+
+@router.get(
+    "/feed",
+    response_model=PageResponse[PostResponse] | PageResponse[PostSummaryResponse],
+)
+async def published_feed(
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    view: PostView = PostView.FULL,
+    rendered: bool = False,
+    category: str | None = None,
+    tag: str | None = None,
+    fields: Fields = Depends(sparse_fields(PostResponse)),
+    service: AsyncService = Depends(get_list_post_service),
+    summary_service: AsyncService = Depends(get_list_post_summary_service),
+    version_service: AsyncService = Depends(get_list_post_versions_service),
+) -> Response:
     """
-    List all posts.
+    Published posts, newest first, optionally in one category or tag.
+    :param request: Request with the client's validators, if any
+    :param limit: Maximum number of posts in the page
+    :param cursor: Opaque cursor from a previous page
+    :param view: ``summary`` leaves out the post content
+    :param rendered: With the full view, include the content rendered to
+        HTML, its excerpt, word count and reading time
+    :param category: Only posts in the category with this slug
+    :param tag: Only posts with the tag with this slug
+    :param fields: Only these fields of each post
     :param service: PostService dependency
-    :return: List of PostResponse
+    :param summary_service: PostSummaryService dependency
+    :param version_service: ListPostVersionsService dependency
+    :return: Page of PostResponse or PostSummaryResponse, or 304 when the
+        client's copy is current
+    """
+    filters = PostFilter(status=PostStatus.PUBLISHED.value, category=category, tag=tag)
+    return await _list_page(
+        request,
+        limit,
+        cursor,
+        view,
+        rendered,
+        filters,
+        fields,
+        service,
+        summary_service,
+        version_service,
+    )
+
+
+async def _list_page(
+    request: Request,
+    limit: int,
+    cursor: str | None,
+    view: PostView,
+    rendered: bool,
+    filters: PostFilter,
+    fields: Fields,
+    service: AsyncService,
+    summary_service: AsyncService,
+    version_service: AsyncService,
+) -> Response:
+    rendered = rendered and view == PostView.FULL and _wants_rendered(fields)
+    kind = with_fields(_kind(f"posts:{view.value}", rendered), fields)
+    # Versions are of whole posts: a sparse page is compared once read.
+    if fields is None and is_conditional(request):
+        versions = await version_service.execute(limit, cursor, filters)
+        current = Validators.for_page(kind, versions)
+        if current.matches(request):
+            return current.not_modified()
+
+    include, selected = _selection(fields, rendered)
+    if view == PostView.SUMMARY:
+        summaries = await summary_service.execute(limit, cursor, filters, include)
+        validators = Validators.for_page(kind, summaries.map(lambda p: p.version()))
+        if validators.matches(request):
+            return validators.not_modified()
+        return ORJSONResponse(
+            PageResponse[PostSummaryResponse](
+                items=[PostMapper.to_summary_dto(p) for p in summaries.items],
+                limit=summaries.limit,
+                next_cursor=summaries.next_cursor,
+                prev_cursor=summaries.prev_cursor,
+            ),
+            headers=validators.headers(),
+            include=page_include(fields),
+        )
+
+    page = await service.execute(limit, cursor, filters, include, selected)
+    validators = Validators.for_page(kind, page.map(lambda p: p.version()))
+    if validators.matches(request):
+        return validators.not_modified()
+    return ORJSONResponse(
+        PageResponse[PostResponse](
+            items=[
+                PostMapper.to_dto(p, await _rendered(p) if rendered else None)
+                for p in page.items
+            ],
+            limit=page.limit,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        ),
+        headers=validators.headers(),
+        include=page_include(fields),
+    )
+
+
+@router.get("/search", response_model=PageResponse[PostSearchHitResponse])
+async def search_posts(
+    # At least one non-blank character: FTS5 rejects an empty MATCH.
+    q: str = Query(..., max_length=MAX_SEARCH_QUERY_LENGTH, pattern=r"\S"),
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    service: AsyncService = Depends(get_search_posts_service),
+) -> Response:
+    """
+    Full-text search over post titles and content, most relevant first.
+    Each snippet is escaped HTML with the matched terms wrapped in ``<mark>``.
+    :param q: Search terms
+    :param limit: Maximum number of posts in the page
+    :param cursor: Opaque cursor from a previous page
+    :param service: SearchPostsService dependency
+    :return: Page of PostSearchHitResponse
     """
-    posts = service.execute()
-    return [PostMapper.to_dto(p) for p in posts]
+    page = await service.execute(q, limit, cursor)
+    return ORJSONResponse(
+        PageResponse[PostSearchHitResponse](
+            items=[PostMapper.to_search_hit_dto(p) for p in page.items],
+            limit=page.limit,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        )
+    )
 
 
 @router.get("/{post_id}", response_model=PostResponse)
 async def get_post(
     post_id: int,
-    service: Service = Depends(get_get_post_by_id_service),
-) -> PostResponse:
+    request: Request,
+    rendered: bool = False,
+    fields: Fields = Depends(sparse_fields(PostResponse)),
+    service: AsyncService = Depends(get_get_post_by_id_service),
+    version_service: AsyncService = Depends(get_get_post_version_service),
+) -> Response:
     """
     Get a post by its ID.
+    A conditional request is answered from the post's version alone when
+    the client's copy is current.
     :param post_id: ID of the post
+    :param request: Request with the client's validators, if any
+    :param rendered: Include the content rendered to HTML, its excerpt,
+        word count and reading time
+    :param fields: Only these fields of the post
     :param service: PostService dependency
-    :return: PostResponse
+    :param version_service: GetPostVersionService dependency
+    :return: PostResponse, or 304 when the client's copy is current
     """
-    post = service.execute(post_id)
-    return PostMapper.to_dto(post)
+    rendered = rendered and _wants_rendered(fields)
+    kind = with_fields(_kind("post", rendered), fields)
+    if fields is None and is_conditional(request):
+        version = await version_service.execute(post_id)
+        if version is None:
+            raise PostNotFoundError(post_id)
+        current = Validators.for_resource(kind, version)
+        if current.matches(request):
+            return current.not_modified()
+
+    post = await service.execute(post_id, *_selection(fields, rendered))
+    if post is None:
+        raise PostNotFoundError(post_id)
+    validators = Validators.for_resource(kind, post.version())
+    if validators.matches(request):
+        return validators.not_modified()
+    return ORJSONResponse(
+        PostMapper.to_dto(post, await _rendered(post) if rendered else None),
+        headers=validators.headers(),
+        include=fields,
+    )
 
 
 @router.get("/slug/{slug}", response_model=PostResponse)
 async def get_post_by_slug(
     slug: str,
-    service: Service = Depends(get_get_post_by_slug_service),
-) -> PostResponse:
+    request: Request,
+    rendered: bool = False,
+    fields: Fields = Depends(sparse_fields(PostResponse)),
+    service: AsyncService = Depends(get_get_post_by_slug_service),
+    version_service: AsyncService = Depends(get_get_post_version_by_slug_service),
+) -> Response:
     """
     Get a post by its slug.
+    A conditional request is answered from the post's version alone when
+    the client's copy is current.
     :param slug: Slug of the post
+    :param request: Request with the client's validators, if any
+    :param rendered: Include the content rendered to HTML, its excerpt,
+        word count and reading time
+    :param fields: Only these fields of the post
     :param service: PostService dependency
-    :return: PostResponse
+    :param version_service: GetPostVersionBySlugService dependency
+    :return: PostResponse, or 304 when the client's copy is current
     """
-    post = service.execute(slug)
-    return PostMapper.to_dto(post)
+    rendered = rendered and _wants_rendered(fields)
+    kind = with_fields(_kind("post", rendered), fields)
+    if fields is None and is_conditional(request):
+        version = await version_service.execute(slug)
+        if version is None:
+            raise PostNotFoundError(slug)
+        current = Validators.for_resource(kind, version)
+        if current.matches(request):
+            return current.not_modified()
+
+    post = await service.execute(slug, *_selection(fields, rendered))
+    if post is None:
+        raise PostNotFoundError(slug)
+    validators = Validators.for_resource(kind, post.version())
+    if validators.matches(request):
+        return validators.not_modified()
+    return ORJSONResponse(
+        PostMapper.to_dto(post, await _rendered(post) if rendered else None),
+        headers=validators.headers(),
+        include=fields,
+    )
 
 
 @router.put(
@@ -91,21 +429,32 @@ async def get_post_by_slug(
 )
 async def update_post(
     post_id: int,
-    service: Service = Depends(get_update_post_service),
-) -> PostResponse:
+    body: PostRequest,
+    service: AsyncService = Depends(get_update_post_service),
+) -> Response:
     """
     Update a post by its ID.
     :param post_id: ID of the post
+    :param body: New title, content, tags and category of the post
     :param service: PostService dependency
     :return: PostResponse
     """
-    post = service.execute(post_id)
-    return PostMapper.to_dto(post)
+    post = await service.execute(
+        post_id,
+        body.title,
+        body.content,
+        tags=body.tags,
+        category=body.category,
+        rendered=await markdown_renderer.render(body.content),
+    )
+    if post is None:
+        raise PostNotFoundError(post_id)
+    return ORJSONResponse(PostMapper.to_dto(post))
 
 
 @router.delete("/{post_id}")
 async def delete_post(
-    post_id: int, service: Service = Depends(get_delete_post_service)
+    post_id: int, service: AsyncService = Depends(get_delete_post_service)
 ) -> None:
     """
     Delete a post by its ID.
@@ -113,5 +462,63 @@ async def delete_post(
     :param service: PostService dependency
     :return: None
     """
-    service.execute(post_id)
+    await service.execute(post_id)
     return None
+
+
+def _kind(kind: str, rendered: bool) -> str:
+    # The rendered HTML changes with the renderer, not only with the post.
+    return f"{kind}+html{RENDER_VERSION}" if rendered else kind
+
+
+def _wants_rendered(fields: Fields) -> bool:
+    return fields is None or not fields.isdisjoint(RENDERED_FIELDS)
+
+
+def _selection(
+    fields: Fields, rendered: bool
+) -> tuple[frozenset[PostRelation], frozenset[PostField]]:
+    """The relations and columns to read for the response ``fields``."""
+    if fields is None:
+        return ALL_POST_RELATIONS, ALL_POST_FIELDS
+    include = frozenset(r for r in PostRelation if r.value in fields)
+    selected = {f for f in PostField if f.value in fields}
+    if rendered:
+        # Posts the rebuild has not reached are rendered from their content.
+        selected |= {PostField.RENDERED, PostField.CONTENT}
+    return include, frozenset(selected)
+
+
+async def _rendered(post: PostModel) -> RenderedContent:
+    """
+    The stored rendering; until the background rebuild reaches a post with a
+    missing or outdated one, a fresh rendering.
+    """
+    return post.rendered_by(RENDER_VERSION) or await markdown_renderer.render(
+        post.content
+    )
+
+
+async def _ndjson_lines(request: Request) -> AsyncIterator[bytes]:
+    # Each chunk is split on its own; only the unterminated line it ends
+    # with is carried over to the next one.
+    partial = bytearray()
+    async for chunk in request.stream():
+        *lines, rest = chunk.split(b"\n")
+        for line in lines:
+            partial += line
+            _check_line_length(partial)
+            yield bytes(partial)
+            partial.clear()
+        partial += rest
+        _check_line_length(partial)
+    if partial:
+        yield bytes(partial)
+
+
+def _check_line_length(line: bytearray) -> None:
+    if len(line) > MAX_IMPORT_LINE_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Lines are limited to {MAX_IMPORT_LINE_BYTES} bytes",
+        )
@@ -1,22 +1,37 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
-
-from app.application.services.tag import (
-    CreateTag,
-    DeleteTag,
-    GetTagById,
-    ListTags,
-    UpdateTag,
-)
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+
+from app.application.services import AsyncService
+from app.domain.models.page import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT
+from app.domain.models.post import PostFilter
+from app.domain.repositories.tag import TagField
+from app.domain.repositories.post import PostRelation
 from app.infrastructure.dependencies.auth import get_current_user
+from app.infrastructure.dependencies.service.post import (
+    get_list_post_summary_service,
+    get_list_post_versions_service,
+)
 from app.infrastructure.dependencies.service.tag import (
     get_create_tag_service,
     get_delete_tag_service,
     get_get_tag_by_id_service,
+    get_get_tag_by_slug_service,
     get_list_tag_service,
     get_update_tag_service,
 )
+from app.infrastructure.mappers.post import PostMapper
+from app.infrastructure.mappers.tag import TagMapper
+from app.presentation.api.conditional import Validators, is_conditional
+from app.presentation.api.fields import (
+    Fields,
+    page_include,
+    sparse_fields,
+    with_fields,
+)
+from app.presentation.api.responses import ORJSONResponse
+from app.presentation.schemas.page import PageResponse
+from app.presentation.schemas.post import PostSummaryResponse
 from app.presentation.schemas.tag import TagRequest, TagResponse
 
 router = APIRouter(
@@ -26,65 +41,124 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=list[TagResponse])
+@router.get("/", response_model=PageResponse[TagResponse])
 async def get_all(
-    service: ListTags = Depends(get_list_tag_service),
-) -> list[TagResponse]:
-    tags = service.execute()
-    return [TagResponse(id=t.id, name=t.name, slug=t.slug) for t in tags]
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    fields: Fields = Depends(sparse_fields(TagResponse)),
+    service: AsyncService = Depends(get_list_tag_service),
+) -> Response:
+    page = await service.execute(limit, cursor, _selection(fields))
+    validators = Validators.for_page(
+        with_fields("tags", fields), page.map(lambda t: t.version())
+    )
+    if validators.matches(request):
+        return validators.not_modified()
+    return ORJSONResponse(
+        PageResponse[TagResponse](
+            items=[TagMapper.to_dto(t) for t in page.items],
+            limit=page.limit,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        ),
+        headers=validators.headers(),
+        include=page_include(fields),
+    )
 
 
 @router.get("/{tag_id}", response_model=TagResponse)
 async def get(
-    tag_id: int, service: GetTagById = Depends(get_get_tag_by_id_service)
-) -> TagResponse:
-    tag = service.execute(tag_id)
+    tag_id: int,
+    request: Request,
+    fields: Fields = Depends(sparse_fields(TagResponse)),
+    service: AsyncService = Depends(get_get_tag_by_id_service),
+) -> Response:
+    tag = await service.execute(tag_id, _selection(fields))
     if not tag:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tag not found",
         )
-    tag_dto = TagResponse(
-        id=tag.id,
-        name=tag.name,
-        slug=tag.slug,
+    validators = Validators.for_resource(with_fields("tag", fields), tag.version())
+    if validators.matches(request):
+        return validators.not_modified()
+    return ORJSONResponse(
+        TagMapper.to_dto(tag), headers=validators.headers(), include=fields
+    )
+
+
+@router.get("/{slug}/posts", response_model=PageResponse[PostSummaryResponse])
+async def get_posts(
+    slug: str,
+    request: Request,
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    fields: Fields = Depends(sparse_fields(PostSummaryResponse)),
+    tag_service: AsyncService = Depends(get_get_tag_by_slug_service),
+    post_service: AsyncService = Depends(get_list_post_summary_service),
+    version_service: AsyncService = Depends(get_list_post_versions_service),
+) -> Response:
+    if not await tag_service.execute(slug):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tag not found",
+        )
+    filters = PostFilter(tag=slug)
+    kind = with_fields("posts:summary", fields)
+    if fields is None and is_conditional(request):
+        versions = await version_service.execute(limit, cursor, filters)
+        current = Validators.for_page(kind, versions)
+        if current.matches(request):
+            return current.not_modified()
+
+    include = [r for r in PostRelation if fields is None or r.value in fields]
+    page = await post_service.execute(limit, cursor, filters, include)
+    validators = Validators.for_page(kind, page.map(lambda p: p.version()))
+    if validators.matches(request):
+        return validators.not_modified()
+    return ORJSONResponse(
+        PageResponse[PostSummaryResponse](
+            items=[PostMapper.to_summary_dto(p) for p in page.items],
+            limit=page.limit,
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        ),
+        headers=validators.headers(),
+        include=page_include(fields),
     )
-    return tag_dto
 
 
 @router.post("/", response_model=TagResponse, status_code=status.HTTP_201_CREATED)
 async def post(
-    data: TagRequest, service: CreateTag = Depends(get_create_tag_service)
-) -> TagResponse:
-    tag = service.execute(data.name, data.slug)
-    return TagResponse(
-        id=tag.id,
-        name=tag.name,
-        slug=tag.slug,
-    )
+    data: TagRequest, service: AsyncService = Depends(get_create_tag_service)
+) -> Response:
+    tag = await service.execute(data.name, data.slug)
+    return ORJSONResponse(TagMapper.to_dto(tag), status_code=status.HTTP_201_CREATED)
 
 
 @router.delete("/{tag_id}")
 async def delete(
-    tag_id: int, service: DeleteTag = Depends(get_delete_tag_service)
+    tag_id: int, service: AsyncService = Depends(get_delete_tag_service)
 ) -> None:
-    service.execute(tag_id)
+    await service.execute(tag_id)
     return None
 
 
 @router.put("/{tag_id}", response_model=TagResponse, status_code=status.HTTP_200_OK)
 async def update(
-    tag_id: int, service: UpdateTag = Depends(get_update_tag_service)
-) -> TagResponse:
-    tag = service.execute(tag_id)
+    tag_id: int, service: AsyncService = Depends(get_update_tag_service)
+) -> Response:
+    tag = await service.execute(tag_id)
     if not tag:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tag not found",
         )
 
-    return TagResponse(
-        id=tag.id,
-        name=tag.name,
-        slug=tag.slug,
-    )
+    return ORJSONResponse(TagMapper.to_dto(tag))
+
+
+def _selection(fields: Fields) -> list[TagField]:
+    """The columns to read for the response ``fields``."""
+    return [f for f in TagField if fields is None or f.value in fields]
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.presentation.schemas.category import CategoryResponse
 from app.presentation.schemas.tag import TagResponse
@@ -9,6 +10,8 @@ from app.presentation.schemas.tag import TagResponse
 class PostRequest(BaseModel):
     title: str
     content: str
+    category: Optional[str] = None
+    tags: List[str] = []
 
 
 class PostResponse(BaseModel):
@@ -18,6 +21,52 @@ class PostResponse(BaseModel):
     slug: str
     category: Optional[CategoryResponse] = None
     tags: List[TagResponse] = []
+    # Only when the rendered content is requested.
+    content_html: Optional[str] = None
+    excerpt: Optional[str] = None
+    word_count: Optional[int] = None
+    reading_time: Optional[int] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PostSummaryResponse(BaseModel):
+    id: Optional[int]
+    title: str
+    slug: str
+    category: Optional[CategoryResponse] = None
+    tags: List[TagResponse] = []
+
+
+class PostSearchHitResponse(BaseModel):
+    id: int
+    title: str
+    slug: str
+    snippet: str
+    rank: float
+    published_at: Optional[datetime] = None
+
+
+class PostExportRecord(BaseModel):
+    """One line of the NDJSON export; accepted back by the bulk import."""
+
+    id: int
+    title: str
+    slug: str
+    content: str
+    status: str
+    published_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+    category: Optional[str] = None
+    tags: List[str] = []
+
+
+class RowErrorResponse(BaseModel):
+    line: int
+    message: str
+
+
+class ImportReportResponse(BaseModel):
+    inserted: int
+    errors: List[RowErrorResponse] = []
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class TagRequest(BaseModel):
@@ -12,6 +12,6 @@ class TagResponse(BaseModel):
     id: Optional[int]
     name: str
     slug: str
+    post_count: Optional[int] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
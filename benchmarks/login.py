@@ -0,0 +1,103 @@
+"""
+Benchmark concurrent logins.
+
+Runs ``--logins`` logins of one user, ``--concurrency`` at a time, through
+``LoginUser`` with the password hasher at ``--rounds`` on ``--workers``
+threads, and reports throughput, latency and how late the event loop ran
+a ticker meanwhile::
+
+    python -m benchmarks.login --rounds 12 --workers 2 --concurrency 32
+
+The user is held in memory, so the figures are those of hashing and of
+issuing tokens, without the database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import Sequence
+
+from app.application.services import AsyncService
+from app.application.services.auth import LoginUser
+from app.domain.models.user import UserModel
+from app.infrastructure.auth.passwords import password_context
+from app.infrastructure.auth.passwords import PasswordHasher
+
+PASSWORD = "correct horse battery staple"
+TICK_SECONDS = 0.005
+
+
+class InMemoryUser(AsyncService):
+    def __init__(self, user: UserModel):
+        self.user = user
+
+    async def execute(self, username: str) -> UserModel | None:
+        return self.user if username == self.user.username else None
+
+
+class Discard(AsyncService):
+    async def execute(self, *args: object) -> None:
+        return None
+
+
+async def ticker(lags: list[float], stop: asyncio.Event) -> None:
+    """How much later than due each tick ran: time the loop was blocked."""
+    while not stop.is_set():
+        due = time.perf_counter() + TICK_SECONDS
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(0.0, time.perf_counter() - due))
+
+
+async def run(args: argparse.Namespace) -> None:
+    hasher = PasswordHasher(password_context(args.rounds), workers=args.workers)
+    user = UserModel(1, "bench", hasher.hash(PASSWORD))
+    service = LoginUser(InMemoryUser(user), Discard(), hasher)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies: list[float] = []
+
+    async def login() -> None:
+        async with semaphore:
+            began = time.perf_counter()
+            if await service.execute("bench", PASSWORD) is None:
+                raise RuntimeError("login failed")
+            latencies.append(time.perf_counter() - began)
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticking = asyncio.create_task(ticker(lags, stop))
+    began = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(args.logins)))
+    elapsed = time.perf_counter() - began
+    stop.set()
+    await ticking
+    hasher.close()
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"rounds={args.rounds} workers={args.workers} "
+        f"concurrency={args.concurrency} logins={args.logins}"
+    )
+    print(f"  throughput  {args.logins / elapsed:8.1f} logins/s")
+    print(
+        f"  latency     p50 {statistics.median(latencies) * 1000:7.1f} ms"
+        f"   p95 {p95 * 1000:7.1f} ms"
+    )
+    print(f"  loop lag    max {max(lags, default=0) * 1000:7.1f} ms")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--logins", type=int, default=64)
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
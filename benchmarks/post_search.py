@@ -0,0 +1,143 @@
+"""
+Benchmark full-text post search.
+
+Seeds ``--posts`` random posts into a scratch database and times the
+repository search for a few queries, first page and a later page::
+
+    python -m benchmarks.post_search --posts 100000
+    python -m benchmarks.post_search --url postgresql+psycopg2://u:p@host/bench
+
+Without ``--url`` a temporary SQLite file is used. The target database is
+created with ``Base.metadata.create_all`` and filled with posts, so never
+point ``--url`` at a database you care about.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Sequence
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.domain.models.post import PostModel
+from app.infrastructure.database import Base
+from app.infrastructure.database.models import Post as PostORM
+from app.infrastructure.repositories.sqlalchemy.post import SqlAlchemyPostRepository
+from app.infrastructure.repositories.sqlalchemy.search import post_search
+
+QUERIES = (
+    "python",
+    "postgres",
+    "replica",
+    "benchmark",
+    "async database",
+    "keyset pagination",
+    "postgres index tuning",
+)
+TOPICS = (
+    "python async database postgres sqlite index query cursor pagination "
+    "keyset tuning cache latency throughput replica search ranking vector "
+    "markdown feed sitemap token session engine schema migration benchmark"
+).split()
+VOCABULARY_SIZE = 20_000
+
+
+def vocabulary() -> tuple[list[str], list[float]]:
+    """
+    Zipf-distributed words, like natural text: a few very common words and a
+    long tail. Topic words are spread over the ranks so queries range from
+    common to rare terms.
+    """
+    words = [f"w{rank}" for rank in range(VOCABULARY_SIZE)]
+    for index, topic in enumerate(TOPICS):
+        words[20 + index * 300] = topic
+    weights = [1 / (rank + 1) for rank in range(VOCABULARY_SIZE)]
+    return words, weights
+
+
+def seed(session: Session, count: int, batch_size: int = 5000) -> None:
+    rng = random.Random(42)
+    words, weights = vocabulary()
+    start = datetime(2020, 1, 1)
+    repo = SqlAlchemyPostRepository(session)
+    for offset in range(0, count, batch_size):
+        posts = []
+        for i in range(offset, min(offset + batch_size, count)):
+            post = PostModel(
+                id=None,
+                title=" ".join(rng.choices(words, weights, k=6)) + f" {i}",
+                content=" ".join(rng.choices(words, weights, k=300)),
+                status="published",
+                published_at=start + timedelta(minutes=i),
+            )
+            posts.append(post)
+        repo.insert_many(posts)
+        session.commit()
+
+
+def count_matches(session: Session, query: str) -> int:
+    ranked = post_search(session, query).ranked().subquery()
+    return session.scalar(select(func.count()).select_from(ranked)) or 0
+
+
+def timed(repo: SqlAlchemyPostRepository, query: str, runs: int) -> list[float]:
+    timings = []
+    cursor = None
+    for run in range(runs):
+        began = time.perf_counter()
+        page = repo.search(query, 20, cursor)
+        timings.append((time.perf_counter() - began) * 1000)
+        # Alternate between the first page and the page after it.
+        cursor = page.next_cursor if run % 2 == 0 else None
+    return timings
+
+
+def report(label: str, matches: int, timings: Sequence[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<24} {matches:>7} hits   p50 {statistics.median(ordered):7.2f} ms"
+        f"   p95 {p95:7.2f} ms   max {ordered[-1]:7.2f} ms"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--url", help="database to benchmark (default: temp SQLite)")
+    args = parser.parse_args(argv)
+
+    url = args.url or f"sqlite:///{Path(tempfile.mkdtemp()) / 'search.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        existing = session.scalar(select(func.count()).select_from(PostORM))
+        if existing < args.posts:
+            began = time.perf_counter()
+            seed(session, args.posts - existing)
+            print(
+                f"seeded {args.posts - existing} posts in "
+                f"{time.perf_counter() - began:.1f}s"
+            )
+
+        repo = SqlAlchemyPostRepository(session)
+        print(f"{engine.dialect.name}, {args.posts} posts, {args.runs} runs")
+        for query in QUERIES:
+            matches = count_matches(session, query)
+            report(query, matches, timed(repo, query, args.runs))
+
+
+if __name__ == "__main__":
+    main()
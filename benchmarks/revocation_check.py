@@ -0,0 +1,68 @@
+"""
+Benchmark the revocation filter's membership check.
+
+Fills a filter with ``--revoked`` random token ids and times checks of ids
+that were not revoked (the common case, answered without the database) and
+of ids that were::
+
+    python -m benchmarks.revocation_check --revoked 100000
+
+Also reports the measured false positive rate: the share of unrevoked ids
+that would be looked up in the database anyway.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Sequence
+
+from app.infrastructure.auth import new_token_id
+from app.infrastructure.repositories.cached.token import RevocationFilter
+
+
+class Revoked:
+    """The slice of a revoked token repository that ``rebuild`` reads."""
+
+    def __init__(self, token_ids: list[str]):
+        self.token_ids = token_ids
+
+    def list_revoked(self, since: object = None) -> list[str]:
+        return self.token_ids
+
+
+def per_check(revocations: RevocationFilter, token_ids: Sequence[str]) -> float:
+    """Nanoseconds per ``might_be_revoked`` over ``token_ids``."""
+    check = revocations.might_be_revoked
+    began = time.perf_counter()
+    for token_id in token_ids:
+        check(token_id)
+    return (time.perf_counter() - began) / len(token_ids) * 1e9
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--revoked", type=int, default=100_000)
+    parser.add_argument("--checks", type=int, default=500_000)
+    parser.add_argument("--error-rate", type=float, default=0.001)
+    args = parser.parse_args(argv)
+
+    revoked = [new_token_id() for _ in range(args.revoked)]
+    revocations = RevocationFilter(args.revoked, args.error_rate)
+    began = time.perf_counter()
+    revocations.rebuild(Revoked(revoked))  # type: ignore[arg-type]
+    built = time.perf_counter() - began
+
+    unrevoked = [new_token_id() for _ in range(args.checks)]
+    false_positives = sum(map(revocations.might_be_revoked, unrevoked))
+    stats = revocations.stats()
+
+    print(f"{args.revoked} revoked ids, {stats.bits // 8 / 1024:.0f} KiB")
+    print(f"  rebuild          {built * 1000:8.1f} ms")
+    print(f"  not revoked      {per_check(revocations, unrevoked):8.0f} ns/check")
+    print(f"  revoked          {per_check(revocations, revoked):8.0f} ns/check")
+    print(f"  false positives  {false_positives / len(unrevoked):8.4%}")
+
+
+if __name__ == "__main__":
+    main()
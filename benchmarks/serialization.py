@@ -0,0 +1,109 @@
+"""
+Benchmark serializing a page of posts, the way list endpoints respond.
+
+Builds ``--pages`` pages of ``--limit`` posts, each with a category, three
+tags and ``--content-chars`` of content, and serializes them to a response
+body along two paths::
+
+    python -m benchmarks.serialization --limit 50 --pages 200
+
+Both map the posts to DTOs the same way. ``validated`` then takes the path
+before ``ORJSONResponse``: the page is dumped, validated again against the
+route's ``response_model`` and encoded by FastAPI. ``direct`` serializes the
+page as it is.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Sequence
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.domain.models.category import CategoryModel
+from app.domain.models.post import PostModel
+from app.domain.models.tag import TagModel
+from app.infrastructure.mappers.post import PostMapper
+from app.presentation.api.responses import ORJSONResponse
+from app.presentation.schemas.page import PageResponse
+from app.presentation.schemas.post import PostResponse
+
+
+def posts(count: int, content_chars: int) -> list[PostModel]:
+    category = CategoryModel(1, "Engineering", "engineering", "Posts about work")
+    tags = [TagModel(i, f"Tag {i}", f"tag-{i}") for i in range(1, 4)]
+    content = ("Lorem ipsum dolor sit amet. " * (content_chars // 28 + 1))[
+        :content_chars
+    ]
+    return [
+        PostModel(i, f"Post number {i}", content, category, tags)
+        for i in range(1, count + 1)
+    ]
+
+
+async def validated(page: list[PostModel]) -> bytes:
+    content = PageResponse[PostResponse](
+        items=[PostMapper.to_dto(p) for p in page], limit=len(page)
+    )
+    encoded = await serialize_response(field=RESPONSE_FIELD, response_content=content)
+    return JSONResponse(encoded).body
+
+
+async def direct(page: list[PostModel]) -> bytes:
+    content = PageResponse[PostResponse](
+        items=[PostMapper.to_dto(p) for p in page], limit=len(page)
+    )
+    return ORJSONResponse(content).body
+
+
+RESPONSE_FIELD = create_model_field(
+    name="Response", type_=PageResponse[PostResponse], mode="serialization"
+)
+
+
+async def timed(
+    serialize: Callable[[list[PostModel]], Awaitable[bytes]],
+    page: list[PostModel],
+    pages: int,
+) -> float:
+    """Pages per second."""
+    began = time.perf_counter()
+    for _ in range(pages):
+        await serialize(page)
+    return pages / (time.perf_counter() - began)
+
+
+async def run(args: argparse.Namespace) -> None:
+    page = posts(args.limit, args.content_chars)
+    before, after = await validated(page), await direct(page)
+    if before != after:
+        raise RuntimeError("the two paths serialize differently")
+
+    slow = await timed(validated, page, args.pages)
+    fast = await timed(direct, page, args.pages)
+    print(f"pages of {args.limit} posts, {len(after):,} bytes each")
+    print(
+        f"{'validated':<10} {slow:>10,.0f} pages/s {slow * args.limit:>12,.0f} posts/s"
+    )
+    print(
+        f"{'direct':<10} {fast:>10,.0f} pages/s {fast * args.limit:>12,.0f} posts/s"
+        f"   {fast / slow:5.1f}x"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--content-chars", type=int, default=2_000)
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark access token verification with and without the verification cache.
+
+Issues ``--tokens`` distinct access tokens and verifies them ``--requests``
+times in random order, the way a few busy clients resend the same tokens::
+
+    python -m benchmarks.token_verify --tokens 100 --requests 200000
+
+Each run starts from an empty cache, so the cached figures include the first,
+full verification of every token.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Sequence
+
+from app.domain.models.user import UserIdentity
+from app.infrastructure.auth import JWTService
+from app.infrastructure.auth import verified_tokens
+from app.infrastructure.auth.verified import VerifiedTokens
+
+
+def issue(count: int) -> list[str]:
+    return [
+        JWTService.create_access_token(UserIdentity(i, f"user{i}", 0).claims())
+        for i in range(1, count + 1)
+    ]
+
+
+def timed(tokens: Sequence[str], cache: VerifiedTokens) -> float:
+    """Verifications per second, verifying ``tokens`` in order."""
+    cache.clear()
+    began = time.perf_counter()
+    for token in tokens:
+        if JWTService.verify_token(token) is None:
+            raise RuntimeError("token did not verify")
+    return len(tokens) / (time.perf_counter() - began)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tokens", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(42)
+    tokens = rng.choices(issue(args.tokens), k=args.requests)
+
+    enabled = verified_tokens.entries.max_entries
+    verified_tokens.entries.max_entries = 0
+    try:
+        uncached = timed(tokens, verified_tokens)
+    finally:
+        verified_tokens.entries.max_entries = enabled
+    cached = timed(tokens, verified_tokens)
+
+    print(f"{args.tokens} tokens, {args.requests} verifications")
+    print(f"{'uncached':<10} {uncached:>12,.0f} /s")
+    print(f"{'cached':<10} {cached:>12,.0f} /s   {cached / uncached:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,20 @@ def get_url() -> str:
 print(get_url())
 config.set_main_option("sqlalchemy.url", get_url())
 
+# Full-text search objects created by raw DDL (see the post_full_text_search
+# migration): they are not in the metadata, so autogenerate must not drop them.
+FULL_TEXT_SEARCH_TABLE_PREFIX = "posts_fts"
+FULL_TEXT_SEARCH_OBJECTS = {"search_vector", "ix_posts_search_vector"}
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Leave the unmapped full-text search objects out of autogenerate."""
+    if not reflected or compare_to is not None or name is None:
+        return True
+    if type_ == "table" and name.startswith(FULL_TEXT_SEARCH_TABLE_PREFIX):
+        return False
+    return name not in FULL_TEXT_SEARCH_OBJECTS
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -53,6 +67,7 @@ def run_migrations_offline() -> None:
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
+        include_object=include_object,
         dialect_opts={"paramstyle": "named"},
     )
 
@@ -74,7 +89,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
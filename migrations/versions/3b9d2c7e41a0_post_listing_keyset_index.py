@@ -0,0 +1,35 @@
+"""post listing keyset index
+
+Revision ID: 3b9d2c7e41a0
+Revises: f1fbcd4c6a11
+Create Date: 2026-10-18 12:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9d2c7e41a0"
+down_revision: Union[str, Sequence[str], None] = "f1fbcd4c6a11"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite already sorts NULLs last on DESC and rejects NULLS LAST in indexes.
+    nulls = " NULLS LAST" if op.get_bind().dialect.name == "postgresql" else ""
+    op.create_index(
+        "ix_posts_published_at_id",
+        "posts",
+        [sa.text(f"published_at DESC{nulls}"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_posts_published_at_id", table_name="posts")
@@ -0,0 +1,71 @@
+"""post full text search
+
+Revision ID: 8c41f0d2a9e3
+Revises: 3b9d2c7e41a0
+Create Date: 2026-10-18 15:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c41f0d2a9e3"
+down_revision: Union[str, Sequence[str], None] = "3b9d2c7e41a0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        # Titles weigh more than content when ranking.
+        op.execute(
+            "ALTER TABLE posts ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(content, '')), 'B')) STORED"
+        )
+        op.execute(
+            "CREATE INDEX ix_posts_search_vector ON posts USING GIN (search_vector)"
+        )
+        return
+
+    op.execute(
+        "CREATE VIRTUAL TABLE posts_fts USING fts5("
+        "title, content, content='posts', content_rowid='id', "
+        "tokenize='porter unicode61')"
+    )
+    op.execute(
+        "CREATE TRIGGER posts_fts_ai AFTER INSERT ON posts BEGIN "
+        "INSERT INTO posts_fts(rowid, title, content) "
+        "VALUES (new.id, new.title, new.content); END"
+    )
+    op.execute(
+        "CREATE TRIGGER posts_fts_ad AFTER DELETE ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, title, content) "
+        "VALUES ('delete', old.id, old.title, old.content); END"
+    )
+    op.execute(
+        "CREATE TRIGGER posts_fts_au AFTER UPDATE OF title, content ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, title, content) "
+        "VALUES ('delete', old.id, old.title, old.content); "
+        "INSERT INTO posts_fts(rowid, title, content) "
+        "VALUES (new.id, new.title, new.content); END"
+    )
+    # Index the posts that already exist.
+    op.execute("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_posts_search_vector", table_name="posts")
+        op.drop_column("posts", "search_vector")
+        return
+
+    op.execute("DROP TRIGGER posts_fts_au")
+    op.execute("DROP TRIGGER posts_fts_ad")
+    op.execute("DROP TRIGGER posts_fts_ai")
+    op.execute("DROP TABLE posts_fts")
@@ -0,0 +1,32 @@
+"""user token version
+
+Revision ID: a7c3e9f1b2d4
+Revises: d5e7a1b3c9f2
+Create Date: 2026-10-18 18:10:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e9f1b2d4"
+down_revision: Union[str, Sequence[str], None] = "d5e7a1b3c9f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("token_version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "token_version")
@@ -0,0 +1,41 @@
+"""post rendered content
+
+Revision ID: c2f8a4d6e0b1
+Revises: a7c3e9f1b2d4
+Create Date: 2026-10-18 19:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c2f8a4d6e0b1"
+down_revision: Union[str, Sequence[str], None] = "a7c3e9f1b2d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    ("content_html", sa.Text()),
+    ("excerpt", sa.Text()),
+    ("word_count", sa.Integer()),
+    ("reading_time", sa.Integer()),
+    ("render_version", sa.Integer()),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing posts stay unrendered (NULL) until the application renders
+    # them in the background.
+    for name, type_ in COLUMNS:
+        op.add_column("posts", sa.Column(name, type_, nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _ in reversed(COLUMNS):
+        op.drop_column("posts", name)
@@ -0,0 +1,52 @@
+"""post feed indexes
+
+Revision ID: d5e7a1b3c9f2
+Revises: 8c41f0d2a9e3
+Create Date: 2026-10-18 17:05:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e7a1b3c9f2"
+down_revision: Union[str, Sequence[str], None] = "8c41f0d2a9e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite already sorts NULLs last on DESC and rejects NULLS LAST in indexes.
+    nulls = " NULLS LAST" if op.get_bind().dialect.name == "postgresql" else ""
+    op.create_index(
+        "ix_posts_status_published_at",
+        "posts",
+        ["status", sa.text(f"published_at DESC{nulls}"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_posts_category_status_published_at",
+        "posts",
+        [
+            "category_id",
+            "status",
+            sa.text(f"published_at DESC{nulls}"),
+            sa.text("id DESC"),
+        ],
+    )
+    op.create_index(
+        "ix_post_tags_tag_id_post_id",
+        "post_tags",
+        ["tag_id", "post_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_post_tags_tag_id_post_id", table_name="post_tags")
+    op.drop_index("ix_posts_category_status_published_at", table_name="posts")
+    op.drop_index("ix_posts_status_published_at", table_name="posts")
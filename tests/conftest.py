@@ -0,0 +1,100 @@
+"""
+Tests run against a throwaway SQLite database.
+
+Settings are read when the application modules are imported, so the
+environment is set up here, before any of them is.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+_DATABASE_DIR = tempfile.mkdtemp(prefix="blog-tests-")
+
+os.environ.update(
+    {
+        "DATABASE_DRIVER": "sqlite",
+        "DATABASE_ASYNC_DRIVER": "sqlite+aiosqlite",
+        "DATABASE_NAME": os.path.join(_DATABASE_DIR, "blog.db"),
+        "CACHE_URL": "memory://",
+        "PASSWORD_BCRYPT_ROUNDS": "4",
+        "MARKDOWN_REBUILD_ON_STARTUP": "false",
+        "MARKDOWN_RENDER_WORKERS": "0",
+    }
+)
+
+from collections.abc import Iterator  # noqa: E402
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.infrastructure.auth import PasswordService  # noqa: E402
+from app.infrastructure.cache import shared  # noqa: E402
+from app.infrastructure.database import Base  # noqa: E402
+from app.infrastructure.database import engine  # noqa: E402
+from app.infrastructure.database import SessionLocal  # noqa: E402
+from app.infrastructure.database.models import User  # noqa: E402
+from app.infrastructure.ratelimit import rate_limiter  # noqa: E402
+
+USERNAME = "writer"
+PASSWORD = "correct horse battery staple"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def schema() -> Iterator[None]:
+    Base.metadata.create_all(engine)
+    yield
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clean() -> Iterator[None]:
+    """Every test starts from empty tables and empty caches."""
+    yield
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+    shared.backend.entries.clear()
+    rate_limiter.local.buckets.clear()
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    with SessionLocal() as db:
+        yield db
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    from app.fast_api import create_app
+
+    with TestClient(create_app()) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def user(session: Session) -> User:
+    user = User(
+        username=USERNAME,
+        hashed_password=PasswordService.hash_password(PASSWORD),
+    )
+    session.add(user)
+    session.commit()
+    return user
+
+
+@pytest.fixture
+def tokens(client: TestClient, user: User) -> dict[str, str]:
+    response = client.post(
+        "/api/auth/login", json={"username": USERNAME, "password": PASSWORD}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture
+def auth_headers(tokens: dict[str, str]) -> dict[str, str]:
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
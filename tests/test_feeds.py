@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import json
+from xml.etree import ElementTree
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.application.services.post import ImportPosts
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.parametrize("path", ["/feed.xml", "/atom.xml"])
+def test_feeds_drop_characters_xml_forbids(
+    client: TestClient, session: Session, path: str
+) -> None:
+    post = {
+        "title": "Bell\x07 & <tag>",
+        "content": "Control\x01 characters\x1f survive\x0b nowhere",
+        "status": "published",
+        "published_at": "2026-01-01T00:00:00",
+    }
+    report = ImportPosts(SqlAlchemyUnitOfWork(session)).execute([json.dumps(post)])
+    assert report.inserted == 1
+
+    response = client.get(path)
+
+    assert response.status_code == 200
+    document = ElementTree.fromstring(response.content)
+    titles = [e.text for e in document.iter() if e.tag.endswith("title")]
+    assert "Bell & <tag>" in titles
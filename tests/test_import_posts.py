@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.application.services.post import ImportPosts
+from app.application.services.post import ListPosts
+from app.infrastructure.repositories.sqlalchemy.post import SqlAlchemyPostRepository
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
+from app.presentation.api.routes.post import MAX_IMPORT_LINE_BYTES
+
+pytestmark = pytest.mark.integration
+
+
+def row(**fields: object) -> str:
+    return json.dumps({"title": "A post", "content": "Body", **fields})
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "not json",
+        "[]",
+        row(title=""),
+        row(status="archived"),
+        row(tags="python"),
+        row(tags=[None]),
+        row(tags=[1, 2]),
+        row(tags=[{}]),
+        row(tags=[" "]),
+        row(category=3),
+        row(slug=["a"]),
+    ],
+)
+def test_bad_rows_are_reported_and_the_batch_goes_on(
+    session: Session, line: str
+) -> None:
+    lines = [row(title="Before", tags=["python"]), line, row(title="After")]
+
+    report = ImportPosts(SqlAlchemyUnitOfWork(session)).execute(lines)
+
+    assert report.inserted == 2
+    assert [error.line for error in report.errors] == [2]
+    posts = ListPosts(SqlAlchemyPostRepository(session)).execute().items
+    assert sorted(p.title for p in posts) == ["After", "Before"]
+    assert {t.slug for p in posts for t in p.tags} == {"python"}
+
+
+def test_lines_split_across_chunks_are_joined(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    body = "\n".join(row(title=f"Post {i}") for i in range(3)).encode()
+    chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+
+    response = client.post("/api/post/bulk", content=iter(chunks), headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 3, "errors": []}
+
+
+def test_overlong_lines_are_refused(
+    client: TestClient, auth_headers: dict[str, str]
+) -> None:
+    body = row(content="x" * MAX_IMPORT_LINE_BYTES).encode()
+
+    response = client.post("/api/post/bulk", content=body, headers=auth_headers)
+
+    assert response.status_code == 413
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from passlib.hash import hex_sha256
+from sqlalchemy.orm import Session
+
+from app.infrastructure.auth.passwords import password_hasher
+from app.infrastructure.database import async_engine
+from app.infrastructure.database.models import User
+from tests.conftest import PASSWORD
+from tests.conftest import USERNAME
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.parametrize("password", [PASSWORD, "wrong"])
+def test_no_connection_is_held_while_the_password_is_verified(
+    client: TestClient, user: User, monkeypatch: pytest.MonkeyPatch, password: str
+) -> None:
+    verify = password_hasher.verify_and_update_async
+    checked_out: list[int] = []
+
+    async def verify_and_update_async(
+        password: str, hashed: str | None
+    ) -> tuple[bool, str | None]:
+        checked_out.append(async_engine.pool.checkedout())
+        return await verify(password, hashed)
+
+    monkeypatch.setattr(
+        password_hasher, "verify_and_update_async", verify_and_update_async
+    )
+    response = client.post(
+        "/api/auth/login", json={"username": USERNAME, "password": password}
+    )
+
+    assert response.status_code == (200 if password == PASSWORD else 401)
+    assert checked_out == [0]
+
+
+def test_outdated_hash_is_replaced_on_login(
+    client: TestClient, session: Session
+) -> None:
+    session.add(User(username=USERNAME, hashed_password=hex_sha256.hash(PASSWORD)))
+    session.commit()
+
+    response = client.post(
+        "/api/auth/login", json={"username": USERNAME, "password": PASSWORD}
+    )
+
+    assert response.status_code == 200
+    session.expire_all()
+    user = session.query(User).filter_by(username=USERNAME).one()
+    assert user.hashed_password.startswith("$2b$")
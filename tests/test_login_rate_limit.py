@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.exceptions import OverloadedError
+from app.core.exceptions import RateLimitError
+from app.infrastructure.database import async_engine
+from app.infrastructure.database.models import User
+from app.infrastructure.ratelimit import login_guard
+from app.infrastructure.ratelimit import LoginGuard
+from app.infrastructure.ratelimit import RateLimiter
+from app.infrastructure.ratelimit.buckets import Limit
+from app.infrastructure.ratelimit.buckets import MemoryBucketStore
+
+pytestmark = pytest.mark.integration
+
+# Slow enough that no token comes back while a test runs.
+SLOW = Limit(rate=1 / 3600, burst=3)
+
+
+def test_bucket_allows_a_burst_then_asks_to_wait() -> None:
+    store = MemoryBucketStore(max_entries=100)
+    assert [store.take([("a", SLOW)]) for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    wait = store.take([("a", SLOW)])
+    assert 0 < wait <= 3600
+    # Other keys have buckets of their own.
+    assert store.take([("b", SLOW)]) == 0.0
+
+
+def test_bucket_takes_from_all_or_none() -> None:
+    store = MemoryBucketStore(max_entries=100)
+    for _ in range(3):
+        store.take([("empty", SLOW)])
+
+    assert store.take([("full", SLOW), ("empty", SLOW)]) > 0
+    # "full" kept its tokens: the attempt was refused as a whole.
+    assert [store.take([("full", SLOW)]) for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_guard_sheds_load_past_its_in_flight_limit() -> None:
+    guard = LoginGuard(
+        RateLimiter(MemoryBucketStore(max_entries=100)),
+        per_client=SLOW,
+        per_username=SLOW,
+        max_in_flight=0,
+    )
+
+    async def attempt() -> None:
+        async with guard.admit("10.0.0.1", "someone"):
+            pass
+
+    with pytest.raises(OverloadedError):
+        asyncio.run(attempt())
+
+
+def test_guard_refuses_past_the_username_burst() -> None:
+    guard = LoginGuard(
+        RateLimiter(MemoryBucketStore(max_entries=100)),
+        per_client=Limit(rate=1, burst=100),
+        per_username=SLOW,
+        max_in_flight=10,
+    )
+
+    async def attempt(client: str) -> None:
+        async with guard.admit(client, "Someone"):
+            pass
+
+    for i in range(3):
+        asyncio.run(attempt(f"10.0.0.{i}"))
+    # Usernames are counted case-insensitively, from any address.
+    with pytest.raises(RateLimitError) as refused:
+        asyncio.run(attempt("10.0.0.99"))
+    assert int(refused.value.headers["Retry-After"]) > 0
+
+
+def test_login_is_refused_with_429_before_touching_the_database(
+    client: TestClient, user: User
+) -> None:
+    credentials = {"username": user.username, "password": "wrong"}
+    burst = login_guard.per_username.burst
+    for _ in range(burst):
+        assert client.post("/api/auth/login", json=credentials).status_code == 401
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = client.post("/api/auth/login", json=credentials)
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) > 0
+    assert response.json()["error"] == "RATE_LIMITED"
+    assert statements == []
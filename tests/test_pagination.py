@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.application.services.post import ImportPosts
+from app.application.services.post import ListPosts
+from app.core.exceptions import InvalidCursorError
+from app.domain.models.post import PostModel
+from app.infrastructure.database.models import Tag
+from app.infrastructure.repositories.sqlalchemy.post import SqlAlchemyPostRepository
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
+
+pytestmark = pytest.mark.integration
+
+# Ties on published_at and drafts (no published_at) are where a cursor on
+# published_at alone would skip or repeat posts.
+PUBLISHED_AT = [
+    "2026-01-03T10:00:00",
+    "2026-01-01T10:00:00",
+    "2026-01-02T10:00:00",
+    "2026-01-02T10:00:00",
+    None,
+    "2026-01-02T10:00:00",
+    None,
+    "2026-01-04T10:00:00",
+]
+
+
+@pytest.fixture
+def posts(session: Session) -> list[PostModel]:
+    lines = [
+        json.dumps(
+            {
+                "title": f"Post {i}",
+                "content": "...",
+                "status": "published" if published_at else "draft",
+                "published_at": published_at,
+            }
+        )
+        for i, published_at in enumerate(PUBLISHED_AT)
+    ]
+    report = ImportPosts(SqlAlchemyUnitOfWork(session)).execute(lines)
+    assert report.inserted == len(PUBLISHED_AT)
+    session.expunge_all()
+    everything = ListPosts(SqlAlchemyPostRepository(session)).execute(limit=100)
+    return everything.items
+
+
+def expected_order(posts: list[PostModel]) -> list[int]:
+    published = sorted(
+        (p for p in posts if p.published_at),
+        key=lambda p: (p.published_at, p.id),
+        reverse=True,
+    )
+    drafts = sorted((p for p in posts if not p.published_at), key=lambda p: -p.id)
+    return [p.id for p in published + drafts]
+
+
+def test_single_page_is_newest_first(posts: list[PostModel]) -> None:
+    assert [p.id for p in posts] == expected_order(posts)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 5])
+def test_next_cursors_walk_every_post_once(
+    session: Session, posts: list[PostModel], limit: int
+) -> None:
+    service = ListPosts(SqlAlchemyPostRepository(session))
+    seen: list[int] = []
+    page = service.execute(limit=limit)
+    assert page.prev_cursor is None
+    while True:
+        assert len(page.items) <= limit
+        seen.extend(p.id for p in page.items)
+        if page.next_cursor is None:
+            break
+        page = service.execute(limit=limit, cursor=page.next_cursor)
+
+    assert seen == expected_order(posts)
+
+
+def test_prev_cursor_returns_the_previous_page(
+    session: Session, posts: list[PostModel]
+) -> None:
+    service = ListPosts(SqlAlchemyPostRepository(session))
+    first = service.execute(limit=3)
+    second = service.execute(limit=3, cursor=first.next_cursor)
+    third = service.execute(limit=3, cursor=second.next_cursor)
+
+    back = service.execute(limit=3, cursor=third.prev_cursor)
+    assert [p.id for p in back.items] == [p.id for p in second.items]
+    back = service.execute(limit=3, cursor=back.prev_cursor)
+    assert [p.id for p in back.items] == [p.id for p in first.items]
+    assert back.prev_cursor is None
+
+
+def test_tampered_cursor_is_rejected(session: Session, posts: list[PostModel]) -> None:
+    service = ListPosts(SqlAlchemyPostRepository(session))
+    with pytest.raises(InvalidCursorError):
+        service.execute(limit=3, cursor="not-a-cursor")
+
+
+def test_tag_listing_pages_through_the_api(
+    client: TestClient, session: Session, auth_headers: dict[str, str]
+) -> None:
+    session.add_all(Tag(name=f"Tag {i}", slug=f"tag-{i}") for i in range(5))
+    session.commit()
+
+    slugs: list[str] = []
+    params: dict[str, str | int] = {"limit": 2}
+    while True:
+        response = client.get("/api/tag/", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["limit"] == 2
+        slugs.extend(tag["slug"] for tag in body["items"])
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert slugs == [f"tag-{i}" for i in range(5)]
+
+    response = client.get(
+        "/api/tag/", params={"cursor": "not-a-cursor"}, headers=auth_headers
+    )
+    assert response.status_code == 400
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.application.services.post import CreatePost
+from app.application.services.post import DeletePost
+from app.application.services.post import GetPostById
+from app.application.services.post import GetPostBySlug
+from app.application.services.post import UpdatePost
+from app.domain.models.post import PostModel
+from app.domain.repositories.post import PostRepository
+from app.infrastructure.repositories.cached.post import cached_post_repository
+from app.infrastructure.repositories.cached.post import post_cache
+from app.infrastructure.repositories.sqlalchemy.post import SqlAlchemyPostRepository
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+def repo(session: Session) -> PostRepository:
+    return cached_post_repository(SqlAlchemyPostRepository(session))
+
+
+@pytest.fixture
+def post(session: Session) -> PostModel:
+    return CreatePost(SqlAlchemyUnitOfWork(session)).execute("First title", "Body")
+
+
+def test_repeated_reads_are_served_from_the_cache(
+    repo: PostRepository, post: PostModel
+) -> None:
+    before = post_cache.posts.stats()
+
+    assert GetPostById(repo).execute(post.id).title == "First title"
+    assert GetPostById(repo).execute(post.id).title == "First title"
+    assert GetPostBySlug(repo).execute(post.slug).id == post.id
+
+    after = post_cache.posts.stats()
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 2
+
+
+def test_update_drops_the_post_and_its_old_slug(
+    session: Session, repo: PostRepository, post: PostModel
+) -> None:
+    old_slug = post.slug
+    assert GetPostById(repo).execute(post.id) is not None
+    assert GetPostBySlug(repo).execute(old_slug) is not None
+
+    updated = UpdatePost(SqlAlchemyUnitOfWork(session)).execute(
+        post.id, "Second title", "New body"
+    )
+
+    assert updated.slug != old_slug
+    assert GetPostById(repo).execute(post.id).title == "Second title"
+    assert GetPostBySlug(repo).execute(old_slug) is None
+    by_slug = GetPostBySlug(repo).execute(updated.slug)
+    assert by_slug is not None and by_slug.content == "New body"
+
+
+def test_delete_drops_the_post(
+    session: Session, repo: PostRepository, post: PostModel
+) -> None:
+    assert GetPostById(repo).execute(post.id) is not None
+    assert GetPostBySlug(repo).execute(post.slug) is not None
+
+    DeletePost(SqlAlchemyUnitOfWork(session)).execute(post.id)
+
+    assert GetPostById(repo).execute(post.id) is None
+    assert GetPostBySlug(repo).execute(post.slug) is None
+
+
+def test_writes_through_the_cached_repository_drop_the_post(
+    session: Session, repo: PostRepository, post: PostModel
+) -> None:
+    cached = GetPostById(repo).execute(post.id)
+    cached.edit("Third title", "Edited")
+
+    repo.save(cached)
+    session.rollback()
+
+    # Rolled back: the cache must not keep the edit that never committed.
+    fresh = GetPostById(repo).execute(post.id)
+    assert fresh.title == "First title"
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.application.services.post import CreatePost
+from app.application.services.post import GetPostById
+from app.application.services.post import ListPosts
+from app.infrastructure.database import engine
+from app.infrastructure.database.models import Category
+from app.infrastructure.mappers.post import PostMapper
+from app.infrastructure.repositories.sqlalchemy.post import SqlAlchemyPostRepository
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
+
+pytestmark = pytest.mark.integration
+
+# The posts, then the tags of all of them; the category is joined.
+POST_PAGE_QUERIES = 2
+
+
+@contextmanager
+def count_queries() -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def create_posts(session: Session, count: int) -> None:
+    session.add(Category(name="Engineering", slug="engineering"))
+    session.commit()
+    create = CreatePost(SqlAlchemyUnitOfWork(session))
+    for i in range(count):
+        create.execute(
+            f"Post {i}",
+            f"Content of post {i}",
+            tags=[f"tag-{i}", "common"],
+            category="engineering",
+        )
+    session.expunge_all()
+
+
+@pytest.mark.parametrize("count", [3, 30])
+def test_post_page_loads_in_constant_queries(session: Session, count: int) -> None:
+    create_posts(session, count)
+
+    with count_queries() as statements:
+        page = ListPosts(SqlAlchemyPostRepository(session)).execute(limit=count)
+        dtos = [PostMapper.to_dto(post) for post in page.items]
+
+    assert len(dtos) == count
+    assert all(dto.category and dto.category.slug == "engineering" for dto in dtos)
+    assert all(len(dto.tags) == 2 for dto in dtos)
+    assert len(statements) == POST_PAGE_QUERIES, statements
+
+
+def test_post_by_id_loads_in_constant_queries(session: Session) -> None:
+    create_posts(session, 1)
+    post_id = ListPosts(SqlAlchemyPostRepository(session)).execute().items[0].id
+    session.expunge_all()
+
+    with count_queries() as statements:
+        post = GetPostById(SqlAlchemyPostRepository(session)).execute(post_id)
+        dto = PostMapper.to_dto(post)
+
+    assert dto.category is not None and len(dto.tags) == 2
+    assert len(statements) == POST_PAGE_QUERIES, statements
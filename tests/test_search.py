@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.application.services.post import CreatePost
+from app.infrastructure.uow.sqlalchemy_uow import SqlAlchemyUnitOfWork
+
+pytestmark = pytest.mark.integration
+
+
+def search(client: TestClient, headers: dict[str, str], q: str):
+    return client.get("/api/post/search", params={"q": q}, headers=headers)
+
+
+def test_snippets_escape_the_post_text(
+    client: TestClient, session: Session, auth_headers: dict[str, str]
+) -> None:
+    CreatePost(SqlAlchemyUnitOfWork(session)).execute(
+        "Unsafe", "findme <img src=x onerror=alert(1)> & <b>findme</b>"
+    )
+
+    response = search(client, auth_headers, "findme")
+
+    assert response.status_code == 200
+    [hit] = response.json()["items"]
+    assert hit["snippet"] == (
+        "<mark>findme</mark> &lt;img src=x onerror=alert(1)&gt; &amp; "
+        "&lt;b&gt;<mark>findme</mark>&lt;/b&gt;"
+    )
+
+
+@pytest.mark.parametrize("q", ["", " ", "\t\n"])
+def test_blank_queries_are_rejected(
+    client: TestClient, auth_headers: dict[str, str], q: str
+) -> None:
+    assert search(client, auth_headers, q).status_code == 422
+
+
+def test_query_syntax_is_matched_literally(
+    client: TestClient, session: Session, auth_headers: dict[str, str]
+) -> None:
+    CreatePost(SqlAlchemyUnitOfWork(session)).execute("Plain", "nothing special")
+
+    for q in ['"', "NOT", "a OR", "title:x*", "(("]:
+        assert search(client, auth_headers, q).status_code == 200
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database import engine
+from app.infrastructure.repositories.cached.token import FilteredRevokedTokenRepository
+from app.infrastructure.repositories.cached.token import RevocationFilter
+from app.infrastructure.repositories.sqlalchemy.token import (
+    SqlAlchemyRevokedTokenRepository,
+)
+
+pytestmark = pytest.mark.integration
+
+
+def expires_in(hours: int) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(hours=hours)
+
+
+@pytest.fixture
+def revoked(session: Session) -> SqlAlchemyRevokedTokenRepository:
+    repo = SqlAlchemyRevokedTokenRepository(session)
+    repo.revoke("revoked-1", expires_in(1))
+    repo.revoke("revoked-2", expires_in(1))
+    session.commit()
+    return repo
+
+
+def test_filter_reports_everything_until_it_is_loaded(
+    revoked: SqlAlchemyRevokedTokenRepository,
+) -> None:
+    revocations = RevocationFilter(capacity=100, error_rate=0.001)
+    assert revocations.might_be_revoked("anything")
+
+    assert revocations.rebuild(revoked) == 2
+    assert revocations.might_be_revoked("revoked-1")
+    assert revocations.might_be_revoked("revoked-2")
+    assert not revocations.might_be_revoked("never-revoked")
+
+
+def test_unrevoked_tokens_are_checked_without_the_database(
+    revoked: SqlAlchemyRevokedTokenRepository,
+) -> None:
+    revocations = RevocationFilter(capacity=100, error_rate=0.001)
+    revocations.rebuild(revoked)
+    repo = FilteredRevokedTokenRepository(revoked, revocations)
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert not any(repo.is_revoked(f"token-{i}") for i in range(100))
+        assert statements == []
+        assert repo.is_revoked("revoked-1")
+        assert len(statements) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_sync_adds_revocations_made_elsewhere(
+    session: Session, revoked: SqlAlchemyRevokedTokenRepository
+) -> None:
+    revocations = RevocationFilter(capacity=100, error_rate=0.001)
+    revocations.rebuild(revoked)
+    since = datetime.now(timezone.utc) - timedelta(minutes=1)
+    revoked.revoke("revoked-3", expires_in(1))
+    session.commit()
+
+    assert revocations.sync(revoked, since) >= 1
+    assert revocations.might_be_revoked("revoked-3")
+
+
+def test_expired_revocations_are_dropped_on_rebuild(
+    session: Session, revoked: SqlAlchemyRevokedTokenRepository
+) -> None:
+    revoked.revoke("expired", expires_in(-1))
+    session.commit()
+    assert revoked.purge_expired() == 1
+    session.commit()
+
+    revocations = RevocationFilter(capacity=100, error_rate=0.001)
+    assert revocations.rebuild(revoked) == 2
+    assert not revocations.might_be_revoked("expired")
+
+
+def test_refresh_rotates_and_refuses_replays(
+    client: TestClient, tokens: dict[str, str]
+) -> None:
+    response = client.post(
+        "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == 200
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+
+    replay = client.post(
+        "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert replay.status_code == 401
+
+    response = client.post(
+        "/api/auth/refresh", json={"refresh_token": rotated["refresh_token"]}
+    )
+    assert response.status_code == 200
+
+
+def test_logout_revokes_both_tokens(
+    client: TestClient, tokens: dict[str, str], auth_headers: dict[str, str]
+) -> None:
+    assert client.get("/api/tag/", headers=auth_headers).status_code == 200
+
+    response = client.post(
+        "/api/auth/logout",
+        json={"refresh_token": tokens["refresh_token"]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 204
+
+    assert client.get("/api/tag/", headers=auth_headers).status_code == 401
+    response = client.post(
+        "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == 401